@@ -0,0 +1,49 @@
+"""add_customer_search_indexes
+
+Revision ID: 3b9e2c7d41a0
+Revises: dc95bdab1799
+Create Date: 2026-10-19 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e2c7d41a0'
+down_revision: Union[str, None] = 'dc95bdab1799'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Build concurrently so large customer tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_customer_name_trgm "
+            "ON customers USING gin (name gin_trgm_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_customer_email_trgm "
+            "ON customers USING gin (email gin_trgm_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_customer_phone_digits "
+            "ON customers (regexp_replace(phone, '[^0-9]', '', 'g') text_pattern_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_customer_email_lower "
+            "ON customers (lower(email))"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_customer_email_lower")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_customer_phone_digits")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_customer_email_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_customer_name_trgm")
@@ -0,0 +1,36 @@
+"""add_hourly_sales
+
+Revision ID: 5a9d3c1e7b24
+Revises: e41b7f9a0c63
+Create Date: 2026-10-19 14:48:12.093518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9d3c1e7b24'
+down_revision: Union[str, None] = 'e41b7f9a0c63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'hourly_sales',
+        sa.Column('order_date', sa.Date(), nullable=False),
+        sa.Column('hour', sa.SmallInteger(), nullable=False),
+        sa.Column('order_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('revenue', sa.Numeric(precision=14, scale=2), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.CheckConstraint('hour BETWEEN 0 AND 23', name='check_hourly_sales_hour'),
+        sa.PrimaryKeyConstraint('order_date', 'hour'),
+    )
+    # Populate from existing orders: python scripts/backfill_daily_sales.py
+
+
+def downgrade() -> None:
+    op.drop_table('hourly_sales')
@@ -0,0 +1,43 @@
+"""add_customer_stats
+
+Revision ID: 7d4f1a9c2e58
+Revises: 3b9e2c7d41a0
+Create Date: 2026-10-19 10:31:07.218954
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d4f1a9c2e58'
+down_revision: Union[str, None] = '3b9e2c7d41a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'customer_stats',
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('visit_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('completed_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('lifetime_spend', sa.Numeric(precision=12, scale=2), server_default='0', nullable=False),
+        sa.Column('last_visit_date', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.customer_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('customer_id'),
+    )
+    op.create_index('idx_customer_stats_lifetime_spend', 'customer_stats', ['lifetime_spend'], unique=False)
+    op.create_index('idx_customer_stats_visit_count', 'customer_stats', ['visit_count'], unique=False)
+    op.create_index('idx_customer_stats_last_visit_date', 'customer_stats', ['last_visit_date'], unique=False)
+    # Populate from existing orders: python scripts/rebuild_customer_stats.py
+
+
+def downgrade() -> None:
+    op.drop_index('idx_customer_stats_last_visit_date', table_name='customer_stats')
+    op.drop_index('idx_customer_stats_visit_count', table_name='customer_stats')
+    op.drop_index('idx_customer_stats_lifetime_spend', table_name='customer_stats')
+    op.drop_table('customer_stats')
@@ -0,0 +1,52 @@
+"""add_item_sales_daily_view
+
+Revision ID: 9f2c4b8d1a76
+Revises: 5a9d3c1e7b24
+Create Date: 2026-10-19 15:20:37.458102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f2c4b8d1a76'
+down_revision: Union[str, None] = '5a9d3c1e7b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW item_sales_daily AS
+        SELECT
+            o.order_date,
+            od.item_id,
+            COUNT(*) AS order_count,
+            SUM(od.quantity) AS quantity,
+            SUM(od.subtotal) AS revenue
+        FROM order_details od
+        JOIN orders o ON o.order_id = od.order_id
+        WHERE o.is_deleted = FALSE
+          AND od.is_deleted = FALSE
+          AND o.status <> 'cancelled'
+        GROUP BY o.order_date, od.item_id
+        """
+    )
+    # REFRESH ... CONCURRENTLY requires a unique index on the view
+    op.create_index('idx_item_sales_daily_date_item', 'item_sales_daily', ['order_date', 'item_id'], unique=True)
+    op.create_table(
+        'report_refreshes',
+        sa.Column('view_name', sa.String(length=63), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('view_name'),
+    )
+    op.execute("INSERT INTO report_refreshes (view_name, refreshed_at) VALUES ('item_sales_daily', now())")
+
+
+def downgrade() -> None:
+    op.drop_table('report_refreshes')
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS item_sales_daily")
@@ -0,0 +1,54 @@
+"""add_order_events
+
+Revision ID: b7e3d5a2c918
+Revises: 9f2c4b8d1a76
+Create Date: 2026-10-19 16:05:54.327741
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3d5a2c918'
+down_revision: Union[str, None] = '9f2c4b8d1a76'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint('check_order_status', 'orders', type_='check')
+    op.create_check_constraint(
+        'check_order_status',
+        'orders',
+        "status IN ('pending', 'in_progress', 'completed', 'cancelled')",
+    )
+    op.create_table(
+        'order_events',
+        sa.Column('event_id', sa.BigInteger(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('from_status', sa.String(length=20), nullable=True),
+        sa.Column('to_status', sa.String(length=20), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=True),
+        sa.Column('occurred_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['order_id'], ['orders.order_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['employee_id'], ['employees.emp_id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('event_id'),
+    )
+    op.create_index('idx_order_events_order', 'order_events', ['order_id', 'occurred_at'], unique=False)
+    op.create_index('idx_order_events_occurred_at', 'order_events', ['occurred_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_order_events_occurred_at', table_name='order_events')
+    op.drop_index('idx_order_events_order', table_name='order_events')
+    op.drop_table('order_events')
+    op.execute("UPDATE orders SET status = 'pending' WHERE status = 'in_progress'")
+    op.drop_constraint('check_order_status', 'orders', type_='check')
+    op.create_check_constraint(
+        'check_order_status',
+        'orders',
+        "status IN ('pending', 'completed', 'cancelled')",
+    )
@@ -0,0 +1,41 @@
+"""add_customer_segments
+
+Revision ID: c2a8e6f03b17
+Revises: 7d4f1a9c2e58
+Create Date: 2026-10-19 11:02:45.770312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2a8e6f03b17'
+down_revision: Union[str, None] = '7d4f1a9c2e58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'customer_segments',
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('recency_days', sa.Integer(), nullable=False),
+        sa.Column('frequency', sa.Integer(), nullable=False),
+        sa.Column('monetary', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('r_score', sa.SmallInteger(), nullable=False),
+        sa.Column('f_score', sa.SmallInteger(), nullable=False),
+        sa.Column('m_score', sa.SmallInteger(), nullable=False),
+        sa.Column('segment', sa.String(length=30), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.customer_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('customer_id'),
+    )
+    op.create_index('idx_customer_segments_segment', 'customer_segments', ['segment'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_customer_segments_segment', table_name='customer_segments')
+    op.drop_table('customer_segments')
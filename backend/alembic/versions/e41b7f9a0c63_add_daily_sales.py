@@ -0,0 +1,37 @@
+"""add_daily_sales
+
+Revision ID: e41b7f9a0c63
+Revises: c2a8e6f03b17
+Create Date: 2026-10-19 14:02:45.611820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41b7f9a0c63'
+down_revision: Union[str, None] = 'c2a8e6f03b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'daily_sales',
+        sa.Column('order_date', sa.Date(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('payment_method', sa.String(length=50), nullable=False),
+        sa.Column('order_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('total_amount', sa.Numeric(precision=14, scale=2), server_default='0', nullable=False),
+        sa.Column('revenue', sa.Numeric(precision=14, scale=2), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('order_date', 'status', 'payment_method'),
+    )
+    # Populate from existing orders: python scripts/backfill_daily_sales.py
+
+
+def downgrade() -> None:
+    op.drop_table('daily_sales')
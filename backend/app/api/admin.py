@@ -0,0 +1,55 @@
+"""
+Administrative / diagnostics endpoints
+"""
+
+from fastapi import APIRouter, Depends, Query
+from typing import Dict, List, Optional
+from app.api.auth import require_role
+from app.core import pool_metrics, replica, report_cache, slow_queries
+from app.core.cache import cache_stats
+from app.core.database import replica_engine
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_role(["Manager"]))],
+)
+
+
+@router.get("/cache", response_model=Dict)
+def get_cache_stats():
+    """Hit/miss statistics of this worker's in-process caches"""
+    return cache_stats()
+
+
+@router.get("/reports/cache", response_model=Dict)
+def get_report_cache_stats():
+    """Report result cache: hits/misses and cached entries per endpoint, by tier"""
+    return report_cache.stats()
+
+
+@router.get("/db/pool", response_model=Dict)
+def get_db_pool_stats():
+    """Connection pools of this worker: live usage, overflow and checkout wait times"""
+    return pool_metrics.snapshot()
+
+
+@router.get("/db/replica", response_model=Dict)
+def get_replica_status():
+    """Read-replica routing state of this worker: lag, health, read-your-writes window"""
+    return {"configured": replica_engine is not None, **replica.status()}
+
+
+@router.get("/slow-queries", response_model=List[Dict])
+def get_slow_queries(
+    limit: int = Query(50, ge=1, le=500),
+    route: Optional[str] = Query(None, description="Route template, e.g. /api/v1/orders/status/{status}"),
+):
+    """Slow statements recorded by this worker, newest first, with sampled EXPLAIN plans"""
+    return slow_queries.entries(limit=limit, route=route)
+
+
+@router.delete("/slow-queries", response_model=Dict)
+def clear_slow_queries():
+    """Empty this worker's slow-query log"""
+    return {"cleared": slow_queries.clear()}
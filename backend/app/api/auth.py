@@ -4,6 +4,7 @@ Authentication endpoints
 
 from fastapi import APIRouter, Depends, HTTPException, status, Header
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from typing import Optional
 import logging
@@ -24,6 +25,9 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
 
+# Runs on every authenticated request; built once
+_EMPLOYEE_BY_ID = select(Employee).where(Employee.emp_id == bindparam("emp_id"))
+
 
 def get_current_user(
     token: Optional[str] = Depends(oauth2_scheme),
@@ -81,7 +85,7 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    employee = db.query(Employee).filter(Employee.emp_id == emp_id).first()
+    employee = db.scalars(_EMPLOYEE_BY_ID, {"emp_id": emp_id}).first()
     if employee is None:
         logger.warning(f"Employee not found for emp_id: {emp_id}")
         raise HTTPException(
@@ -93,6 +97,26 @@ def get_current_user(
     return employee
 
 
+def get_optional_user(
+    token: Optional[str] = Depends(oauth2_scheme),
+    authorization: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+) -> Optional[Employee]:
+    """Get current user from a valid token, None for anonymous requests
+
+    An invalid or expired token also yields None: the client attaches its
+    stored token to every request, and these routes work without one.
+    """
+    if not token and not authorization:
+        return None
+    try:
+        return get_current_user(token, authorization, db)
+    except HTTPException as e:
+        if e.status_code != status.HTTP_401_UNAUTHORIZED:
+            raise
+        return None
+
+
 def require_role(allowed_roles: list[str]):
     """Dependency to check if user has required role"""
 
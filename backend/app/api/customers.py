@@ -1,9 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.core.database import get_db
+from datetime import date
+import codecs
+import tempfile
+from app.core.database import get_db, get_read_db
 from app.repositories.customer_repository import CustomerRepository
-from app.schemas.customer import CustomerCreate, CustomerUpdate, CustomerResponse
+from app.repositories.customer_stats_repository import CustomerStatsRepository
+from app.jobs.customer_import import import_customers
+from app.repositories.order_repository import OrderRepository
+from app.schemas.customer import (
+    CustomerCreate,
+    CustomerUpdate,
+    CustomerResponse,
+    CustomerStatsResponse,
+    CustomerListResponse,
+)
+from app.schemas.order import OrderPageResponse
 
 router = APIRouter(prefix="/customers", tags=["customers"], redirect_slashes=False)
 
@@ -16,16 +30,73 @@ def create_customer(customer: CustomerCreate, db: Session = Depends(get_db)):
     return repo.create(customer)
 
 
-@router.get("", response_model=List[CustomerResponse])
-@router.get("/", response_model=List[CustomerResponse])
-def get_customers(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all customers"""
+@router.post("/import")
+def import_customers_csv(
+    file: UploadFile = File(..., description="CSV with header name,phone,email[,loyalty_points]"),
+    db: Session = Depends(get_db),
+):
+    """Bulk import customers from CSV; returns a per-row error report as CSV
+
+    Counts are returned in X-Import-Inserted / X-Import-Duplicates /
+    X-Import-Invalid headers. X-Import-Complete is false when the file stopped
+    decoding part way; the rows before that point are imported.
+    """
+    lines = codecs.iterdecode(file.file, "utf-8-sig")
+    # Report spills to disk past 1 MB so memory stays flat for large files
+    report = tempfile.SpooledTemporaryFile(max_size=1024 * 1024, mode="w+", newline="")
+    try:
+        summary = import_customers(db, lines, report)
+    except UnicodeDecodeError:
+        report.close()
+        raise HTTPException(status_code=400, detail="File must be UTF-8 encoded CSV")
+    report.seek(0)
+
+    def stream_report():
+        try:
+            yield from report
+        finally:
+            report.close()
+
+    return StreamingResponse(
+        stream_report(),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": 'attachment; filename="customer_import_errors.csv"',
+            "X-Import-Inserted": str(summary["inserted"]),
+            "X-Import-Duplicates": str(summary["duplicates"]),
+            "X-Import-Invalid": str(summary["invalid"]),
+            "X-Import-Complete": str(summary["complete"]).lower(),
+        },
+    )
+
+
+@router.get("", response_model=List[CustomerListResponse])
+@router.get("/", response_model=List[CustomerListResponse])
+def get_customers(
+    skip: int = 0,
+    limit: int = 100,
+    sort_by: Optional[str] = Query(
+        None,
+        pattern="^(name|loyalty_points|created_at|visit_count|lifetime_spend|last_visit_date)$",
+        description="Column to sort by",
+    ),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    segment: Optional[str] = Query(None, description="RFM segment, e.g. Champions"),
+    db: Session = Depends(get_read_db),
+):
+    """Get all customers with lifetime statistics and RFM segment"""
     repo = CustomerRepository(db)
-    return repo.get_all(skip=skip, limit=limit)
+    return repo.get_all(
+        skip=skip,
+        limit=limit,
+        sort_by=sort_by,
+        descending=order == "desc",
+        segment=segment,
+    )
 
 
 @router.get("/{customer_id}", response_model=CustomerResponse)
-def get_customer(customer_id: int, db: Session = Depends(get_db)):
+def get_customer(customer_id: int, db: Session = Depends(get_read_db)):
     """Get customer by ID"""
     repo = CustomerRepository(db)
     customer = repo.get(customer_id)
@@ -34,14 +105,53 @@ def get_customer(customer_id: int, db: Session = Depends(get_db)):
     return customer
 
 
+@router.get("/{customer_id}/stats", response_model=CustomerStatsResponse)
+def get_customer_stats(customer_id: int, db: Session = Depends(get_read_db)):
+    """Get customer visit count, lifetime spend, average ticket and last visit"""
+    if not CustomerRepository(db).get(customer_id):
+        raise HTTPException(status_code=404, detail="Customer not found")
+    stats = CustomerStatsRepository(db).get(customer_id)
+    return stats or CustomerStatsResponse(customer_id=customer_id)
+
+
+@router.get("/{customer_id}/orders", response_model=OrderPageResponse)
+def get_customer_orders(
+    customer_id: int,
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (order_date.order_id)"
+    ),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+):
+    """Get customer order history, newest first, with keyset pagination"""
+    if not CustomerRepository(db).get(customer_id):
+        raise HTTPException(status_code=404, detail="Customer not found")
+
+    before = None
+    if cursor:
+        try:
+            cursor_date, cursor_id = cursor.split(".", 1)
+            before = (date.fromisoformat(cursor_date), int(cursor_id))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    orders, next_before = OrderRepository(db).get_by_customer_keyset(
+        customer_id, before=before, limit=limit
+    )
+    next_cursor = None
+    if next_before:
+        next_cursor = f"{next_before[0].isoformat()}.{next_before[1]}"
+    return OrderPageResponse(items=orders, next_cursor=next_cursor)
+
+
 @router.get("/search/query", response_model=List[CustomerResponse])
 def search_customers(
-    q: str = Query(..., description="Search query"),
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    q: str = Query(..., min_length=1, description="Search query"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
 ):
-    """Search customers by name, phone, or email"""
+    """Search customers by name, phone, or email, best matches first"""
     repo = CustomerRepository(db)
     return repo.search(q, skip=skip, limit=limit)
 
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from datetime import date
+from app.api.auth import require_role
+from app.core import replica
+from app.core.database import ReplicaSessionLocal, SessionLocal
+from app.jobs.order_export import FORMATS, encode, gzip_chunks, iter_orders
+
+router = APIRouter(
+    prefix="/exports",
+    tags=["exports"],
+    dependencies=[Depends(require_role(["Manager"]))],
+)
+
+
+@router.get("/orders")
+def export_orders(
+    request: Request,
+    start_date: date = Query(..., alias="from"),
+    end_date: date = Query(..., alias="to"),
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    status: Optional[str] = Query(None, pattern="^(pending|in_progress|completed|cancelled)$"),
+    gzip: bool = Query(False, description="Compress the file (.gz)"),
+):
+    """Stream orders with their items and payments as CSV or NDJSON"""
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+
+    session_factory = SessionLocal
+    if ReplicaSessionLocal is not None and replica.use_replica(request):
+        session_factory = ReplicaSessionLocal
+
+    def stream():
+        # The session must outlive the endpoint, so the generator owns it
+        db = session_factory()
+        try:
+            chunks = encode(iter_orders(db, start_date, end_date, status), format)
+            yield from gzip_chunks(chunks) if gzip else chunks
+        finally:
+            db.close()
+
+    filename = f"orders_{start_date}_{end_date}.{format}"
+    media_type = FORMATS[format]
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
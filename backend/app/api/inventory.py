@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List
 from decimal import Decimal
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.repositories.inventory_repository import InventoryRepository
 from app.schemas.inventory import InventoryCreate, InventoryUpdate, InventoryResponse
 
@@ -19,21 +19,21 @@ def create_inventory(inventory: InventoryCreate, db: Session = Depends(get_db)):
 
 @router.get("", response_model=List[InventoryResponse])
 @router.get("/", response_model=List[InventoryResponse])
-def get_inventory(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_inventory(skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db)):
     """Get all inventory records"""
     repo = InventoryRepository(db)
     return repo.get_all(skip=skip, limit=limit)
 
 
 @router.get("/low-stock", response_model=List[InventoryResponse])
-def get_low_stock(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_low_stock(skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db)):
     """Get inventory items with quantity below threshold"""
     repo = InventoryRepository(db)
     return repo.get_low_stock(skip=skip, limit=limit)
 
 
 @router.get("/{inventory_id}", response_model=InventoryResponse)
-def get_inventory_record(inventory_id: int, db: Session = Depends(get_db)):
+def get_inventory_record(inventory_id: int, db: Session = Depends(get_read_db)):
     """Get inventory record by ID"""
     repo = InventoryRepository(db)
     inventory = repo.get(inventory_id)
@@ -43,7 +43,7 @@ def get_inventory_record(inventory_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/ingredient/{ingredient_id}", response_model=InventoryResponse)
-def get_inventory_by_ingredient(ingredient_id: int, db: Session = Depends(get_db)):
+def get_inventory_by_ingredient(ingredient_id: int, db: Session = Depends(get_read_db)):
     """Get inventory record by ingredient ID"""
     repo = InventoryRepository(db)
     inventory = repo.get_by_ingredient(ingredient_id)
@@ -1,9 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.core.database import get_db
-from app.repositories.menu_item_repository import MenuItemRepository
-from app.schemas.menu_item import MenuItemCreate, MenuItemUpdate, MenuItemResponse
+from app.core.database import get_db, get_async_read_db
+from app.repositories.menu_item_repository import AsyncMenuItemRepository, MenuItemRepository
+from app.schemas.menu_item import (
+    MenuItemCreate,
+    MenuItemUpdate,
+    MenuItemResponse,
+    MenuCategoryResponse,
+)
 
 router = APIRouter(prefix="/menu-items", tags=["menu-items"])
 
@@ -18,36 +24,46 @@ def create_menu_item(menu_item: MenuItemCreate, db: Session = Depends(get_db)):
 
 @router.get("", response_model=List[MenuItemResponse])
 @router.get("/", response_model=List[MenuItemResponse])
-def get_menu_items(
+async def get_menu_items(
     skip: int = 0,
     limit: int = 100,
     available_only: bool = Query(False, description="Show only available items"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """Get all menu items"""
-    repo = MenuItemRepository(db)
+    repo = AsyncMenuItemRepository(db)
     if available_only:
-        return repo.get_available(skip=skip, limit=limit)
-    return repo.get_all(skip=skip, limit=limit)
+        return await repo.get_available(skip=skip, limit=limit)
+    return await repo.get_all(skip=skip, limit=limit)
+
+
+@router.get("/by-category", response_model=List[MenuCategoryResponse])
+async def get_menu_items_grouped_by_category(
+    available_only: bool = Query(True, description="Show only available items"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """Get menu items grouped by category with item counts"""
+    repo = AsyncMenuItemRepository(db)
+    return await repo.get_grouped_by_category(available_only=available_only)
 
 
 @router.get("/{item_id}", response_model=MenuItemResponse)
-def get_menu_item(item_id: int, db: Session = Depends(get_db)):
+async def get_menu_item(item_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """Get menu item by ID"""
-    repo = MenuItemRepository(db)
-    menu_item = repo.get(item_id)
+    repo = AsyncMenuItemRepository(db)
+    menu_item = await repo.get(item_id)
     if not menu_item:
         raise HTTPException(status_code=404, detail="Menu item not found")
     return menu_item
 
 
 @router.get("/category/{category}", response_model=List[MenuItemResponse])
-def get_menu_items_by_category(
-    category: str, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+async def get_menu_items_by_category(
+    category: str, skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get menu items by category"""
-    repo = MenuItemRepository(db)
-    return repo.get_by_category(category, skip=skip, limit=limit)
+    repo = AsyncMenuItemRepository(db)
+    return await repo.get_by_category(category, skip=skip, limit=limit)
 
 
 @router.put("/{item_id}", response_model=MenuItemResponse)
@@ -1,21 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import date
-from app.core.database import get_db
-from app.repositories.order_repository import OrderRepository
+from pydantic_core import to_json
+from app.api.auth import get_optional_user
+from app.core.database import get_db, get_async_read_db
+from app.models.employee import Employee
+from app.repositories.order_repository import AsyncOrderRepository, OrderRepository
 from app.schemas.order import OrderCreate, OrderUpdate, OrderResponse
 
 router = APIRouter(prefix="/orders", tags=["orders"], redirect_slashes=False)
 
 
+def _rows_response(rows) -> Response:
+    """JSON body for row mappings already shaped like List[OrderResponse]
+
+    Serialized by pydantic-core (datetimes, dates and Decimals as FastAPI's
+    response_model path would) without validating each row into a model.
+    """
+    return Response(content=to_json(rows), media_type="application/json")
+
+
 @router.post("", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
 @router.post("/", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
-def create_order(order: OrderCreate, db: Session = Depends(get_db)):
+def create_order(
+    order: OrderCreate,
+    db: Session = Depends(get_db),
+    current_user: Optional[Employee] = Depends(get_optional_user),
+):
     """Create a new order with order details and payment"""
     repo = OrderRepository(db)
     try:
-        return repo.create(order)
+        return repo.create(order, employee_id=current_user.emp_id if current_user else None)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -24,64 +41,69 @@ def create_order(order: OrderCreate, db: Session = Depends(get_db)):
 
 @router.get("", response_model=List[OrderResponse])
 @router.get("/", response_model=List[OrderResponse])
-def get_orders(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def get_orders(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_read_db)):
     """Get all orders"""
-    repo = OrderRepository(db)
-    return repo.get_all(skip=skip, limit=limit)
+    repo = AsyncOrderRepository(db)
+    return _rows_response(await repo.get_all(skip=skip, limit=limit))
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
-def get_order(order_id: int, db: Session = Depends(get_db)):
+async def get_order(order_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """Get order by ID"""
-    repo = OrderRepository(db)
-    order = repo.get(order_id)
+    repo = AsyncOrderRepository(db)
+    order = await repo.get(order_id)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     return order
 
 
 @router.get("/customer/{customer_id}", response_model=List[OrderResponse])
-def get_orders_by_customer(
+async def get_orders_by_customer(
     customer_id: int,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get orders by customer ID"""
-    repo = OrderRepository(db)
-    return repo.get_by_customer(customer_id, skip=skip, limit=limit)
+    repo = AsyncOrderRepository(db)
+    return _rows_response(await repo.get_by_customer(customer_id, skip=skip, limit=limit))
 
 
 @router.get("/status/{status}", response_model=List[OrderResponse])
-def get_orders_by_status(
+async def get_orders_by_status(
     status: str,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get orders by status"""
-    repo = OrderRepository(db)
-    return repo.get_by_status(status, skip=skip, limit=limit)
+    repo = AsyncOrderRepository(db)
+    return _rows_response(await repo.get_by_status(status, skip=skip, limit=limit))
 
 
 @router.get("/date-range/start/{start_date}/end/{end_date}", response_model=List[OrderResponse])
-def get_orders_by_date_range(
+async def get_orders_by_date_range(
     start_date: date,
     end_date: date,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get orders within date range"""
-    repo = OrderRepository(db)
-    return repo.get_by_date_range(start_date, end_date, skip=skip, limit=limit)
+    repo = AsyncOrderRepository(db)
+    return _rows_response(await repo.get_by_date_range(start_date, end_date, skip=skip, limit=limit))
 
 
 @router.put("/{order_id}", response_model=OrderResponse)
-def update_order(order_id: int, order: OrderUpdate, db: Session = Depends(get_db)):
+def update_order(
+    order_id: int,
+    order: OrderUpdate,
+    db: Session = Depends(get_db),
+    current_user: Optional[Employee] = Depends(get_optional_user),
+):
     """Update an order"""
     repo = OrderRepository(db)
-    updated = repo.update(order_id, order)
+    updated = repo.update(order_id, order, employee_id=current_user.emp_id if current_user else None)
     if not updated:
         raise HTTPException(status_code=404, detail="Order not found")
     return updated
@@ -90,14 +112,17 @@ def update_order(order_id: int, order: OrderUpdate, db: Session = Depends(get_db
 @router.patch("/{order_id}/status", response_model=OrderResponse)
 def update_order_status(
     order_id: int,
-    status: str = Query(..., description="New status: pending, completed, or cancelled"),
-    db: Session = Depends(get_db)
+    status: str = Query(..., description="New status: pending, in_progress, completed, or cancelled"),
+    db: Session = Depends(get_db),
+    current_user: Optional[Employee] = Depends(get_optional_user),
 ):
-    """Update order status"""
+    """Update order status, recording the transition and the acting employee"""
     repo = OrderRepository(db)
-    if status not in ['pending', 'completed', 'cancelled']:
+    if status not in ['pending', 'in_progress', 'completed', 'cancelled']:
         raise HTTPException(status_code=400, detail="Invalid status")
-    order = repo.update_status(order_id, status)
+    order = repo.update_status(
+        order_id, status, employee_id=current_user.emp_id if current_user else None
+    )
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     return order
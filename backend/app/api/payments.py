@@ -4,6 +4,7 @@ from typing import List
 from app.core.database import get_db
 from app.models.payment import Payment
 from app.schemas.payment import PaymentCreate, PaymentUpdate, PaymentResponse
+from app.repositories.daily_sales_repository import DailySalesRepository
 
 router = APIRouter(prefix="/payments", tags=["payments"])
 
@@ -12,8 +13,11 @@ router = APIRouter(prefix="/payments", tags=["payments"])
 def create_payment(payment: PaymentCreate, db: Session = Depends(get_db)):
     """Create a new payment"""
     payment_dict = payment.model_dump()
+    daily_sales = DailySalesRepository(db)
+    before = daily_sales.order_contribution(payment.order_id, lock=True)
     db_payment = Payment(**payment_dict)
     db.add(db_payment)
+    daily_sales.apply_change((before, daily_sales.order_contribution(payment.order_id)))
     db.commit()
     db.refresh(db_payment)
     return db_payment
@@ -58,10 +62,24 @@ def update_payment(payment_id: int, payment: PaymentUpdate, db: Session = Depend
     if not db_payment:
         raise HTTPException(status_code=404, detail="Payment not found")
     
+    daily_sales = DailySalesRepository(db)
+    old_order_id = db_payment.order_id
     update_data = payment.model_dump(exclude_unset=True)
+    new_order_id = update_data.get("order_id") or old_order_id
+    # Lock both orders in id order so two moves between them cannot deadlock
+    befores = {
+        order_id: daily_sales.order_contribution(order_id, lock=True)
+        for order_id in sorted({old_order_id, new_order_id})
+    }
+    old_before = befores[old_order_id]
+    new_before = befores[new_order_id] if new_order_id != old_order_id else None
     for field, value in update_data.items():
         setattr(db_payment, field, value)
-    
+
+    changes = [(old_before, daily_sales.order_contribution(old_order_id))]
+    if new_order_id != old_order_id:
+        changes.append((new_before, daily_sales.order_contribution(new_order_id)))
+    daily_sales.apply_change(*changes)
     db.commit()
     db.refresh(db_payment)
     return db_payment
@@ -100,6 +118,9 @@ def delete_payment(payment_id: int, db: Session = Depends(get_db)):
     if not payment:
         raise HTTPException(status_code=404, detail="Payment not found")
     
+    daily_sales = DailySalesRepository(db)
+    before = daily_sales.order_contribution(payment.order_id, lock=True)
     payment.is_deleted = True
+    daily_sales.apply_change((before, daily_sales.order_contribution(payment.order_id)))
     db.commit()
 
@@ -0,0 +1,147 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from datetime import date
+from decimal import Decimal
+from app.api.auth import require_role
+from app.core import report_cache, service_metrics
+from app.core.config import settings
+from app.core.database import get_read_db, is_replica
+from app.repositories.report_repository import ReportRepository
+from app.repositories.daily_sales_repository import DailySalesRepository
+from app.schemas.report import (
+    DashboardResponse,
+    DailySalesResponse,
+    HeatmapResponse,
+    TopItemsResponse,
+)
+
+router = APIRouter(
+    prefix="/reports",
+    tags=["reports"],
+    dependencies=[Depends(require_role(["Manager"]))],
+)
+
+
+@router.get("/dashboard", response_model=DashboardResponse)
+def get_dashboard(
+    as_of: Optional[date] = Query(None, description="Business date for 'today' (default: server date)"),
+    db: Session = Depends(get_read_db),
+):
+    """Manager dashboard KPIs (revenue, order status counts, menu, stock, customers)"""
+    repo = ReportRepository(db)
+    return repo.get_dashboard(as_of or date.today())
+
+
+@router.get("/daily-sales", response_model=List[DailySalesResponse])
+def get_daily_sales(
+    start_date: date = Query(..., alias="from"),
+    end_date: date = Query(..., alias="to"),
+    db: Session = Depends(get_read_db),
+):
+    """Orders and completed revenue per day, read from the daily_sales rollup"""
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    repo = DailySalesRepository(db)
+    return report_cache.cached_range(
+        "daily-sales",
+        start_date,
+        end_date,
+        lambda start, end: [DailySalesResponse.model_validate(row) for row in repo.get_range(start, end)],
+        lambda history, recent: history + recent,
+        final=not is_replica(db),
+    )
+
+
+def _heatmap(repo: DailySalesRepository, start_date: date, end_date: date):
+    orders = [[0] * 24 for _ in range(7)]
+    revenue = [[Decimal("0")] * 24 for _ in range(7)]
+    for cell in repo.get_heatmap(start_date, end_date):
+        orders[int(cell.weekday)][cell.hour] = int(cell.order_count)
+        revenue[int(cell.weekday)][cell.hour] = cell.revenue
+    return orders, revenue
+
+
+def _add_matrices(a, b):
+    return [[x + y for x, y in zip(row_a, row_b)] for row_a, row_b in zip(a, b)]
+
+
+@router.get("/heatmap", response_model=HeatmapResponse)
+def get_heatmap(
+    start_date: date = Query(..., alias="from"),
+    end_date: date = Query(..., alias="to"),
+    db: Session = Depends(get_read_db),
+):
+    """Hour-of-day x weekday traffic (7x24), read from the hourly_sales rollup"""
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    repo = DailySalesRepository(db)
+    orders, revenue = report_cache.cached_range(
+        "heatmap",
+        start_date,
+        end_date,
+        lambda start, end: _heatmap(repo, start, end),
+        lambda history, recent: (
+            _add_matrices(history[0], recent[0]),
+            _add_matrices(history[1], recent[1]),
+        ),
+        final=not is_replica(db),
+    )
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "timezone": settings.REPORT_TIMEZONE,
+        "orders": orders,
+        "revenue": revenue,
+    }
+
+
+def _merge_item_sales(history, recent):
+    merged = {item_id: dict(item) for item_id, item in history.items()}
+    for item_id, item in recent.items():
+        if item_id in merged:
+            for measure in ("quantity", "revenue", "order_count"):
+                merged[item_id][measure] += item[measure]
+        else:
+            merged[item_id] = item
+    return merged
+
+
+@router.get("/top-items", response_model=TopItemsResponse)
+def get_top_items(
+    start_date: date = Query(..., alias="from"),
+    end_date: date = Query(..., alias="to"),
+    sort_by: str = Query("quantity", pattern="^(quantity|revenue)$"),
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+):
+    """Top-selling menu items, read from the item_sales_daily materialized view"""
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    repo = ReportRepository(db)
+    refreshed_at = repo.get_refreshed_at("item_sales_daily")
+    # Days are only final in the view once it has been refreshed after they closed
+    closed_before = min(date.today(), refreshed_at.date()) if refreshed_at else date.today()
+    item_sales = report_cache.cached_range(
+        "top-items",
+        start_date,
+        end_date,
+        repo.get_item_sales,
+        _merge_item_sales,
+        today=closed_before,
+        final=not is_replica(db),
+    )
+    items = sorted(item_sales.values(), key=lambda item: (-item[sort_by], item["item_id"]))
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "sort_by": sort_by,
+        "refreshed_at": refreshed_at,
+        "items": items[:limit],
+    }
+
+
+@router.get("/service-times", response_model=Dict)
+def get_service_times():
+    """Rolling p50/p95 queue, prep and total service times (this worker)"""
+    return service_metrics.snapshot()
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Dict
 from decimal import Decimal
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.repositories.inventory_repository import InventoryRepository
 from app.repositories.menu_item_ingredient_repository import (
     MenuItemIngredientRepository,
@@ -32,7 +32,7 @@ def restock_ingredient(
 def check_menu_item_availability(
     item_id: int, 
     quantity: int = Query(1, ge=1, description="Quantity of menu items to check"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Check if a menu item can be made based on ingredient stock"""
     menu_item_repo = MenuItemRepository(db)
@@ -143,7 +143,7 @@ def check_menu_item_availability(
 
 
 @router.get("/order/{order_id}/availability", response_model=Dict)
-def check_order_availability(order_id: int, db: Session = Depends(get_db)):
+def check_order_availability(order_id: int, db: Session = Depends(get_read_db)):
     """Check availability for all items in an order with optimized queries"""
     from app.repositories.order_repository import OrderRepository
 
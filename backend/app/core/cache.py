@@ -0,0 +1,136 @@
+"""
+In-process caching utilities
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+# Named caches, reported by cache_stats()
+_caches: Dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """Bounded LRU cache with optional per-entry expiry"""
+
+    def __init__(self, name: str, maxsize: int = 256, ttl: Optional[float] = None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Bumped on every eviction; see set(generation=...)
+        self.generation = 0
+        _caches[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return cached value or default when missing/expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> bool:
+        """Store a value, evicting the least recently used entry when full
+
+        Pass the generation read before computing the value: if anything was
+        evicted since, the value may predate that invalidation and is dropped.
+        Returns whether the value was stored.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return True
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a single entry if present"""
+        with self._lock:
+            self.generation += 1
+            self._data.pop(key, None)
+
+    def evict(self, keys: Optional[Iterable[Hashable]]) -> None:
+        """Remove the given entries, or everything when keys is None"""
+        with self._lock:
+            self.generation += 1
+            if keys is None:
+                self._data.clear()
+                return
+            for key in keys:
+                self._data.pop(key, None)
+
+    def evict_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove entries whose key matches predicate; returns how many"""
+        with self._lock:
+            self.generation += 1
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def keys(self) -> list:
+        """Snapshot of the current keys, least recently used first"""
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return statistics of every named cache in this worker"""
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+# Version counters used to invalidate derived data (e.g. grouped menu) on writes
+_versions: Dict[str, int] = {}
+_versions_lock = threading.Lock()
+
+
+def get_version(namespace: str) -> int:
+    """Get current version of a cache namespace"""
+    return _versions.get(namespace, 0)
+
+
+def bump_version(namespace: str) -> int:
+    """Increment version of a cache namespace, invalidating keys built on it"""
+    with _versions_lock:
+        _versions[namespace] = _versions.get(namespace, 0) + 1
+        return _versions[namespace]
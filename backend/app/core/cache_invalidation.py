@@ -0,0 +1,104 @@
+"""
+Cross-worker cache invalidation over PostgreSQL LISTEN/NOTIFY
+
+Writers publish evicted keys inside their transaction, so other workers only
+hear about a change once it is committed. Each worker runs one listener
+thread that evicts the keys from its local caches.
+"""
+
+import json
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+import psycopg
+from sqlalchemy import Text, cast, func, text
+from sqlalchemy.orm import Session
+
+from app.core.logging import logger
+
+CHANNEL = "cache_invalidation"
+
+_handlers: Dict[str, Callable[[Optional[List[str]]], None]] = {}
+_listener: Optional["_Listener"] = None
+
+
+def register(namespace: str, evict: Callable[[Optional[List[str]]], None]) -> None:
+    """Register the local eviction callback for a cache namespace
+
+    The callback receives the keys to drop, or None to drop everything.
+    """
+    _handlers[namespace] = evict
+
+
+def publish(db: Session, namespace: str, keys: Iterable[str]) -> None:
+    """Queue an invalidation message; delivered to listeners on commit"""
+    payload = json.dumps({"ns": namespace, "keys": list(keys)})
+    db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": CHANNEL, "payload": payload})
+
+
+def notify_expression(namespace: str, keys):
+    """SQL pg_notify() call publishing keys computed by the statement itself
+
+    keys is a SQL text[] expression. Selecting this next to a RETURNING CTE
+    queues the same message as publish() without another round trip.
+    """
+    payload = func.json_build_object("ns", namespace, "keys", func.to_json(keys))
+    return func.pg_notify(CHANNEL, cast(payload, Text))
+
+
+def _dispatch(payload: str) -> None:
+    try:
+        message = json.loads(payload)
+        handler = _handlers.get(message["ns"])
+        if handler:
+            handler(message["keys"])
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring malformed cache invalidation message: {str(e)}")
+
+
+class _Listener(threading.Thread):
+    """Background thread holding a dedicated LISTEN connection"""
+
+    def __init__(self, conninfo: str):
+        super().__init__(name="cache-invalidation-listener", daemon=True)
+        self.conninfo = conninfo
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        backoff = 1
+        while not self._stop_event.is_set():
+            try:
+                with psycopg.connect(self.conninfo, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {CHANNEL}")
+                    backoff = 1
+                    while not self._stop_event.is_set():
+                        for notify in conn.notifies(timeout=1.0):
+                            _dispatch(notify.payload)
+            except Exception as e:
+                logger.error(f"Cache invalidation listener error: {str(e)}")
+                # Changes may have been missed while disconnected; drop local entries
+                for handler in list(_handlers.values()):
+                    handler(None)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def start_listener(conninfo: str) -> None:
+    """Start this worker's listener thread (idempotent)"""
+    global _listener
+    if _listener is None:
+        _listener = _Listener(conninfo)
+        _listener.start()
+        logger.info("Cache invalidation listener started")
+
+
+def stop_listener() -> None:
+    """Stop this worker's listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,130 @@
+"""
+Response compression (brotli when installed, else gzip)
+
+Only responses with a known length are compressed: a Content-Length of at
+least COMPRESSION_MIN_SIZE bytes and one of the COMPRESSION_CONTENT_TYPES.
+Streaming responses (exports, import reports) have no Content-Length and
+pass through untouched, so every chunk still reaches the client as soon as
+it is produced. Bodies larger than THREAD_MIN_SIZE are compressed in a
+worker thread to keep the event loop free.
+"""
+
+import gzip
+from typing import List, Optional
+
+from anyio import to_thread
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+THREAD_MIN_SIZE = 64 * 1024
+# Compressed, partial or bodiless responses are never re-encoded
+_SKIP_STATUSES = (204, 206, 304)
+
+
+def available_encodings() -> List[str]:
+    """Encodings this worker can produce, in order of preference"""
+    return (["br"] if brotli is not None else []) + ["gzip"]
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Preferred encoding the client accepts (q > 0), or None"""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip()] = q
+    for encoding in available_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def _content_types() -> List[str]:
+    return [t.strip().lower() for t in settings.COMPRESSION_CONTENT_TYPES.split(",") if t.strip()]
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing complete, compressible responses"""
+
+    def __init__(self, app):
+        self.app = app
+        self.content_types = _content_types()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start_message = None
+        chunks: List[bytes] = []
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+                length = headers.get("content-length")
+                if (
+                    message["status"] in _SKIP_STATUSES
+                    or "content-encoding" in headers
+                    or media_type not in self.content_types
+                    or length is None  # streaming
+                    or int(length) < settings.COMPRESSION_MIN_SIZE
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                headers.add_vary_header("Accept-Encoding")
+                if encoding is None:
+                    passthrough = True
+                    await send(message)
+                    return
+                # Hold the headers until the whole body is here
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            if len(body) >= THREAD_MIN_SIZE:
+                body = await to_thread.run_sync(compress, body, encoding)
+            else:
+                body = compress(body, encoding)
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            passthrough = True
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body, "more_body": False})
+
+        await self.app(scope, receive, send_compressed)
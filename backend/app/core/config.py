@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings
+from decimal import Decimal
 from typing import Optional
 
 
@@ -13,6 +14,38 @@ class Settings(BaseSettings):
     DB_PASSWORD: str
     DB_NAME: str
 
+    # Connection Pool Configuration (per worker; see "Connection Budget" in docs/setup.md)
+    DB_POOL_SIZE: int = 10  # Sync engine (most routes)
+    DB_MAX_OVERFLOW: int = 20  # Extra connections opened above DB_POOL_SIZE under load
+    DB_ASYNC_POOL_SIZE: int = 5  # Async engine (async list and lookup routes)
+    DB_ASYNC_MAX_OVERFLOW: int = 5
+    DB_REPLICA_POOL_SIZE: int = 5  # Each of the sync and async replica engines
+    DB_REPLICA_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30  # Seconds to wait for a connection before failing
+    DB_POOL_RECYCLE: int = -1  # Replace connections older than this many seconds; -1 disables
+    DB_POOL_USE_LIFO: bool = False  # Reuse the most recent connection so idle ones can time out
+    DB_POOL_PRE_PING: bool = True  # Test connections on checkout; False relies on recycle/retry
+    DB_PREPARE_THRESHOLD: int = 2  # Server-side prepare after this many runs per connection; -1 disables (PgBouncer)
+
+    # Read Replica Configuration (unset = all reads on the primary)
+    REPLICA_DATABASE_URL: Optional[str] = None
+    DB_REPLICA_HOST: Optional[str] = None  # Or reuse the primary credentials on another host...
+    DB_REPLICA_PORT: Optional[int] = None  # ...and/or port (e.g. a second local instance)
+    REPLICA_MAX_LAG_SECONDS: float = 5  # Beyond this, reads fall back to the primary
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 2
+    READ_YOUR_WRITES_SECONDS: float = 10  # Reads stay on the primary this long after a write
+
+    # Query Budget Configuration (per request; over budget logs a warning)
+    DB_QUERY_BUDGET: int = 20
+    DB_TIME_BUDGET_MS: float = 500
+    DB_N_PLUS_ONE_THRESHOLD: int = 5  # Same statement this many times in one request
+
+    # Slow Query Log Configuration
+    SLOW_QUERY_MS: float = 200  # Record statements slower than this; 0 disables
+    SLOW_QUERY_LOG_SIZE: int = 200  # Entries kept per worker
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1  # Fraction re-run as EXPLAIN (ANALYZE, BUFFERS)
+    SLOW_QUERY_EXPLAIN_TIMEOUT_MS: int = 5000
+
     # Application Configuration
     APP_NAME: str = "Coffee Shop Management API"
     APP_VERSION: str = "1.0.0"
@@ -22,6 +55,7 @@ class Settings(BaseSettings):
     # Server Configuration
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    THREADPOOL_TOKENS: int = 40  # Concurrent sync route handlers per worker (AnyIO default 40)
 
     # Security Configuration
     SECRET_KEY: Optional[str] = "your-secret-key-change-in-production-use-env-variable"
@@ -32,6 +66,31 @@ class Settings(BaseSettings):
     CORS_ALLOW_METHODS: str = "*"  # Comma-separated or "*" for all
     CORS_ALLOW_HEADERS: str = "*"  # Comma-separated or "*" for all
 
+    # Response Compression Configuration (brotli when installed, else gzip)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # Smaller bodies are sent as is
+    COMPRESSION_CONTENT_TYPES: str = "application/json,text/plain,text/csv"  # Comma-separated
+    COMPRESSION_GZIP_LEVEL: int = 4  # 1 (fastest) to 9 (smallest)
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0 (fastest) to 11 (smallest)
+
+    # Loyalty Configuration
+    LOYALTY_SPEND_PER_POINT: Decimal = Decimal("10")  # 1 point per 10 spent; 0 disables earning
+
+    # Reporting Configuration
+    REPORT_TIMEZONE: str = "UTC"  # Local time zone for hour-of-day buckets
+    REPORT_REFRESH_INTERVAL_SECONDS: int = 300  # Materialized view refresh; 0 disables
+    SERVICE_METRICS_WINDOW_HOURS: int = 24  # Rolling window of in-memory service times
+
+    # Cache Configuration
+    MENU_CACHE_TTL_SECONDS: int = 30  # Bounds staleness across workers
+    CUSTOMER_CACHE_SIZE: int = 4096
+    CUSTOMER_CACHE_TTL_SECONDS: int = 300
+    DASHBOARD_CACHE_TTL_SECONDS: int = 15
+    REPORT_CACHE_SIZE: int = 1024
+    REPORT_CACHE_TTL_SECONDS: int = 30  # Results that include today
+    REPORT_HISTORY_TTL_SECONDS: int = 86400  # Closed ranges; backstop for a missed invalidation
+    CACHE_INVALIDATION_LISTENER: bool = True  # LISTEN/NOTIFY eviction across workers
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,8 +1,12 @@
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from urllib.parse import quote_plus
 from app.core.config import settings
+from app.core import pool_metrics, replica, slow_queries
 
 # Build DATABASE_URL from components to handle special characters in password
 # This properly handles passwords with @, :, /, etc.
@@ -16,18 +20,105 @@ if settings.DATABASE_URL:
     if database_url.startswith("postgresql://") and "psycopg" not in database_url:
         database_url = database_url.replace("postgresql://", "postgresql+psycopg://", 1)
 
+# Pool settings shared by every engine; each sizes its own pool, and all
+# primary pools of all workers must fit in the server's max_connections
+pool_options = dict(
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
+# psycopg prepares a statement on the server once a connection has run it this
+# many times; SQLAlchemy's compiled cache keeps the SQL text identical per call
+connect_args = dict(
+    prepare_threshold=None if settings.DB_PREPARE_THRESHOLD < 0 else settings.DB_PREPARE_THRESHOLD,
+)
+
 # Create database engine with connection pooling
 engine = create_engine(
     database_url,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
+    poolclass=pool_metrics.InstrumentedQueuePool,
     echo=settings.DEBUG,
+    connect_args=connect_args,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    **pool_options,
 )
+pool_metrics.instrument(engine, "sync")
+slow_queries.explain_on(engine, engine)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for async route handlers: same URL, psycopg's async driver, own pool
+async_engine = create_async_engine(
+    database_url,
+    poolclass=pool_metrics.InstrumentedAsyncQueuePool,
+    echo=settings.DEBUG,
+    connect_args=connect_args,
+    pool_size=settings.DB_ASYNC_POOL_SIZE,
+    max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+    **pool_options,
+)
+pool_metrics.instrument(async_engine.sync_engine, "async")
+slow_queries.explain_on(async_engine.sync_engine, engine)
+
+# Objects stay usable after commit; async sessions cannot lazy-load expired attributes
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+# Optional read replica: its own URL, or the primary URL with another host/port
+replica_url = settings.REPLICA_DATABASE_URL
+if replica_url:
+    if replica_url.startswith("postgresql://") and "psycopg" not in replica_url:
+        replica_url = replica_url.replace("postgresql://", "postgresql+psycopg://", 1)
+elif settings.DB_REPLICA_HOST or settings.DB_REPLICA_PORT:
+    primary = make_url(database_url)
+    replica_url = primary.set(
+        host=settings.DB_REPLICA_HOST or primary.host,
+        port=settings.DB_REPLICA_PORT or primary.port,
+    )
+
+replica_engine = None
+ReplicaSessionLocal = None
+AsyncReplicaSessionLocal = None
+if replica_url:
+    replica_engine = create_engine(
+        replica_url,
+        poolclass=pool_metrics.InstrumentedQueuePool,
+        echo=settings.DEBUG,
+        connect_args=connect_args,
+        pool_size=settings.DB_REPLICA_POOL_SIZE,
+        max_overflow=settings.DB_REPLICA_MAX_OVERFLOW,
+        **pool_options,
+    )
+    pool_metrics.instrument(replica_engine, "replica")
+    slow_queries.explain_on(replica_engine, replica_engine)
+    async_replica_engine = create_async_engine(
+        replica_url,
+        poolclass=pool_metrics.InstrumentedAsyncQueuePool,
+        echo=settings.DEBUG,
+        connect_args=connect_args,
+        pool_size=settings.DB_REPLICA_POOL_SIZE,
+        max_overflow=settings.DB_REPLICA_MAX_OVERFLOW,
+        **pool_options,
+    )
+    pool_metrics.instrument(async_replica_engine.sync_engine, "replica_async")
+    slow_queries.explain_on(async_replica_engine.sync_engine, replica_engine)
+    # info["replica"] lets callers tell replica sessions apart (see is_replica)
+    ReplicaSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, bind=replica_engine, info={"replica": True}
+    )
+    AsyncReplicaSessionLocal = async_sessionmaker(
+        async_replica_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+        info={"replica": True},
+    )
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -39,3 +130,35 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dependency to get an async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def is_replica(db) -> bool:
+    """Whether a (sync or async) session reads from the replica"""
+    return db.info.get("replica", False)
+
+
+# Dependency for read-only endpoints: replica session when it is safe, else primary
+def get_read_db(request: Request):
+    session_factory = SessionLocal
+    if ReplicaSessionLocal is not None and replica.use_replica(request):
+        session_factory = ReplicaSessionLocal
+    db = session_factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# Async counterpart of get_read_db
+async def get_async_read_db(request: Request):
+    session_factory = AsyncSessionLocal
+    if AsyncReplicaSessionLocal is not None and replica.use_replica(request):
+        session_factory = AsyncReplicaSessionLocal
+    async with session_factory() as db:
+        yield db
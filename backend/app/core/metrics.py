@@ -0,0 +1,246 @@
+"""
+Prometheus-style metrics, aggregated per worker
+
+Counters and histograms keep one shard per thread, so recording is a plain
+dict update with no lock and no contention between request threads. A
+scrape merges the shards and adds gauges read from the connection pools and
+caches. Each worker serves its own numbers, labelled with worker="<pid>".
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.core.cache import cache_stats
+from app.core import pool_metrics
+
+Labels = Tuple[str, ...]
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_WORKER = str(os.getpid())
+_metrics: List["_Metric"] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Tuple[str, ...], values: Labels, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.append(f'worker="{_WORKER}"')
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}"
+
+
+class _Metric:
+    """Base for sharded metrics: one dict per recording thread"""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._local = threading.local()
+        self._shards: List[Dict[Labels, Any]] = []
+        self._shards_lock = threading.Lock()
+        _metrics.append(self)
+
+    def _shard(self) -> Dict[Labels, Any]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            # Once per thread; shards of finished threads keep their counts
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _snapshot_shards(self) -> List[Dict[Labels, Any]]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        # dict() copies under the GIL, so a concurrent update cannot tear it
+        return [dict(shard) for shard in shards]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter"""
+
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        totals: Dict[Labels, float] = {}
+        for shard in self._snapshot_shards():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return [
+            f"{self.name}{_format_labels(self.labels, labels)} {value}"
+            for labels, value in sorted(totals.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Bucketed distribution with sum and count"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self._shard()
+        # Per bucket (non-cumulative) counts, then +Inf, then the sum
+        state = shard.get(labels)
+        if state is None:
+            state = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def render(self) -> List[str]:
+        totals: Dict[Labels, List[float]] = {}
+        for shard in self._snapshot_shards():
+            for labels, state in shard.items():
+                state = list(state)
+                if labels in totals:
+                    totals[labels] = [a + b for a, b in zip(totals[labels], state)]
+                else:
+                    totals[labels] = state
+        lines = []
+        for labels, state in sorted(totals.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, labels)} {state[-1]}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, labels)} {cumulative}")
+        return lines
+
+
+class Collected(_Metric):
+    """Values read at scrape time from a callback returning {labels: value}
+
+    Used for state other modules already track (pools, caches); kind is
+    "counter" for their running totals.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Tuple[str, ...],
+        collect: Callable[[], Dict[Labels, float]],
+        kind: str = "gauge",
+    ):
+        super().__init__(name, help_text, labels)
+        self.collect = collect
+        self.kind = kind
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labels, labels)} {value}"
+            for labels, value in sorted(self.collect().items())
+        ]
+
+
+def _pool_gauge(field: str) -> Callable[[], Dict[Labels, float]]:
+    return lambda: {(name,): stats[field] for name, stats in pool_metrics.snapshot().items()}
+
+
+def _cache_gauge(field: str) -> Callable[[], Dict[Labels, float]]:
+    return lambda: {(name,): stats[field] for name, stats in cache_stats().items()}
+
+
+# HTTP
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route", "status")
+)
+DB_TIME = Histogram(
+    "http_request_db_seconds", "Time spent in SQL per HTTP request", ("method", "route")
+)
+
+# Connection pools
+Collected("db_pool_size", "Configured pool size", ("pool",), _pool_gauge("size"))
+Collected("db_pool_checked_out", "Connections currently checked out", ("pool",), _pool_gauge("checked_out"))
+Collected("db_pool_overflow", "Overflow connections currently open", ("pool",), _pool_gauge("overflow"))
+Collected(
+    "db_pool_checkouts_total", "Connection checkouts", ("pool",), _pool_gauge("checkouts"), kind="counter"
+)
+Collected(
+    "db_pool_timeouts_total", "Checkouts that timed out", ("pool",), _pool_gauge("timeouts"), kind="counter"
+)
+Collected(
+    "db_pool_checkout_wait_p95_milliseconds",
+    "p95 checkout wait over recent checkouts",
+    ("pool",),
+    lambda: {(name,): stats["wait_ms"]["p95"] for name, stats in pool_metrics.snapshot().items()},
+)
+
+# In-process caches
+Collected("cache_hits_total", "Cache hits", ("cache",), _cache_gauge("hits"), kind="counter")
+Collected("cache_misses_total", "Cache misses", ("cache",), _cache_gauge("misses"), kind="counter")
+Collected("cache_hit_ratio", "Cache hit ratio since start", ("cache",), _cache_gauge("hit_ratio"))
+Collected("cache_entries", "Entries currently cached", ("cache",), _cache_gauge("size"))
+
+# Business events, counted after the transaction commits
+ORDERS_CREATED = Counter("orders_created_total", "Orders created")
+ORDER_TRANSITIONS = Counter("order_status_changes_total", "Order status changes", ("status",))
+STOCK_DEDUCTIONS = Counter("stock_deductions_total", "Ingredient stock deductions for completed orders")
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format"""
+    lines = []
+    for metric in _metrics:
+        lines.append(f"# HELP {metric.name} {metric.help_text}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request count and latency per route template"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            labels = (scope["method"], route_template(scope), str(status))
+            HTTP_REQUESTS.inc(*labels)
+            HTTP_LATENCY.observe(time.perf_counter() - start, *labels)
+
+
+def route_template(scope) -> str:
+    """Matched route path (e.g. /api/v1/orders/{order_id}); bounded label values"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
@@ -0,0 +1,150 @@
+"""
+Connection pool instrumentation
+
+The engines are built with pool classes that time every checkout, including
+waiting for a free connection and opening a new one. Pool events count
+checkouts, new and invalidated connections, and track peak checked-out and
+overflow use. snapshot() reports them with the pool's live state.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+MAX_WAIT_SAMPLES = 1_000  # recent checkouts used for the wait percentiles
+
+_pools: Dict[str, "PoolStats"] = {}
+
+
+class PoolStats:
+    """Counters for one engine's pool; live figures are read from the pool"""
+
+    def __init__(self, name: str, engine: Engine):
+        self.name = name
+        self.engine = engine
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._waits: Deque[float] = deque(maxlen=MAX_WAIT_SAMPLES)
+
+    def record_wait(self, seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            self._waits.append(seconds)
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_checkout(self, pool: QueuePool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.peak_checked_out = max(self.peak_checked_out, pool.checkedout())
+            self.peak_overflow = max(self.peak_overflow, pool.overflow())
+
+    def snapshot(self) -> Dict[str, Any]:
+        pool = self.engine.pool
+        with self._lock:
+            waits = sorted(self._waits)
+            attempts = self.checkouts + self.timeouts
+            return {
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "timeout_seconds": pool.timeout(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(0, pool.overflow()),
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": max(0, self.peak_overflow),
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_ms": {
+                    "avg": round(self.wait_total / attempts * 1000, 3) if attempts else 0.0,
+                    "p50": _percentile_ms(waits, 0.50),
+                    "p95": _percentile_ms(waits, 0.95),
+                    "max": round(self.wait_max * 1000, 3),
+                },
+            }
+
+
+def _percentile_ms(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list, in milliseconds"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(q * len(sorted_values)) - 1)
+    return round(sorted_values[index] * 1000, 3)
+
+
+class _TimedCheckout:
+    """Pool mixin timing how long each checkout takes to get a connection"""
+
+    pool_stats: Optional[PoolStats] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self.pool_stats is not None:
+                self.pool_stats.record_wait(time.perf_counter() - start, timed_out)
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep reporting into the same stats
+        pool = super().recreate()
+        pool.pool_stats = self.pool_stats
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    """QueuePool with checkout timing, for the sync engine"""
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout timing, for the async engine"""
+
+
+def instrument(engine: Engine, name: str) -> PoolStats:
+    """Attach counters to an engine built with one of the instrumented pools"""
+    stats = PoolStats(name, engine)
+    engine.pool.pool_stats = stats
+
+    @event.listens_for(engine.pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.record_checkout(engine.pool)
+
+    @event.listens_for(engine.pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        stats.increment("connects")
+
+    @event.listens_for(engine.pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        stats.increment("invalidations")
+
+    _pools[name] = stats
+    return stats
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """Live state and counters of every instrumented pool in this worker"""
+    return {name: stats.snapshot() for name, stats in _pools.items()}
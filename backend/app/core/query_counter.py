@@ -0,0 +1,125 @@
+"""
+Per-request SQL statement counting
+
+Engine events add every statement's count and duration to the QueryStats of
+the current request (a context variable, so it follows the request into the
+thread pool and into async sessions). The HTTP middleware reports the totals
+as X-DB-Queries / X-DB-Time in debug mode and logs routes that go over
+DB_QUERY_BUDGET or DB_TIME_BUDGET_MS, or repeat one statement often enough
+to look like an N+1 loop. The same hook feeds the slow-query log.
+
+max_queries() asserts a statement limit around any block of code, including
+requests made through a test client.
+"""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core import metrics, slow_queries
+from app.core.config import settings
+from app.core.logging import logger
+
+QUERIES_HEADER = "X-DB-Queries"
+TIME_HEADER = "X-DB-Time"
+
+
+class QueryStats:
+    """Statements executed and time spent in the database"""
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.scope = scope  # ASGI scope of the request; its route is set once matched
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, statement: str, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.seconds += seconds
+            self.statements[statement] += 1
+
+    @property
+    def milliseconds(self) -> float:
+        return round(self.seconds * 1000, 2)
+
+    def repeated(self, threshold: int) -> List[tuple]:
+        """(statement, times) for statements run at least threshold times"""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+# Stats collected by max_queries(), whatever context the statements run in
+_watchers: List[QueryStats] = []
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.add(statement, elapsed)
+    for watcher in list(_watchers):
+        watcher.add(statement, elapsed)
+    route = metrics.route_template(stats.scope) if stats is not None and stats.scope else None
+    slow_queries.observe(conn, statement, parameters, executemany, elapsed, route)
+
+
+@contextmanager
+def max_queries(limit: int) -> Iterator[QueryStats]:
+    """Fail with AssertionError if the block runs more than limit statements
+
+        with max_queries(3):
+            client.get("/api/v1/stock/order/1/availability")
+    """
+    stats = QueryStats()
+    _watchers.append(stats)
+    try:
+        yield stats
+    finally:
+        _watchers.remove(stats)
+    if stats.count > limit:
+        repeated = "; ".join(f"{n}x {sql[:80]}" for sql, n in stats.repeated(2)[:3])
+        raise AssertionError(
+            f"Expected at most {limit} SQL statements, got {stats.count}"
+            + (f" (repeated: {repeated})" if repeated else "")
+        )
+
+
+async def count_queries(request: Request, call_next):
+    """HTTP middleware: count statements per request, report and enforce budgets"""
+    stats = QueryStats(request.scope)
+    token = _current.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        _current.reset(token)
+
+    if settings.DEBUG:
+        response.headers[QUERIES_HEADER] = str(stats.count)
+        response.headers[TIME_HEADER] = f"{stats.milliseconds:.2f}"
+
+    route = metrics.route_template(request.scope)
+    metrics.DB_TIME.observe(stats.seconds, request.method, route)
+    endpoint = f"{request.method} {route}"
+    if stats.count > settings.DB_QUERY_BUDGET or stats.milliseconds > settings.DB_TIME_BUDGET_MS:
+        logger.warning(
+            f"{endpoint} ran {stats.count} SQL statements in {stats.milliseconds} ms "
+            f"(budget {settings.DB_QUERY_BUDGET} statements, {settings.DB_TIME_BUDGET_MS} ms)"
+        )
+    for sql, times in stats.repeated(settings.DB_N_PLUS_ONE_THRESHOLD):
+        logger.warning(f"Possible N+1 in {endpoint}: {times}x {' '.join(sql.split())[:200]}")
+    return response
@@ -0,0 +1,156 @@
+"""
+Read-replica routing
+
+Read-only endpoints take their session from get_read_db / get_async_read_db,
+which hand out a replica session when all of these hold:
+
+- a replica is configured (REPLICA_DATABASE_URL or DB_REPLICA_HOST/PORT)
+- the lag monitor measured the replica recently and it is within
+  REPLICA_MAX_LAG_SECONDS
+- the client did not write within the last READ_YOUR_WRITES_SECONDS
+
+Otherwise the primary serves the read. After a successful write the API
+returns X-DB-Primary-Until (epoch seconds); clients echo it on later requests
+so their reads stay on the primary until the replica has caught up.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.logging import logger
+
+PRIMARY_UNTIL_HEADER = "X-DB-Primary-Until"
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Seconds the replica is behind; 0 when it has replayed everything received
+# (pg_last_xact_replay_timestamp alone grows while the primary is idle) and
+# for a server that is not in recovery, e.g. a second local instance
+_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+_lock = threading.Lock()
+_lag: Optional[float] = None
+_checked_at: Optional[float] = None
+_last_error: Optional[str] = None
+_monitor: Optional["_LagMonitor"] = None
+
+
+def measure_lag(replica_engine: Engine) -> Optional[float]:
+    """Measure replication lag now; None when the replica is unreachable"""
+    global _lag, _checked_at, _last_error
+    try:
+        with replica_engine.connect() as conn:
+            lag = float(conn.execute(_LAG_QUERY).scalar_one())
+        error = None
+    except Exception as e:
+        lag, error = None, str(e)
+    with _lock:
+        previous_error = _last_error
+        _lag, _checked_at, _last_error = lag, time.monotonic(), error
+    # Log state changes only; the monitor runs every few seconds
+    if error and not previous_error:
+        logger.warning(f"Replica lag check failed, reading from primary: {error}")
+    elif previous_error and not error:
+        logger.info("Replica reachable again")
+    return lag
+
+
+def replica_healthy() -> bool:
+    """Whether the last lag measurement is recent and within the limit"""
+    with _lock:
+        lag, checked_at = _lag, _checked_at
+    if lag is None or checked_at is None:
+        return False
+    # A stalled monitor must not keep routing to a replica nobody is watching
+    stale_after = 3 * settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS
+    return time.monotonic() - checked_at <= stale_after and lag <= settings.REPLICA_MAX_LAG_SECONDS
+
+
+def primary_until() -> str:
+    """Value of the read-your-writes header for a write happening now"""
+    return f"{time.time() + settings.READ_YOUR_WRITES_SECONDS:.3f}"
+
+
+def wrote_recently(request: Request) -> bool:
+    """Whether the client echoed a read-your-writes window that is still open"""
+    value = request.headers.get(PRIMARY_UNTIL_HEADER)
+    if not value:
+        return False
+    try:
+        return float(value) > time.time()
+    except ValueError:
+        return False
+
+
+def use_replica(request: Request) -> bool:
+    return replica_healthy() and not wrote_recently(request)
+
+
+async def read_your_writes(request: Request, call_next):
+    """HTTP middleware: mark successful writes with the read-your-writes window"""
+    response = await call_next(request)
+    if request.method not in READ_METHODS and response.status_code < 400:
+        response.headers[PRIMARY_UNTIL_HEADER] = primary_until()
+    return response
+
+
+def status() -> Dict[str, Any]:
+    """Routing state of this worker"""
+    with _lock:
+        lag, checked_at, error = _lag, _checked_at, _last_error
+    return {
+        "healthy": replica_healthy(),
+        "lag_seconds": None if lag is None else round(lag, 3),
+        "checked_seconds_ago": None if checked_at is None else round(time.monotonic() - checked_at, 1),
+        "max_lag_seconds": settings.REPLICA_MAX_LAG_SECONDS,
+        "read_your_writes_seconds": settings.READ_YOUR_WRITES_SECONDS,
+        "last_error": error,
+    }
+
+
+class _LagMonitor(threading.Thread):
+    """Background thread measuring replication lag every interval"""
+
+    def __init__(self, replica_engine: Engine, interval: float):
+        super().__init__(name="replica-lag-monitor", daemon=True)
+        self.replica_engine = replica_engine
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            measure_lag(self.replica_engine)
+            self._stop_event.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def start_monitor(replica_engine: Engine) -> None:
+    """Start this worker's lag monitor thread (idempotent)"""
+    global _monitor
+    if _monitor is None:
+        _monitor = _LagMonitor(replica_engine, settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS)
+        _monitor.start()
+        logger.info("Replica lag monitor started")
+
+
+def stop_monitor() -> None:
+    """Stop this worker's lag monitor thread"""
+    global _monitor
+    if _monitor is not None:
+        _monitor.stop()
+        _monitor = None
@@ -0,0 +1,122 @@
+"""
+Report result cache with immutable-history awareness
+
+Results for ranges that end before today cannot change any more, so they are
+kept until an explicit invalidation (back-dated writes, rollup rebuilds, view
+refreshes), LRU eviction or REPORT_HISTORY_TTL_SECONDS as a backstop. Results
+that include today expire after REPORT_CACHE_TTL_SECONDS. A range spanning
+both is split: the long-lived historical part is merged with a short-lived
+part from today on. Results read from a replica are never treated as final:
+the replica may not have replayed the write behind an invalidation yet. A
+result whose computation overlapped an invalidation is returned but not
+cached, since it may have read the data from before it.
+"""
+
+import threading
+from collections import Counter
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core import cache_invalidation
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+CACHE_NAMESPACE = "reports"
+
+_history = TTLCache(
+    "report_history", maxsize=settings.REPORT_CACHE_SIZE, ttl=settings.REPORT_HISTORY_TTL_SECONDS
+)
+_recent = TTLCache(
+    "report_recent", maxsize=settings.REPORT_CACHE_SIZE, ttl=settings.REPORT_CACHE_TTL_SECONDS
+)
+_invalidations = 0
+_invalidations_lock = threading.Lock()
+
+
+def _cached(cache: TTLCache, key: Hashable, compute: Callable[[], Any]) -> Any:
+    value = cache.get(key)
+    if value is None:
+        generation = cache.generation
+        value = compute()
+        cache.set(key, value, generation=generation)
+    return value
+
+
+def cached_range(
+    endpoint: str,
+    start_date: date,
+    end_date: date,
+    compute: Callable[[date, date], Any],
+    merge: Callable[[Any, Any], Any],
+    params: Hashable = (),
+    today: Optional[date] = None,
+    final: bool = True,
+) -> Any:
+    """Get compute(start, end) through the cache, splitting at today
+
+    merge(history, recent) combines the results of two adjacent ranges and
+    must not modify its arguments, which are shared cached values. With
+    final=False the whole result only lives for REPORT_CACHE_TTL_SECONDS.
+    """
+    if not final:
+        return _cached(
+            _recent, (endpoint, start_date, end_date, params),
+            lambda: compute(start_date, end_date),
+        )
+    today = today or date.today()
+    if end_date < today:
+        return _cached(
+            _history, (endpoint, start_date, end_date, params),
+            lambda: compute(start_date, end_date),
+        )
+    if start_date >= today:
+        return _cached(
+            _recent, (endpoint, start_date, end_date, params),
+            lambda: compute(start_date, end_date),
+        )
+    yesterday = today - timedelta(days=1)
+    history = _cached(
+        _history, (endpoint, start_date, yesterday, params),
+        lambda: compute(start_date, yesterday),
+    )
+    recent = _cached(
+        _recent, (endpoint, today, end_date, params),
+        lambda: compute(today, end_date),
+    )
+    return merge(history, recent)
+
+
+def _evict(endpoints: Optional[Iterable[str]]) -> None:
+    global _invalidations
+    if endpoints is None:
+        _history.clear()
+        _recent.clear()
+    else:
+        names = set(endpoints)
+        _history.evict_where(lambda key: key[0] in names)
+        _recent.evict_where(lambda key: key[0] in names)
+    with _invalidations_lock:
+        _invalidations += 1
+
+
+cache_invalidation.register(CACHE_NAMESPACE, _evict)
+
+
+def invalidate(db: Session, endpoints: Iterable[str]) -> None:
+    """Drop cached results of endpoints here now and in every worker on commit"""
+    endpoints = list(endpoints)
+    _evict(endpoints)
+    cache_invalidation.publish(db, CACHE_NAMESPACE, endpoints)
+
+
+def stats() -> Dict[str, Any]:
+    """Hit/miss counters and entries per endpoint of both tiers"""
+    return {
+        "history": {**_history.stats(), "entries": dict(Counter(key[0] for key in _history.keys()))},
+        "recent": {**_recent.stats(), "entries": dict(Counter(key[0] for key in _recent.keys()))},
+        "ttl_seconds": settings.REPORT_CACHE_TTL_SECONDS,
+        "history_ttl_seconds": settings.REPORT_HISTORY_TTL_SECONDS,
+        "invalidations": _invalidations,
+    }
@@ -0,0 +1,111 @@
+"""
+Rolling order service-time statistics, kept in memory per worker
+
+Each status transition contributes durations to up to three metrics:
+queue (created -> in_progress), prep (in_progress -> completed) and total
+(created -> completed). Samples older than SERVICE_METRICS_WINDOW_HOURS are
+dropped; p50/p95 are computed on read, overall, per local hour of day and
+per acting employee. The order_events table is the durable record.
+"""
+
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, Hashable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+
+METRICS = ("queue", "prep", "total")
+MAX_SAMPLES = 5_000  # per series, bounds memory on busy days
+
+_lock = threading.Lock()
+# (metric, dimension, value) -> deque of (monotonic time, seconds)
+_series: Dict[Tuple[str, str, Hashable], Deque[Tuple[float, float]]] = defaultdict(
+    lambda: deque(maxlen=MAX_SAMPLES)
+)
+
+
+def _window() -> float:
+    return settings.SERVICE_METRICS_WINDOW_HOURS * 3600
+
+
+def _prune(samples: Deque[Tuple[float, float]], now: float) -> None:
+    cutoff = now - _window()
+    while samples and samples[0][0] < cutoff:
+        samples.popleft()
+
+
+def record_transition(
+    to_status: str,
+    since_created: Optional[timedelta],
+    since_started: Optional[timedelta],
+    employee_id: Optional[int],
+    at: Optional[datetime] = None,
+) -> None:
+    """Fold one order status transition into the rolling statistics"""
+    durations: Dict[str, timedelta] = {}
+    if to_status == "in_progress" and since_created is not None:
+        durations["queue"] = since_created
+    elif to_status == "completed":
+        if since_created is not None:
+            durations["total"] = since_created
+        if since_started is not None:
+            durations["prep"] = since_started
+    if not durations:
+        return
+
+    hour = (at or datetime.now(timezone.utc)).astimezone(ZoneInfo(settings.REPORT_TIMEZONE)).hour
+    now = time.monotonic()
+    with _lock:
+        for metric, duration in durations.items():
+            sample = (now, duration.total_seconds())
+            _series[(metric, "overall", None)].append(sample)
+            _series[(metric, "hour", hour)].append(sample)
+            if employee_id is not None:
+                _series[(metric, "employee", employee_id)].append(sample)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, math.ceil(q * len(sorted_values)) - 1)
+    return round(sorted_values[index], 1)
+
+
+def _summary(samples: Deque[Tuple[float, float]]) -> Dict[str, Any]:
+    values = sorted(seconds for _, seconds in samples)
+    return {
+        "count": len(values),
+        "p50_seconds": _percentile(values, 0.50),
+        "p95_seconds": _percentile(values, 0.95),
+    }
+
+
+def snapshot() -> Dict[str, Any]:
+    """p50/p95 per metric: overall, by hour of day and by employee"""
+    now = time.monotonic()
+    result: Dict[str, Any] = {
+        "window_hours": settings.SERVICE_METRICS_WINDOW_HOURS,
+        "timezone": settings.REPORT_TIMEZONE,
+        "overall": {},
+        "by_hour": defaultdict(dict),
+        "by_employee": defaultdict(dict),
+    }
+    with _lock:
+        for (metric, dimension, value), samples in list(_series.items()):
+            _prune(samples, now)
+            if not samples:
+                del _series[(metric, dimension, value)]
+                continue
+            summary = _summary(samples)
+            if dimension == "overall":
+                result["overall"][metric] = summary
+            elif dimension == "hour":
+                result["by_hour"][f"{value:02d}"][metric] = summary
+            else:
+                result["by_employee"][str(value)][metric] = summary
+    result["by_hour"] = dict(sorted(result["by_hour"].items()))
+    result["by_employee"] = dict(result["by_employee"])
+    return result
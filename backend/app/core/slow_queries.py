@@ -0,0 +1,160 @@
+"""
+Slow-query log with sampled EXPLAIN capture
+
+Statements slower than SLOW_QUERY_MS are kept in a per-worker ring buffer
+with their duration, the route that issued them and their parameters reduced
+to types (values may be personal data). For a SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+fraction of them, a background thread re-runs the statement as
+EXPLAIN (ANALYZE, BUFFERS) on a side connection. Only single SELECT/WITH
+statements are explained, inside a READ ONLY transaction that is rolled back.
+"""
+
+import itertools
+import queue
+import random
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.logging import logger
+
+MAX_STATEMENT_CHARS = 4_000
+EXPLAIN_QUEUE_SIZE = 16  # pending EXPLAINs beyond this are skipped, not queued
+
+_lock = threading.Lock()
+_entries: Deque[Dict[str, Any]] = deque(maxlen=settings.SLOW_QUERY_LOG_SIZE)
+_ids = itertools.count(1)
+# Engine that ran the query -> sync engine to EXPLAIN on (async engines map to
+# their sync twin, since the side connection is used from a plain thread)
+_explain_engines: Dict[int, Engine] = {}
+_explain_queue: "queue.Queue" = queue.Queue(maxsize=EXPLAIN_QUEUE_SIZE)
+_explainer: Optional["_Explainer"] = None
+
+
+def explain_on(query_engine: Engine, explain_engine: Engine) -> None:
+    """Run sampled EXPLAINs of statements from query_engine on explain_engine"""
+    _explain_engines[id(query_engine)] = explain_engine
+
+
+def _redact(parameters: Any) -> Any:
+    """Keep parameter names and types, drop the values"""
+    if isinstance(parameters, dict):
+        return {key: _redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f"<{len(parameters)} parameter sets>"
+        return [_redact(value) for value in parameters]
+    if parameters is None:
+        return None
+    return f"<{type(parameters).__name__}>"
+
+
+def _explainable(statement: str) -> bool:
+    head = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return head in ("SELECT", "WITH") and ";" not in statement.rstrip().rstrip(";")
+
+
+def observe(conn, statement: str, parameters: Any, executemany: bool, seconds: float, route: Optional[str]) -> None:
+    """Record the statement if it was slow (called from the cursor-execute hook)"""
+    if settings.SLOW_QUERY_MS <= 0 or seconds * 1000 < settings.SLOW_QUERY_MS:
+        return
+    if threading.current_thread() is _explainer:
+        return
+
+    entry = {
+        "id": next(_ids),
+        "at": datetime.now(timezone.utc).isoformat(),
+        "duration_ms": round(seconds * 1000, 2),
+        "route": route,
+        "statement": " ".join(statement.split())[:MAX_STATEMENT_CHARS],
+        "parameters": _redact(parameters),
+        "explain": None,
+    }
+    explain_engine = _explain_engines.get(id(conn.engine))
+    if (
+        explain_engine is not None
+        and _explainer is not None
+        and not executemany
+        and _explainable(statement)
+        and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+    ):
+        try:
+            _explain_queue.put_nowait((entry, explain_engine, statement, parameters))
+            entry["explain"] = "pending"
+        except queue.Full:
+            pass
+    with _lock:
+        _entries.append(entry)
+
+
+def _explain(engine: Engine, statement: str, parameters: Any) -> str:
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SET TRANSACTION READ ONLY")
+        conn.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {int(settings.SLOW_QUERY_EXPLAIN_TIMEOUT_MS)}"
+        )
+        rows = conn.exec_driver_sql(
+            "EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters or None
+        ).fetchall()
+        conn.rollback()
+    return "\n".join(row[0] for row in rows)
+
+
+class _Explainer(threading.Thread):
+    """Background thread running queued EXPLAINs one at a time"""
+
+    def __init__(self):
+        super().__init__(name="slow-query-explainer", daemon=True)
+
+    def run(self) -> None:
+        while True:
+            item = _explain_queue.get()
+            if item is None:
+                return
+            entry, engine, statement, parameters = item
+            try:
+                plan = _explain(engine, statement, parameters)
+            except Exception as e:
+                # The driver error only; SQLAlchemy's message would repeat the parameter values
+                plan = f"EXPLAIN failed: {str(getattr(e, 'orig', None) or e)}"
+                logger.warning(f"Slow-query {plan}")
+            with _lock:
+                entry["explain"] = plan
+
+
+def start_explainer() -> None:
+    """Start this worker's EXPLAIN thread (idempotent)"""
+    global _explainer
+    if _explainer is None:
+        _explainer = _Explainer()
+        _explainer.start()
+
+
+def stop_explainer() -> None:
+    """Stop this worker's EXPLAIN thread"""
+    global _explainer
+    if _explainer is not None:
+        try:
+            _explain_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        _explainer = None
+
+
+def entries(limit: int = 50, route: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Recorded slow statements, newest first"""
+    with _lock:
+        selected = [dict(entry) for entry in reversed(_entries) if route is None or entry["route"] == route]
+    return selected[:limit]
+
+
+def clear() -> int:
+    """Empty the ring buffer; returns how many entries were dropped"""
+    with _lock:
+        count = len(_entries)
+        _entries.clear()
+    return count
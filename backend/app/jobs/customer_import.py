@@ -0,0 +1,185 @@
+"""
+Streaming bulk customer import
+
+Rows are read one at a time from the CSV, validated with CustomerCreate and
+buffered up to a fixed chunk size. Each chunk is COPYed into a temporary
+staging table and merged into customers with ON CONFLICT DO NOTHING, so the
+unique phone/email indexes do the deduplication. Invalid and duplicate rows
+are written to the error report as they are found; memory use is bounded by
+the chunk size, not the file size. Chunks commit as they go, so a file that
+stops decoding part way keeps the rows before that point and the report says
+where the import stopped.
+"""
+
+import csv
+from typing import Any, Dict, Iterable, List, TextIO, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.logging import logger
+from app.schemas.customer import CustomerCreate
+
+CHUNK_SIZE = 5_000
+REPORT_HEADER = ["line", "error"]
+COLUMNS = ("name", "phone", "email", "loyalty_points")
+
+_CREATE_STAGING = text(
+    """
+    CREATE TEMP TABLE customer_import_staging (
+        line_no INTEGER NOT NULL,
+        name VARCHAR(100) NOT NULL,
+        phone VARCHAR(20),
+        email VARCHAR(100),
+        loyalty_points DECIMAL(10, 2) NOT NULL
+    ) ON COMMIT DROP
+    """
+)
+
+# Insert staged rows; report those that were not inserted because their
+# phone or email already exists (in the table or earlier in the file).
+# RETURNING cannot see line_no, so inserted rows are matched back by value:
+# rows are inserted in line order, so of n identical staged lines of which k
+# were inserted, the first k went in and every later line is reported.
+_MERGE_STAGING = text(
+    """
+    WITH inserted AS (
+        INSERT INTO customers (name, phone, email, loyalty_points, is_deleted)
+        SELECT name, phone, email, loyalty_points, FALSE
+        FROM customer_import_staging
+        ORDER BY line_no
+        ON CONFLICT DO NOTHING
+        RETURNING name, phone, email
+    ),
+    inserted_counts AS (
+        SELECT name, phone, email, COUNT(*) AS n
+        FROM inserted
+        GROUP BY name, phone, email
+    ),
+    staged AS (
+        SELECT line_no, name, phone, email,
+               ROW_NUMBER() OVER (PARTITION BY name, phone, email ORDER BY line_no) AS occurrence
+        FROM customer_import_staging
+    )
+    SELECT s.line_no, (SELECT COUNT(*) FROM inserted) AS inserted_count
+    FROM staged s
+    LEFT JOIN inserted_counts i
+      ON i.name = s.name
+     AND i.phone IS NOT DISTINCT FROM s.phone
+     AND i.email IS NOT DISTINCT FROM s.email
+    WHERE s.occurrence > COALESCE(i.n, 0)
+    ORDER BY s.line_no
+    """
+)
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in error.errors()
+    )
+
+
+class _ChunkMerger:
+    """COPY a chunk of validated rows into staging and merge into customers"""
+
+    def __init__(self, db: Session, report: Any):
+        self.db = db
+        self.report = report
+        self.inserted = 0
+        self.duplicates = 0
+
+    def flush(self, rows: List[Tuple]) -> None:
+        if not rows:
+            return
+        try:
+            self.db.execute(_CREATE_STAGING)
+            cursor = self.db.connection().connection.cursor()
+            try:
+                with cursor.copy(
+                    "COPY customer_import_staging (line_no, name, phone, email, loyalty_points) FROM STDIN"
+                ) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+            finally:
+                cursor.close()
+
+            inserted_count = None
+            for line_no, chunk_inserted in self.db.execute(_MERGE_STAGING):
+                inserted_count = chunk_inserted
+                self.duplicates += 1
+                self.report.writerow([line_no, "duplicate phone or email"])
+            self.inserted += len(rows) if inserted_count is None else inserted_count
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+
+def import_customers(
+    db: Session, lines: Iterable[str], report: TextIO, chunk_size: int = CHUNK_SIZE
+) -> Dict[str, int]:
+    """Import customers from CSV lines (header: name,phone,email[,loyalty_points])
+
+    Writes one "line,error" record per rejected row to report and returns
+    the inserted / duplicate / invalid counts, plus complete=False when the
+    input stopped decoding part way (rows before that point are imported).
+    A decoding error in the header is raised, since nothing was imported.
+    """
+    reader = csv.DictReader(lines)
+    report_writer = csv.writer(report)
+    report_writer.writerow(REPORT_HEADER)
+
+    if not reader.fieldnames or "name" not in reader.fieldnames:
+        report_writer.writerow([1, "missing required header column: name"])
+        return {"inserted": 0, "duplicates": 0, "invalid": 1, "complete": True}
+
+    merger = _ChunkMerger(db, report_writer)
+    invalid = 0
+    complete = True
+    chunk: List[Tuple] = []
+
+    while True:
+        try:
+            record = next(reader)
+        except StopIteration:
+            break
+        except UnicodeDecodeError:
+            complete = False
+            invalid += 1
+            report_writer.writerow(
+                [reader.line_num + 1, "not valid UTF-8; import stopped, this and later lines were not imported"]
+            )
+            break
+        # Header is line 1; DictReader counts physical lines, including quoted newlines
+        line_no = reader.line_num
+        values = {
+            column: (record.get(column) or "").strip() or None
+            for column in COLUMNS
+        }
+        if values["loyalty_points"] is None:
+            values["loyalty_points"] = 0
+        try:
+            customer = CustomerCreate(**values)
+        except ValidationError as e:
+            invalid += 1
+            report_writer.writerow([line_no, _validation_message(e)])
+            continue
+
+        chunk.append(
+            (line_no, customer.name, customer.phone, customer.email, customer.loyalty_points)
+        )
+        if len(chunk) >= chunk_size:
+            merger.flush(chunk)
+            chunk = []
+
+    merger.flush(chunk)
+
+    summary = {
+        "inserted": merger.inserted,
+        "duplicates": merger.duplicates,
+        "invalid": invalid,
+        "complete": complete,
+    }
+    logger.info(f"Customer import finished: {summary}")
+    return summary
@@ -0,0 +1,258 @@
+"""
+Columnar Parquet export for offline analytics
+
+orders, order_details and payments are written as typed Parquet files
+(DECIMAL stays decimal128, dates stay date32), partitioned by order month in
+a Hive layout (<table>/month=YYYY-MM/part.parquet) that pandas, DuckDB and
+Arrow read directly. Each partition is built from record batches streamed off
+a server-side cursor and swapped in atomically.
+
+Incremental runs rewrite only the months with rows changed since the previous
+run's watermark: the months the changed orders are in now, and the exported
+months that still hold them (an order whose date moved to another month).
+A month left without orders has its partitions removed, and a full run also
+removes partitions of months that no longer have any orders. inventory has no
+history table, so it is exported as a current snapshot on every run.
+"""
+
+import json
+import os
+import shutil
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.logging import logger
+
+BATCH_SIZE = 50_000
+STATE_FILE = "_export_state.json"
+
+MONEY = pa.decimal128(10, 2)
+TIMESTAMP = pa.timestamp("us", tz="UTC")
+
+_MONTH_FILTER = "o.order_date >= :start_date AND o.order_date < :end_date AND o.is_deleted = FALSE"
+
+PARTITIONED_TABLES = {
+    "orders": (
+        f"""
+        SELECT o.order_id, o.customer_id, o.order_date, o.total_amount, o.status,
+               o.created_at, o.updated_at
+        FROM orders o
+        WHERE {_MONTH_FILTER}
+        ORDER BY o.order_id
+        """,
+        pa.schema([
+            ("order_id", pa.int32()),
+            ("customer_id", pa.int32()),
+            ("order_date", pa.date32()),
+            ("total_amount", MONEY),
+            ("status", pa.string()),
+            ("created_at", TIMESTAMP),
+            ("updated_at", TIMESTAMP),
+        ]),
+    ),
+    "order_details": (
+        f"""
+        SELECT od.order_id, od.item_id, od.quantity, od.unit_price, od.subtotal
+        FROM order_details od
+        JOIN orders o ON o.order_id = od.order_id
+        WHERE {_MONTH_FILTER} AND od.is_deleted = FALSE
+        ORDER BY od.order_id, od.item_id
+        """,
+        pa.schema([
+            ("order_id", pa.int32()),
+            ("item_id", pa.int32()),
+            ("quantity", pa.int32()),
+            ("unit_price", MONEY),
+            ("subtotal", MONEY),
+        ]),
+    ),
+    "payments": (
+        f"""
+        SELECT p.payment_id, p.order_id, p.payment_method, p.amount, p.status, p.payment_date
+        FROM payments p
+        JOIN orders o ON o.order_id = p.order_id
+        WHERE {_MONTH_FILTER} AND p.is_deleted = FALSE
+        ORDER BY p.payment_id
+        """,
+        pa.schema([
+            ("payment_id", pa.int32()),
+            ("order_id", pa.int32()),
+            ("payment_method", pa.string()),
+            ("amount", MONEY),
+            ("status", pa.string()),
+            ("payment_date", TIMESTAMP),
+        ]),
+    ),
+}
+
+INVENTORY = (
+    """
+    SELECT inventory_id, ingredient_id, quantity, min_threshold, employee_id, last_updated
+    FROM inventory
+    WHERE is_deleted = FALSE
+    ORDER BY inventory_id
+    """,
+    pa.schema([
+        ("inventory_id", pa.int32()),
+        ("ingredient_id", pa.int32()),
+        ("quantity", MONEY),
+        ("min_threshold", MONEY),
+        ("employee_id", pa.int32()),
+        ("last_updated", TIMESTAMP),
+    ]),
+)
+
+# Orders touched by any order, line item or payment change since the watermark
+# (soft deletes bump updated_at too), with the month each one is in now
+_CHANGED_ORDERS = text(
+    """
+    SELECT o.order_id, date_trunc('month', o.order_date)::date AS month
+    FROM orders o
+    WHERE o.updated_at > :since
+       OR EXISTS (SELECT 1 FROM order_details od WHERE od.order_id = o.order_id AND od.updated_at > :since)
+       OR EXISTS (SELECT 1 FROM payments p WHERE p.order_id = o.order_id AND p.updated_at > :since)
+    """
+)
+
+_ALL_MONTHS = text(
+    "SELECT DISTINCT date_trunc('month', order_date)::date AS month FROM orders ORDER BY month"
+)
+
+# Rows written by transactions still open now may carry an earlier updated_at
+# once they commit, so the next watermark starts at the oldest open transaction
+_WATERMARK = text(
+    """
+    SELECT LEAST(now(), COALESCE(MIN(xact_start), now()))
+    FROM pg_stat_activity
+    WHERE datname = current_database() AND xact_start IS NOT NULL
+    """
+)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _partition_dir(out_dir: Path, table: str, month: date) -> Path:
+    return out_dir / table / f"month={month:%Y-%m}"
+
+
+def _exported_months(out_dir: Path) -> List[date]:
+    """Months that have an exported orders partition"""
+    return sorted(
+        datetime.strptime(path.name[len("month="):], "%Y-%m").date()
+        for path in (out_dir / "orders").glob("month=*")
+    )
+
+
+def _months_holding(out_dir: Path, order_ids: Iterable[int]) -> Set[date]:
+    """Exported months whose orders partition contains any of order_ids"""
+    value_set = pa.array(sorted(set(order_ids)), type=pa.int32())
+    if not len(value_set):
+        return set()
+    months = set()
+    for month in _exported_months(out_dir):
+        path = _partition_dir(out_dir, "orders", month) / "part.parquet"
+        if not path.exists():
+            continue
+        exported = pq.read_table(path, columns=["order_id"]).column("order_id")
+        if pc.any(pc.is_in(exported, value_set=value_set)).as_py():
+            months.add(month)
+    return months
+
+
+def _remove_month(out_dir: Path, month: date) -> None:
+    for name in PARTITIONED_TABLES:
+        shutil.rmtree(_partition_dir(out_dir, name, month), ignore_errors=True)
+
+
+def _write_table(
+    db: Session, sql: str, schema: pa.Schema, path: Path, params: dict, batch_size: int
+) -> int:
+    """Stream a query into one Parquet file, one record batch per fetch"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    rows = 0
+    result = db.execute(
+        text(sql).execution_options(stream_results=True, yield_per=batch_size), params
+    )
+    with pq.ParquetWriter(tmp_path, schema, compression="zstd") as writer:
+        for chunk in result.partitions():
+            columns = list(zip(*chunk))
+            writer.write_batch(
+                pa.RecordBatch.from_arrays(
+                    [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+                    schema=schema,
+                )
+            )
+            rows += len(chunk)
+    os.replace(tmp_path, path)
+    return rows
+
+
+def _load_state(out_dir: Path) -> Dict[str, str]:
+    try:
+        return json.loads((out_dir / STATE_FILE).read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def export_parquet(
+    db: Session, out_dir: Path, full: bool = False, batch_size: int = BATCH_SIZE
+) -> Dict[str, int]:
+    """Export to Parquet under out_dir; incremental unless full or first run
+
+    Returns the number of rows written per table.
+    """
+    out_dir = Path(out_dir)
+    state = _load_state(out_dir)
+    watermark: datetime = db.execute(_WATERMARK).scalar()
+
+    since: Optional[datetime] = None
+    if not full and state.get("watermark"):
+        since = datetime.fromisoformat(state["watermark"])
+    if since is None:
+        months: List[date] = list(db.execute(_ALL_MONTHS).scalars())
+        for month in set(_exported_months(out_dir)) - set(months):
+            _remove_month(out_dir, month)
+            logger.info(f"Parquet export: removed month {month:%Y-%m}, it has no orders")
+    else:
+        changed = db.execute(_CHANGED_ORDERS, {"since": since}).all()
+        # Also the months the changed orders were exported in, in case they moved
+        months = sorted(
+            {month for _, month in changed}
+            | _months_holding(out_dir, (order_id for order_id, _ in changed))
+        )
+
+    written = {name: 0 for name in PARTITIONED_TABLES}
+    for month in months:
+        params = {"start_date": month, "end_date": _next_month(month)}
+        month_rows = {}
+        for name, (sql, schema) in PARTITIONED_TABLES.items():
+            path = _partition_dir(out_dir, name, month) / "part.parquet"
+            month_rows[name] = _write_table(db, sql, schema, path, params, batch_size)
+            written[name] += month_rows[name]
+        db.rollback()  # end the read transaction between months
+        if month_rows["orders"] == 0:
+            _remove_month(out_dir, month)
+            logger.info(f"Parquet export: removed month {month:%Y-%m}, it has no orders")
+        else:
+            logger.info(f"Parquet export: wrote month {month:%Y-%m}")
+
+    sql, schema = INVENTORY
+    written["inventory"] = _write_table(
+        db, sql, schema, out_dir / "inventory" / "snapshot.parquet", {}, batch_size
+    )
+    db.rollback()
+
+    state = {"watermark": watermark.isoformat(), "months_written": [f"{m:%Y-%m}" for m in months]}
+    (out_dir / STATE_FILE).write_text(json.dumps(state, indent=2))
+    logger.info(f"Parquet export finished: {len(months)} months, {written}")
+    return written
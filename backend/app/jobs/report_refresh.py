@@ -0,0 +1,102 @@
+"""
+Refresh of materialized report views
+
+Views are refreshed CONCURRENTLY, so readers keep seeing the previous
+contents while the refresh runs. A transaction-level advisory lock lets only
+one worker refresh at a time; the others skip that round. Each refresh
+records its time in report_refreshes for freshness reporting.
+"""
+
+import threading
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core import report_cache
+from app.core.database import SessionLocal
+from app.core.logging import logger
+
+# View -> report cache endpoints computed from it
+VIEWS = {"item_sales_daily": ("top-items",)}
+
+_refresher: Optional["_Refresher"] = None
+
+
+def refresh_view(db: Session, view_name: str) -> Optional[datetime]:
+    """Refresh one materialized view; returns its refresh time, or None if skipped"""
+    if view_name not in VIEWS:
+        raise ValueError(f"Unknown report view: {view_name}")
+    try:
+        locked = db.execute(
+            text("SELECT pg_try_advisory_xact_lock(hashtext(:name))"), {"name": view_name}
+        ).scalar()
+        if not locked:
+            db.rollback()
+            logger.info(f"Skipping refresh of {view_name}: already running elsewhere")
+            return None
+        db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view_name}"))
+        refreshed_at = db.execute(
+            text(
+                """
+                INSERT INTO report_refreshes (view_name, refreshed_at)
+                VALUES (:name, now())
+                ON CONFLICT (view_name) DO UPDATE SET refreshed_at = excluded.refreshed_at
+                RETURNING refreshed_at
+                """
+            ),
+            {"name": view_name},
+        ).scalar()
+        report_cache.invalidate(db, VIEWS[view_name])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    logger.info(f"Refreshed {view_name}")
+    return refreshed_at
+
+
+def refresh_all(db: Session) -> None:
+    """Refresh every materialized report view"""
+    for view_name in VIEWS:
+        refresh_view(db, view_name)
+
+
+class _Refresher(threading.Thread):
+    """Background thread refreshing report views on a fixed interval"""
+
+    def __init__(self, interval: float):
+        super().__init__(name="report-view-refresher", daemon=True)
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            db = SessionLocal()
+            try:
+                refresh_all(db)
+            except Exception as e:
+                logger.error(f"Report view refresh failed: {str(e)}")
+            finally:
+                db.close()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def start_refresher(interval: float) -> None:
+    """Start this worker's refresher thread (idempotent)"""
+    global _refresher
+    if _refresher is None:
+        _refresher = _Refresher(interval)
+        _refresher.start()
+        logger.info(f"Report view refresher started (every {interval}s)")
+
+
+def stop_refresher() -> None:
+    """Stop this worker's refresher thread"""
+    global _refresher
+    if _refresher is not None:
+        _refresher.stop()
+        _refresher = None
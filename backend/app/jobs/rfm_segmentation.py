@@ -0,0 +1,190 @@
+"""
+RFM (recency / frequency / monetary) customer segmentation batch job
+
+Completed orders are streamed through a server-side cursor and folded into
+dense per-customer NumPy accumulators chunk by chunk, so memory depends on
+the number of customers, not on the number of orders. Scores are rank
+quintiles over the whole population; segments are written back with a bulk
+upsert.
+"""
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Dict, Optional
+
+import numpy as np
+from sqlalchemy import and_, delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.logging import logger
+from app.models.customer_segment import CustomerSegment
+from app.models.order import Order
+
+STREAM_CHUNK_SIZE = 50_000
+UPSERT_BATCH_SIZE = 5_000
+
+SEGMENTS = [
+    "Champions",
+    "Loyal",
+    "Potential Loyalist",
+    "New",
+    "At Risk",
+    "Hibernating",
+    "Needs Attention",
+]
+
+
+class _Accumulator:
+    """Dense per-customer_id arrays, grown as larger ids appear"""
+
+    def __init__(self, size: int = 1024):
+        self.frequency = np.zeros(size, dtype=np.int64)
+        self.monetary = np.zeros(size, dtype=np.float64)
+        self.last_day = np.zeros(size, dtype=np.int64)  # proleptic ordinal, 0 = never
+
+    def _ensure(self, max_id: int) -> None:
+        size = len(self.frequency)
+        if max_id < size:
+            return
+        new_size = max(max_id + 1, size * 2)
+        for name in ("frequency", "monetary", "last_day"):
+            old = getattr(self, name)
+            grown = np.zeros(new_size, dtype=old.dtype)
+            grown[:size] = old
+            setattr(self, name, grown)
+
+    def add(self, customer_ids: np.ndarray, days: np.ndarray, amounts: np.ndarray) -> None:
+        self._ensure(int(customer_ids.max()))
+        np.add.at(self.frequency, customer_ids, 1)
+        np.add.at(self.monetary, customer_ids, amounts)
+        np.maximum.at(self.last_day, customer_ids, days)
+
+
+def quintile_scores(values: np.ndarray) -> np.ndarray:
+    """Score each value 1-5 by population quintile of its rank (5 = highest)
+
+    Tied values share their average rank, so a large tie lands in the
+    quintile around its middle instead of all jumping to the top score.
+    """
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    average_ranks = np.cumsum(counts) - (counts - 1) / 2  # 1-based
+    percentiles = (average_ranks[inverse.ravel()] - 0.5) / len(values)
+    return np.clip(np.floor(percentiles * 5) + 1, 1, 5).astype(np.int16)
+
+
+def assign_segments(r: np.ndarray, f: np.ndarray) -> np.ndarray:
+    """Map recency/frequency scores to named segments"""
+    conditions = [
+        (r >= 4) & (f >= 4),
+        (r >= 3) & (f >= 4),
+        (r >= 4) & (f >= 2),
+        (r >= 4),
+        (r <= 2) & (f >= 3),
+        (r <= 2),
+    ]
+    return np.select(conditions, SEGMENTS[:-1], default=SEGMENTS[-1])
+
+
+def _stream_orders(db: Session, accumulator: _Accumulator) -> int:
+    stmt = (
+        select(Order.customer_id, Order.order_date, Order.total_amount)
+        .where(
+            and_(
+                Order.customer_id.isnot(None),
+                Order.status == "completed",
+                Order.is_deleted == False,
+            )
+        )
+        .execution_options(stream_results=True, yield_per=STREAM_CHUNK_SIZE)
+    )
+    total = 0
+    for chunk in db.execute(stmt).partitions():
+        customer_ids = np.fromiter((row[0] for row in chunk), dtype=np.int64, count=len(chunk))
+        days = np.fromiter((row[1].toordinal() for row in chunk), dtype=np.int64, count=len(chunk))
+        amounts = np.fromiter((float(row[2]) for row in chunk), dtype=np.float64, count=len(chunk))
+        accumulator.add(customer_ids, days, amounts)
+        total += len(chunk)
+    return total
+
+
+def run_rfm_segmentation(db: Session, as_of: Optional[date] = None) -> Dict[str, int]:
+    """Recompute RFM segments for every customer with completed orders
+
+    Returns the number of customers per segment.
+    """
+    as_of = as_of or date.today()
+    started_at = datetime.now(timezone.utc)
+
+    accumulator = _Accumulator()
+    order_count = _stream_orders(db, accumulator)
+
+    customer_ids = np.nonzero(accumulator.frequency)[0]
+    if len(customer_ids) == 0:
+        logger.info("RFM segmentation: no completed customer orders")
+        return {}
+
+    recency = as_of.toordinal() - accumulator.last_day[customer_ids]
+    frequency = accumulator.frequency[customer_ids]
+    monetary = np.round(accumulator.monetary[customer_ids], 2)
+
+    # Fewer days since last visit is better, so recency scores are inverted
+    r_scores = 6 - quintile_scores(recency)
+    f_scores = quintile_scores(frequency)
+    m_scores = quintile_scores(monetary)
+    segments = assign_segments(r_scores, f_scores)
+
+    stmt = insert(CustomerSegment)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CustomerSegment.customer_id],
+        set_={
+            column: stmt.excluded[column]
+            for column in (
+                "recency_days",
+                "frequency",
+                "monetary",
+                "r_score",
+                "f_score",
+                "m_score",
+                "segment",
+                "computed_at",
+            )
+        },
+    )
+    for start in range(0, len(customer_ids), UPSERT_BATCH_SIZE):
+        end = start + UPSERT_BATCH_SIZE
+        rows = [
+            {
+                "customer_id": int(customer_id),
+                "recency_days": int(r_days),
+                "frequency": int(freq),
+                "monetary": Decimal(f"{amount:.2f}"),
+                "r_score": int(r),
+                "f_score": int(f),
+                "m_score": int(m),
+                "segment": str(segment),
+                "computed_at": started_at,
+            }
+            for customer_id, r_days, freq, amount, r, f, m, segment in zip(
+                customer_ids[start:end],
+                recency[start:end],
+                frequency[start:end],
+                monetary[start:end],
+                r_scores[start:end],
+                f_scores[start:end],
+                m_scores[start:end],
+                segments[start:end],
+            )
+        ]
+        db.execute(stmt, rows)
+
+    # Customers without completed orders any more drop out of segmentation
+    db.execute(delete(CustomerSegment).where(CustomerSegment.computed_at < started_at))
+    db.commit()
+
+    names, counts = np.unique(segments, return_counts=True)
+    summary = {str(name): int(count) for name, count in zip(names, counts)}
+    logger.info(
+        f"RFM segmentation: {order_count} orders, {len(customer_ids)} customers, {summary}"
+    )
+    return summary
@@ -1,7 +1,12 @@
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.core.logging import logger
+from app.core import cache_invalidation, compression, metrics, query_counter, replica, slow_queries
+from app.core.database import engine, async_engine, replica_engine
+from app.jobs import report_refresh
 from app.api import (
     employees,
     customers,
@@ -13,6 +18,9 @@ from app.api import (
     ingredients,
     recipes,
     stock,
+    reports,
+    exports,
+    admin,
 )
 
 # Initialize FastAPI app
@@ -51,14 +59,32 @@ def get_cors_headers():
     return [header.strip() for header in headers_str.split(",") if header.strip()]
 
 
+# The middleware added last runs first. From the outside in: metrics,
+# compression, CORS, read-your-writes, query counting. CORS wraps the two
+# below it, so their response headers are covered by expose_headers.
+app.middleware("http")(query_counter.count_queries)
+if replica_engine is not None:
+    app.middleware("http")(replica.read_your_writes)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=get_cors_origins(),
     allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
     allow_methods=get_cors_methods(),
     allow_headers=get_cors_headers(),
+    expose_headers=[
+        replica.PRIMARY_UNTIL_HEADER,
+        query_counter.QUERIES_HEADER,
+        query_counter.TIME_HEADER,
+    ],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(compression.CompressionMiddleware)
+
+# Outermost, so request latency includes every other middleware
+app.add_middleware(metrics.MetricsMiddleware)
+
 # Register routers
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(employees.router, prefix="/api/v1")
@@ -70,6 +96,9 @@ app.include_router(inventory.router, prefix="/api/v1")
 app.include_router(ingredients.router, prefix="/api/v1")
 app.include_router(recipes.router, prefix="/api/v1")
 app.include_router(stock.router, prefix="/api/v1")
+app.include_router(reports.router, prefix="/api/v1")
+app.include_router(exports.router, prefix="/api/v1")
+app.include_router(admin.router, prefix="/api/v1")
 
 
 @app.on_event("startup")
@@ -77,12 +106,30 @@ async def startup_event():
     """Startup event handler"""
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Debug mode: {settings.DEBUG}")
+    # Sync (def) route handlers run in AnyIO's thread pool; size it explicitly
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_TOKENS
+    if settings.CACHE_INVALIDATION_LISTENER:
+        conninfo = engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        cache_invalidation.start_listener(conninfo)
+    if settings.REPORT_REFRESH_INTERVAL_SECONDS > 0:
+        report_refresh.start_refresher(settings.REPORT_REFRESH_INTERVAL_SECONDS)
+    if replica_engine is not None:
+        replica.start_monitor(replica_engine)
+    if settings.SLOW_QUERY_MS > 0 and settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE > 0:
+        slow_queries.start_explainer()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown event handler"""
     logger.info(f"Shutting down {settings.APP_NAME}")
+    cache_invalidation.stop_listener()
+    report_refresh.stop_refresher()
+    replica.stop_monitor()
+    slow_queries.stop_explainer()
+    await async_engine.dispose()
 
 
 @app.get("/")
@@ -102,6 +149,12 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus metrics of this worker"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     import uvicorn
 
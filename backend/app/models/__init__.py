@@ -1,22 +1,34 @@
 from app.models.base import Base
 from app.models.employee import Employee
 from app.models.customer import Customer
+from app.models.customer_stats import CustomerStats
+from app.models.customer_segment import CustomerSegment
 from app.models.ingredient import Ingredient
 from app.models.menu_item import MenuItem
 from app.models.inventory import Inventory
 from app.models.order import Order, OrderDetail
+from app.models.order_event import OrderEvent
 from app.models.payment import Payment
+from app.models.daily_sales import DailySales
+from app.models.hourly_sales import HourlySales
+from app.models.report_refresh import ReportRefresh
 from app.models.junction_tables import MenuItemIngredient
 
 __all__ = [
     "Base",
     "Employee",
     "Customer",
+    "CustomerStats",
+    "CustomerSegment",
     "Ingredient",
     "MenuItem",
     "Inventory",
     "Order",
     "OrderDetail",
+    "OrderEvent",
     "Payment",
+    "DailySales",
+    "HourlySales",
+    "ReportRefresh",
     "MenuItemIngredient",
 ]
@@ -14,5 +14,7 @@ class Customer(BaseModel):
 
     # Relationships
     orders = relationship("Order", back_populates="customer")
+    stats = relationship("CustomerStats", back_populates="customer", uselist=False)
+    segment = relationship("CustomerSegment", back_populates="customer", uselist=False)
 
     __table_args__ = (Index("idx_customer_phone_email", "phone", "email"),)
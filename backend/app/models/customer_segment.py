@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, Numeric, String, SmallInteger, DateTime, ForeignKey, Index, func
+from sqlalchemy.orm import relationship
+from app.core.database import Base
+
+
+class CustomerSegment(Base):
+    """RFM (recency / frequency / monetary) segment, written by the batch job"""
+
+    __tablename__ = "customer_segments"
+
+    customer_id = Column(
+        Integer,
+        ForeignKey("customers.customer_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    recency_days = Column(Integer, nullable=False)
+    frequency = Column(Integer, nullable=False)
+    monetary = Column(Numeric(12, 2), nullable=False)
+    r_score = Column(SmallInteger, nullable=False)  # 1-5, 5 = most recent
+    f_score = Column(SmallInteger, nullable=False)
+    m_score = Column(SmallInteger, nullable=False)
+    segment = Column(String(30), nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # Relationships
+    customer = relationship("Customer", back_populates="segment")
+
+    __table_args__ = (Index("idx_customer_segments_segment", "segment"),)
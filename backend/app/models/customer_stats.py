@@ -0,0 +1,42 @@
+from decimal import Decimal
+from sqlalchemy import Column, Integer, Numeric, Date, DateTime, ForeignKey, Index, func
+from sqlalchemy.orm import relationship
+from app.core.database import Base
+
+
+class CustomerStats(Base):
+    """Per-customer lifetime rollup, maintained incrementally by order writes"""
+
+    __tablename__ = "customer_stats"
+
+    customer_id = Column(
+        Integer,
+        ForeignKey("customers.customer_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    visit_count = Column(Integer, default=0, nullable=False)  # non-cancelled orders
+    completed_count = Column(Integer, default=0, nullable=False)
+    lifetime_spend = Column(Numeric(12, 2), default=0, nullable=False)  # completed orders
+    last_visit_date = Column(Date, nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    # Relationships
+    customer = relationship("Customer", back_populates="stats")
+
+    @property
+    def average_ticket(self) -> Decimal:
+        """Average spend per completed order"""
+        if not self.completed_count:
+            return Decimal("0.00")
+        return (self.lifetime_spend / self.completed_count).quantize(Decimal("0.01"))
+
+    __table_args__ = (
+        Index("idx_customer_stats_lifetime_spend", "lifetime_spend"),
+        Index("idx_customer_stats_visit_count", "visit_count"),
+        Index("idx_customer_stats_last_visit_date", "last_visit_date"),
+    )
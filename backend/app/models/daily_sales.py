@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, Numeric, String, Date, DateTime, func
+from app.core.database import Base
+
+
+class DailySales(Base):
+    """Per-day sales rollup, maintained incrementally by order and payment writes"""
+
+    __tablename__ = "daily_sales"
+
+    order_date = Column(Date, primary_key=True)
+    status = Column(String(20), primary_key=True)
+    payment_method = Column(String(50), primary_key=True)  # first payment's method, or "unpaid"
+    order_count = Column(Integer, default=0, nullable=False)
+    total_amount = Column(Numeric(14, 2), default=0, nullable=False)  # sum of order totals
+    revenue = Column(Numeric(14, 2), default=0, nullable=False)  # amount paid, order total if unpaid
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
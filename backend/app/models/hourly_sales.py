@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, SmallInteger, Numeric, Date, DateTime, CheckConstraint, func
+from app.core.database import Base
+
+
+class HourlySales(Base):
+    """Per-day, per-hour rollup of non-cancelled orders, maintained with daily_sales"""
+
+    __tablename__ = "hourly_sales"
+
+    order_date = Column(Date, primary_key=True)
+    hour = Column(SmallInteger, primary_key=True)  # local hour of created_at (REPORT_TIMEZONE)
+    order_count = Column(Integer, default=0, nullable=False)
+    revenue = Column(Numeric(14, 2), default=0, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        CheckConstraint("hour BETWEEN 0 AND 23", name="check_hourly_sales_hour"),
+    )
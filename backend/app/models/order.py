@@ -26,7 +26,7 @@ class Order(BaseModel):
     total_amount = Column(Numeric(10, 2), nullable=False)
     status = Column(
         String(20), default="pending", nullable=False, index=True
-    )  # pending, completed, cancelled
+    )  # pending, in_progress, completed, cancelled
 
     # Relationships
     customer = relationship("Customer", back_populates="orders")
@@ -40,7 +40,7 @@ class Order(BaseModel):
     __table_args__ = (
         CheckConstraint("total_amount >= 0", name="check_total_amount_non_negative"),
         CheckConstraint(
-            "status IN ('pending', 'completed', 'cancelled')", name="check_order_status"
+            "status IN ('pending', 'in_progress', 'completed', 'cancelled')", name="check_order_status"
         ),
         Index("idx_order_date_status", "order_date", "status"),
         Index("idx_order_customer_date", "customer_id", "order_date"),
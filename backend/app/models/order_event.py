@@ -0,0 +1,24 @@
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, ForeignKey, Index, func
+from app.core.database import Base
+
+
+class OrderEvent(Base):
+    """Append-only log of order status transitions"""
+
+    __tablename__ = "order_events"
+
+    event_id = Column(BigInteger, primary_key=True)
+    order_id = Column(
+        Integer, ForeignKey("orders.order_id", ondelete="CASCADE"), nullable=False
+    )
+    from_status = Column(String(20), nullable=True)  # NULL when the order is created
+    to_status = Column(String(20), nullable=False)
+    employee_id = Column(
+        Integer, ForeignKey("employees.emp_id", ondelete="SET NULL"), nullable=True
+    )
+    occurred_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("idx_order_events_order", "order_id", "occurred_at"),
+        Index("idx_order_events_occurred_at", "occurred_at"),
+    )
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, DateTime
+from app.core.database import Base
+
+
+class ReportRefresh(Base):
+    """Last successful refresh time of each materialized report view"""
+
+    __tablename__ = "report_refreshes"
+
+    view_name = Column(String(63), primary_key=True)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,11 +1,82 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 from decimal import Decimal
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, aliased, contains_eager
+from sqlalchemy import Text, and_, or_, case, cast, func, literal, literal_column, select, update
+from sqlalchemy.dialects.postgresql import array
 from app.models.customer import Customer
-from app.schemas.customer import CustomerCreate, CustomerUpdate
+from app.models.customer_stats import CustomerStats
+from app.models.customer_segment import CustomerSegment
+from app.schemas.customer import CustomerCreate, CustomerResponse, CustomerUpdate
+from app.core import cache_invalidation
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import is_replica
 from app.core.logging import logger
 
+CACHE_NAMESPACE = "customers"
+
+# Hot lookups (by id / phone / email) -> CustomerResponse of the customer row
+_lookup_cache = TTLCache(
+    "customer_lookup",
+    maxsize=settings.CUSTOMER_CACHE_SIZE,
+    ttl=settings.CUSTOMER_CACHE_TTL_SECONDS,
+)
+cache_invalidation.register(CACHE_NAMESPACE, _lookup_cache.evict)
+
+def _cache_keys(customer: Customer) -> List[str]:
+    """Cache keys under which a customer can be looked up"""
+    keys = [f"id:{customer.customer_id}"]
+    if customer.phone:
+        keys.append(f"phone:{customer.phone}")
+    if customer.email:
+        keys.append(f"email:{customer.email.lower()}")
+    return keys
+
+
+def _sql_cache_keys(row) -> Any:
+    """_cache_keys of a (possibly aliased) customer row as a SQL text[]"""
+    return func.array_remove(
+        array([
+            literal("id:") + cast(row.customer_id, Text),
+            literal("phone:") + func.nullif(row.phone, ""),
+            literal("email:") + func.lower(row.email),
+        ]),
+        None,
+    )
+
+
+# Digits-only phone; must match the idx_customer_phone_digits expression exactly,
+# so the pattern arguments are rendered inline rather than bound
+PHONE_DIGITS = func.regexp_replace(
+    Customer.phone, literal_column("'[^0-9]'"), literal_column("''"), literal_column("'g'")
+)
+
+# Sortable columns of the customer list
+SORT_COLUMNS = {
+    "name": Customer.name,
+    "loyalty_points": Customer.loyalty_points,
+    "created_at": Customer.created_at,
+    "visit_count": CustomerStats.visit_count,
+    "lifetime_spend": CustomerStats.lifetime_spend,
+    "last_visit_date": CustomerStats.last_visit_date,
+}
+
+# Shortest digit string treated as a full phone number (exact lookup)
+FULL_PHONE_MIN_DIGITS = 9
+
+
+def earned_loyalty_points(total_amount: Decimal) -> Decimal:
+    """Points earned for an order total under the configured earn rule"""
+    spend_per_point = settings.LOYALTY_SPEND_PER_POINT
+    if spend_per_point <= 0 or total_amount <= 0:
+        return Decimal("0")
+    return Decimal(int(total_amount // spend_per_point))
+
+
+def normalize_phone(value: str) -> str:
+    """Strip everything but digits from a phone number"""
+    return "".join(ch for ch in value if ch.isdigit())
+
 
 class CustomerRepository:
     """Repository for Customer operations with query optimization"""
@@ -13,53 +84,156 @@ class CustomerRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get(self, customer_id: int) -> Optional[Customer]:
-        """Get customer by ID with relationships"""
+    def _cached_lookup(self, key: str, query) -> Optional[CustomerResponse]:
+        """Serve a read-only lookup from the cache, falling back to the query
+
+        Both paths return a CustomerResponse shared with other requests, so
+        callers must not modify it; writes go through _get_for_write instead.
+        The generation is read before the query so a row loaded before a
+        concurrent invalidation is not cached after it. Rows read from the
+        replica may lag the primary and are never cached.
+        """
+        cached = _lookup_cache.get(key)
+        if cached is not None:
+            return cached
+
+        generation = _lookup_cache.generation
+        customer = query.first()
+        if not customer:
+            return None
+        response = CustomerResponse.model_validate(customer)
+        if is_replica(self.db):
+            return response
+        for cache_key in _cache_keys(customer):
+            _lookup_cache.set(cache_key, response, generation=generation)
+        return response
+
+    def _commit_and_invalidate(self, keys: List[str]) -> None:
+        """Commit, evicting keys in this worker and (via NOTIFY) in all others"""
+        cache_invalidation.publish(self.db, CACHE_NAMESPACE, keys)
+        self.db.commit()
+        _lookup_cache.evict(keys)
+
+    def _get_for_write(self, customer_id: int) -> Optional[Customer]:
+        """Get an attached customer row, bypassing the lookup cache"""
         return (
             self.db.query(Customer)
             .filter(
                 and_(Customer.customer_id == customer_id, Customer.is_deleted == False)
             )
-            .options(joinedload(Customer.orders))
             .first()
         )
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Customer]:
-        """Get all customers with pagination"""
-        return (
+    def get(self, customer_id: int) -> Optional[CustomerResponse]:
+        """Get customer by ID (order history is paged via OrderRepository)"""
+        return self._cached_lookup(
+            f"id:{customer_id}",
+            self.db.query(Customer).filter(
+                and_(Customer.customer_id == customer_id, Customer.is_deleted == False)
+            ),
+        )
+
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: Optional[str] = None,
+        descending: bool = True,
+        segment: Optional[str] = None,
+    ) -> List[Customer]:
+        """Get all customers with lifetime stats and RFM segment, with pagination"""
+        query = (
             self.db.query(Customer)
+            .outerjoin(Customer.stats)
+            .outerjoin(Customer.segment)
+            .options(contains_eager(Customer.stats), contains_eager(Customer.segment))
             .filter(Customer.is_deleted == False)
-            .offset(skip)
-            .limit(limit)
-            .all()
         )
+        if segment:
+            query = query.filter(CustomerSegment.segment == segment)
+        if sort_by:
+            column = SORT_COLUMNS[sort_by]
+            column = column.desc() if descending else column.asc()
+            query = query.order_by(column.nulls_last(), Customer.customer_id)
+        return query.offset(skip).limit(limit).all()
 
-    def get_by_phone(self, phone: str) -> Optional[Customer]:
+    def get_by_phone(self, phone: str) -> Optional[CustomerResponse]:
         """Get customer by phone number"""
-        return (
-            self.db.query(Customer)
-            .filter(and_(Customer.phone == phone, Customer.is_deleted == False))
-            .first()
+        return self._cached_lookup(
+            f"phone:{phone}",
+            self.db.query(Customer).filter(
+                and_(Customer.phone == phone, Customer.is_deleted == False)
+            ),
         )
 
-    def get_by_email(self, email: str) -> Optional[Customer]:
+    def get_by_email(self, email: str) -> Optional[CustomerResponse]:
         """Get customer by email"""
-        return (
-            self.db.query(Customer)
-            .filter(and_(Customer.email == email, Customer.is_deleted == False))
-            .first()
+        return self._cached_lookup(
+            f"email:{email.lower()}",
+            self.db.query(Customer).filter(
+                and_(
+                    func.lower(Customer.email) == email.lower(),
+                    Customer.is_deleted == False,
+                )
+            ),
         )
 
-    def search(self, query: str, skip: int = 0, limit: int = 100) -> List[Customer]:
-        """Search customers by name, phone, or email"""
-        search_filter = or_(
+    def search(self, query: str, skip: int = 0, limit: int = 20) -> List[Customer]:
+        """Search customers by name, phone, or email ranked by relevance
+
+        Full emails and phone numbers short-circuit to an exact indexed lookup.
+        Otherwise name/email match through pg_trgm GIN indexes and phone digits
+        through a prefix index, ranked by trigram similarity.
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        if "@" in query:
+            customer = (
+                self.db.query(Customer)
+                .filter(
+                    and_(
+                        func.lower(Customer.email) == query.lower(),
+                        Customer.is_deleted == False,
+                    )
+                )
+                .first()
+            )
+            if customer:
+                return [customer] if skip == 0 else []
+
+        digits = normalize_phone(query)
+        is_phone_like = bool(digits) and not any(ch.isalpha() for ch in query)
+        if is_phone_like and len(digits) >= FULL_PHONE_MIN_DIGITS:
+            customer = (
+                self.db.query(Customer)
+                .filter(and_(PHONE_DIGITS == digits, Customer.is_deleted == False))
+                .first()
+            )
+            if customer:
+                return [customer] if skip == 0 else []
+
+        conditions = [
             Customer.name.ilike(f"%{query}%"),
-            Customer.phone.ilike(f"%{query}%"),
+            Customer.name.op("%")(query),
             Customer.email.ilike(f"%{query}%"),
+        ]
+        if is_phone_like:
+            conditions.append(PHONE_DIGITS.like(f"{digits}%"))
+
+        rank = func.greatest(
+            func.similarity(Customer.name, query),
+            func.similarity(func.coalesce(Customer.email, ""), query),
+            case((Customer.name.ilike(f"{query}%"), 1.0), else_=0.0),
+            case((PHONE_DIGITS.like(f"{digits}%"), 1.0), else_=0.0)
+            if is_phone_like
+            else 0.0,
         )
         return (
             self.db.query(Customer)
-            .filter(and_(search_filter, Customer.is_deleted == False))
+            .filter(and_(or_(*conditions), Customer.is_deleted == False))
+            .order_by(rank.desc(), Customer.customer_id)
             .offset(skip)
             .limit(limit)
             .all()
@@ -79,45 +253,76 @@ class CustomerRepository:
         self, customer_id: int, customer_data: CustomerUpdate
     ) -> Optional[Customer]:
         """Update an existing customer"""
-        customer = self.get(customer_id)
+        customer = self._get_for_write(customer_id)
         if not customer:
             return None
 
+        stale_keys = _cache_keys(customer)
         update_data = customer_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(customer, field, value)
 
-        self.db.commit()
+        self._commit_and_invalidate(stale_keys + _cache_keys(customer))
         self.db.refresh(customer)
         logger.info(f"Updated customer: {customer_id}")
         return customer
 
     def delete(self, customer_id: int) -> bool:
         """Soft delete a customer"""
-        customer = self.get(customer_id)
+        customer = self._get_for_write(customer_id)
         if not customer:
             return False
 
         customer.is_deleted = True
-        self.db.commit()
+        self._commit_and_invalidate(_cache_keys(customer))
         logger.info(f"Deleted customer: {customer_id}")
         return True
 
+    def add_loyalty_points(
+        self, customer_id: int, points: Decimal, min_balance: Optional[Decimal] = None
+    ) -> Optional[Customer]:
+        """Atomically add (or subtract) loyalty points without committing
+
+        A single UPDATE ... RETURNING, so concurrent accruals cannot lose
+        updates. With min_balance set, the update only applies when the
+        resulting balance stays at or above it. Returns None when no row
+        was updated. The caller owns the transaction.
+        """
+        conditions = [Customer.customer_id == customer_id, Customer.is_deleted == False]
+        if min_balance is not None:
+            conditions.append(Customer.loyalty_points + points >= min_balance)
+
+        updated = (
+            update(Customer)
+            .where(and_(*conditions))
+            .values(loyalty_points=Customer.loyalty_points + points)
+            .returning(*Customer.__table__.columns)
+            .cte("updated")
+        )
+        row = aliased(Customer, updated)
+        # The invalidation is queued by the same statement, only for an updated row
+        stmt = select(
+            row, cache_invalidation.notify_expression(CACHE_NAMESPACE, _sql_cache_keys(row))
+        ).execution_options(populate_existing=True)
+        customer = self.db.execute(stmt).scalars().first()
+        if customer:
+            # Other workers evict on commit; a same-worker re-cache of the old
+            # row before commit is evicted again when our own NOTIFY arrives
+            _lookup_cache.evict(_cache_keys(customer))
+        return customer
+
     def update_loyalty_points(
         self, customer_id: int, points: float
     ) -> Optional[Customer]:
         """Update customer loyalty points"""
-        customer = self.get(customer_id)
+        points_decimal = Decimal(str(points))
+        customer = self.add_loyalty_points(customer_id, points_decimal)
         if not customer:
             return None
 
-        # Convert points to Decimal to match loyalty_points type
-        points_decimal = Decimal(str(points))
-        customer.loyalty_points = (
-            customer.loyalty_points or Decimal("0")
-        ) + points_decimal
+        # RETURNING already loaded the new row; keep it from being expired on commit
+        self.db.expunge(customer)
         self.db.commit()
-        self.db.refresh(customer)
         logger.info(
             f"Updated loyalty points for customer {customer_id}: added {points_decimal}, new total: {customer.loyalty_points}"
         )
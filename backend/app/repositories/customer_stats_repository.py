@@ -0,0 +1,103 @@
+from typing import Optional
+from datetime import date
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from app.models.customer_stats import CustomerStats
+from app.core.logging import logger
+
+
+def _counts_as_visit(status: Optional[str]) -> int:
+    return 1 if status is not None and status != "cancelled" else 0
+
+
+def _counts_as_completed(status: Optional[str]) -> int:
+    return 1 if status == "completed" else 0
+
+
+class CustomerStatsRepository:
+    """Repository for the customer_stats rollup"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, customer_id: int) -> Optional[CustomerStats]:
+        """Get lifetime statistics for a customer"""
+        return self.db.get(CustomerStats, customer_id)
+
+    def apply_order_transition(
+        self,
+        customer_id: Optional[int],
+        order_date: date,
+        total_amount: Decimal,
+        old_status: Optional[str],
+        new_status: Optional[str],
+    ) -> None:
+        """Fold an order status change into the rollup (does not commit)
+
+        old_status is None for a new order, new_status is None for a deleted
+        one. Runs as one upsert inside the caller's transaction.
+        """
+        if customer_id is None:
+            return
+
+        visit_delta = _counts_as_visit(new_status) - _counts_as_visit(old_status)
+        completed_delta = _counts_as_completed(new_status) - _counts_as_completed(old_status)
+        if visit_delta == 0 and completed_delta == 0 and old_status is not None:
+            return
+
+        spend_delta = total_amount * completed_delta
+        # A cancelled visit still happened, so last_visit_date only moves forward
+        last_visit = order_date if old_status is None else None
+
+        stmt = insert(CustomerStats).values(
+            customer_id=customer_id,
+            visit_count=visit_delta,
+            completed_count=completed_delta,
+            lifetime_spend=spend_delta,
+            last_visit_date=last_visit,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CustomerStats.customer_id],
+            set_={
+                "visit_count": CustomerStats.visit_count + stmt.excluded.visit_count,
+                "completed_count": CustomerStats.completed_count + stmt.excluded.completed_count,
+                "lifetime_spend": CustomerStats.lifetime_spend + stmt.excluded.lifetime_spend,
+                "last_visit_date": text(
+                    "GREATEST(customer_stats.last_visit_date, excluded.last_visit_date)"
+                ),
+                "updated_at": text("now()"),
+            },
+        )
+        self.db.execute(stmt)
+
+    def rebuild(self) -> int:
+        """Rebuild the whole rollup from orders in one set-based pass
+
+        Locks the rollup first so concurrent order writes wait for the rebuild
+        instead of applying deltas to rows it is about to replace.
+        """
+        self.db.execute(text("LOCK TABLE customer_stats IN SHARE ROW EXCLUSIVE MODE"))
+        self.db.execute(text("DELETE FROM customer_stats"))
+        result = self.db.execute(
+            text(
+                """
+                INSERT INTO customer_stats (
+                    customer_id, visit_count, completed_count, lifetime_spend, last_visit_date
+                )
+                SELECT
+                    customer_id,
+                    COUNT(*) FILTER (WHERE status <> 'cancelled'),
+                    COUNT(*) FILTER (WHERE status = 'completed'),
+                    COALESCE(SUM(total_amount) FILTER (WHERE status = 'completed'), 0),
+                    MAX(order_date)
+                FROM orders
+                WHERE customer_id IS NOT NULL AND is_deleted = FALSE
+                GROUP BY customer_id
+                """
+            )
+        )
+        self.db.commit()
+        logger.info(f"Rebuilt customer_stats for {result.rowcount} customers")
+        return result.rowcount
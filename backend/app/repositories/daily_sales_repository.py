@@ -0,0 +1,212 @@
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from app.models.daily_sales import DailySales
+from app.models.hourly_sales import HourlySales
+from app.core import report_cache
+from app.core.config import settings
+from app.core.logging import logger
+
+# Where a single order lands in the rollups. An order is attributed to the
+# method of its first payment; revenue is what was paid, or the order total
+# while nothing has been paid yet.
+_ORDER_CONTRIBUTIONS = """
+    SELECT
+        o.order_date,
+        EXTRACT(HOUR FROM o.created_at AT TIME ZONE :tz)::int AS hour,
+        o.status,
+        COALESCE(p.payment_method, 'unpaid') AS payment_method,
+        o.total_amount,
+        COALESCE(p.paid, o.total_amount) AS revenue
+    FROM orders o
+    LEFT JOIN LATERAL (
+        SELECT
+            (array_agg(payment_method ORDER BY payment_id))[1] AS payment_method,
+            SUM(amount) AS paid
+        FROM payments
+        WHERE order_id = o.order_id AND is_deleted = FALSE
+    ) p ON TRUE
+    WHERE o.is_deleted = FALSE
+"""
+
+_ORDER_CONTRIBUTION = text(_ORDER_CONTRIBUTIONS + " AND o.order_id = :order_id")
+
+# Serializes writers of one order, so two of them cannot both subtract the same
+# "before" contribution. Taken as its own statement: the contribution query that
+# follows gets a fresh snapshot, including payments committed while waiting.
+_LOCK_ORDER = text("SELECT 1 FROM orders WHERE order_id = :order_id FOR UPDATE")
+
+_REBUILD_RANGE = text(
+    f"""
+    INSERT INTO daily_sales (order_date, status, payment_method, order_count, total_amount, revenue)
+    SELECT order_date, status, payment_method, COUNT(*), SUM(total_amount), SUM(revenue)
+    FROM ({_ORDER_CONTRIBUTIONS} AND o.order_date BETWEEN :start_date AND :end_date) c
+    GROUP BY order_date, status, payment_method
+    """
+)
+
+_REBUILD_HOURLY_RANGE = text(
+    f"""
+    INSERT INTO hourly_sales (order_date, hour, order_count, revenue)
+    SELECT order_date, hour, COUNT(*), SUM(revenue)
+    FROM ({_ORDER_CONTRIBUTIONS} AND o.order_date BETWEEN :start_date AND :end_date) c
+    WHERE status <> 'cancelled'
+    GROUP BY order_date, hour
+    """
+)
+
+# Report cache endpoints computed from these rollups
+ROLLUP_REPORTS = ("daily-sales", "heatmap")
+
+
+class DailySalesRepository:
+    """Repository for the daily_sales and hourly_sales rollups"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def order_contribution(self, order_id: Optional[int], lock: bool = False) -> Optional[Row]:
+        """Current rollup key and measures of an order (None if deleted or missing)
+
+        Pass lock=True for the "before" read of a change: it locks the order
+        row until the caller's transaction, which applies the delta, ends.
+        """
+        if order_id is None:
+            return None
+        self.db.flush()
+        if lock:
+            self.db.execute(_LOCK_ORDER, {"order_id": order_id})
+        return self.db.execute(
+            _ORDER_CONTRIBUTION, {"order_id": order_id, "tz": settings.REPORT_TIMEZONE}
+        ).first()
+
+    def apply_change(self, *changes: Tuple[Optional[Row], Optional[Row]]) -> None:
+        """Fold (before, after) order contributions into the rollups (does not commit)
+
+        Runs one upsert per rollup inside the caller's transaction; rows are
+        touched in key order so concurrent writers cannot deadlock on them.
+        """
+        daily: Dict[Tuple[date, str, str], List] = {}
+        hourly: Dict[Tuple[date, int], List] = {}
+        for before, after in changes:
+            for sign, row in ((-1, before), (1, after)):
+                if row is None:
+                    continue
+                delta = daily.setdefault(
+                    (row.order_date, row.status, row.payment_method),
+                    [0, Decimal("0"), Decimal("0")],
+                )
+                delta[0] += sign
+                delta[1] += sign * row.total_amount
+                delta[2] += sign * row.revenue
+                if row.status != "cancelled":
+                    delta = hourly.setdefault((row.order_date, row.hour), [0, Decimal("0")])
+                    delta[0] += sign
+                    delta[1] += sign * row.revenue
+
+        daily_values = [
+            {
+                "order_date": key[0],
+                "status": key[1],
+                "payment_method": key[2],
+                "order_count": count,
+                "total_amount": total,
+                "revenue": revenue,
+            }
+            for key, (count, total, revenue) in sorted(daily.items())
+            if count or total or revenue
+        ]
+        hourly_values = [
+            {"order_date": key[0], "hour": key[1], "order_count": count, "revenue": revenue}
+            for key, (count, revenue) in sorted(hourly.items())
+            if count or revenue
+        ]
+        self._upsert(
+            DailySales,
+            [DailySales.order_date, DailySales.status, DailySales.payment_method],
+            daily_values,
+            ("order_count", "total_amount", "revenue"),
+        )
+        self._upsert(
+            HourlySales,
+            [HourlySales.order_date, HourlySales.hour],
+            hourly_values,
+            ("order_count", "revenue"),
+        )
+
+        today = date.today()
+        if any(row["order_date"] < today for row in daily_values + hourly_values):
+            # Closed days are cached indefinitely; a write into the past must evict them
+            report_cache.invalidate(self.db, ROLLUP_REPORTS)
+
+    def _upsert(self, model, index_elements, values, measures) -> None:
+        if not values:
+            return
+        stmt = insert(model).values(values)
+        set_ = {name: getattr(model, name) + stmt.excluded[name] for name in measures}
+        set_["updated_at"] = text("now()")
+        self.db.execute(stmt.on_conflict_do_update(index_elements=index_elements, set_=set_))
+
+    def get_range(self, start_date: date, end_date: date) -> List[Row]:
+        """Per-day totals (all statuses and methods) for a date range"""
+        return self.db.query(
+            DailySales.order_date,
+            func.sum(DailySales.order_count).label("order_count"),
+            func.coalesce(
+                func.sum(DailySales.order_count).filter(DailySales.status == "completed"), 0
+            ).label("completed_count"),
+            func.coalesce(
+                func.sum(DailySales.order_count).filter(DailySales.status == "cancelled"), 0
+            ).label("cancelled_count"),
+            func.coalesce(
+                func.sum(DailySales.revenue).filter(DailySales.status == "completed"), 0
+            ).label("completed_revenue"),
+        ).filter(
+            and_(
+                DailySales.order_date >= start_date,
+                DailySales.order_date <= end_date,
+            )
+        ).group_by(DailySales.order_date).order_by(DailySales.order_date).all()
+
+    def get_heatmap(self, start_date: date, end_date: date) -> List[Row]:
+        """Orders and revenue per (weekday, hour) for a date range (weekday 0 = Monday)"""
+        weekday = (func.extract("isodow", HourlySales.order_date) - 1).label("weekday")
+        return self.db.query(
+            weekday,
+            HourlySales.hour,
+            func.sum(HourlySales.order_count).label("order_count"),
+            func.sum(HourlySales.revenue).label("revenue"),
+        ).filter(
+            and_(
+                HourlySales.order_date >= start_date,
+                HourlySales.order_date <= end_date,
+            )
+        ).group_by(weekday, HourlySales.hour).all()
+
+    def rebuild(self, start_date: date, end_date: date) -> int:
+        """Recompute both rollups for a date range from orders and payments
+
+        Takes locks that block concurrent incremental updates until commit,
+        so deltas from in-flight writes are neither lost nor applied twice.
+        """
+        params = {"start_date": start_date, "end_date": end_date, "tz": settings.REPORT_TIMEZONE}
+        try:
+            self.db.execute(text("LOCK TABLE daily_sales, hourly_sales IN SHARE ROW EXCLUSIVE MODE"))
+            for table in ("daily_sales", "hourly_sales"):
+                self.db.execute(
+                    text(f"DELETE FROM {table} WHERE order_date BETWEEN :start_date AND :end_date"),
+                    params,
+                )
+            result = self.db.execute(_REBUILD_RANGE, params)
+            self.db.execute(_REBUILD_HOURLY_RANGE, params)
+            report_cache.invalidate(self.db, ROLLUP_REPORTS)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        logger.info(f"Rebuilt daily_sales {start_date}..{end_date}: {result.rowcount} rows")
+        return result.rowcount
@@ -1,11 +1,16 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, select
 from decimal import Decimal
 from app.models.inventory import Inventory
 from app.schemas.inventory import InventoryCreate, InventoryUpdate
 from app.core.logging import logger
 
+# Prebuilt for the per-ingredient lookups of stock checks and deductions
+_INVENTORY_BY_INGREDIENT = select(Inventory).where(
+    Inventory.ingredient_id == bindparam("ingredient_id"), Inventory.is_deleted == False
+).options(joinedload(Inventory.ingredient))
+
 
 class InventoryRepository:
     """Repository for Inventory operations with query optimization"""
@@ -32,14 +37,7 @@ class InventoryRepository:
 
     def get_by_ingredient(self, ingredient_id: int) -> Optional[Inventory]:
         """Get inventory record by ingredient ID"""
-        return self.db.query(Inventory).filter(
-            and_(
-                Inventory.ingredient_id == ingredient_id,
-                Inventory.is_deleted == False
-            )
-        ).options(
-            joinedload(Inventory.ingredient)
-        ).first()
+        return self.db.scalars(_INVENTORY_BY_INGREDIENT, {"ingredient_id": ingredient_id}).first()
 
     def get_low_stock(self, skip: int = 0, limit: int = 100) -> List[Inventory]:
         """Get inventory items with quantity below threshold"""
@@ -1,11 +1,59 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from app.models.menu_item import MenuItem
 from app.models.junction_tables import MenuItemIngredient
 from app.schemas.menu_item import MenuItemCreate, MenuItemUpdate
+from app.core.cache import TTLCache, bump_version, get_version
+from app.core.config import settings
+from app.core.database import is_replica
 from app.core.logging import logger
 
+MENU_VERSION = "menu"
+
+# Prebuilt: only the parameter changes between calls
+_MENU_ITEM_BY_ID = select(MenuItem).where(
+    MenuItem.item_id == bindparam("item_id"), MenuItem.is_deleted == False
+).options(joinedload(MenuItem.ingredients).joinedload(MenuItemIngredient.ingredient))
+
+# Grouped menu keyed by (menu version, available_only)
+_grouped_menu_cache = TTLCache(
+    "menu_by_category", maxsize=16, ttl=settings.MENU_CACHE_TTL_SECONDS
+)
+
+
+def _grouped_menu_statement(available_only: bool):
+    """Menu grouped by category in a single GROUP BY / json_agg query"""
+    item_json = func.json_build_object(
+        "item_id", MenuItem.item_id,
+        "name", MenuItem.name,
+        "price", MenuItem.price,
+        "category", MenuItem.category,
+        "description", MenuItem.description,
+        "image_url", MenuItem.image_url,
+        "is_available", MenuItem.is_available,
+        "created_at", MenuItem.created_at,
+        "updated_at", MenuItem.updated_at,
+        "is_deleted", MenuItem.is_deleted,
+    )
+    # Filter on (category, is_available) so idx_menu_item_category_available applies
+    conditions = [MenuItem.is_deleted == False]
+    if available_only:
+        conditions.append(MenuItem.is_available == True)
+
+    return (
+        select(
+            MenuItem.category,
+            func.count().label("item_count"),
+            func.json_agg(aggregate_order_by(item_json, MenuItem.name)).label("items"),
+        )
+        .where(and_(*conditions))
+        .group_by(MenuItem.category)
+        .order_by(MenuItem.category)
+    )
+
 
 class MenuItemRepository:
     """Repository for MenuItem operations with query optimization"""
@@ -15,11 +63,7 @@ class MenuItemRepository:
 
     def get(self, item_id: int) -> Optional[MenuItem]:
         """Get menu item by ID with relationships"""
-        return self.db.query(MenuItem).filter(
-            and_(MenuItem.item_id == item_id, MenuItem.is_deleted == False)
-        ).options(
-            joinedload(MenuItem.ingredients).joinedload(MenuItemIngredient.ingredient)
-        ).first()
+        return self.db.execute(_MENU_ITEM_BY_ID, {"item_id": item_id}).unique().scalars().first()
 
     def get_all(self, skip: int = 0, limit: int = 100, available_only: bool = False) -> List[MenuItem]:
         """Get all menu items with pagination"""
@@ -51,6 +95,7 @@ class MenuItemRepository:
         self.db.add(menu_item)
         self.db.commit()
         self.db.refresh(menu_item)
+        bump_version(MENU_VERSION)
         logger.info(f"Created menu item: {menu_item.item_id}")
         return menu_item
 
@@ -66,6 +111,7 @@ class MenuItemRepository:
         
         self.db.commit()
         self.db.refresh(menu_item)
+        bump_version(MENU_VERSION)
         logger.info(f"Updated menu item: {item_id}")
         return menu_item
 
@@ -77,6 +123,7 @@ class MenuItemRepository:
         
         menu_item.is_deleted = True
         self.db.commit()
+        bump_version(MENU_VERSION)
         logger.info(f"Deleted menu item: {item_id}")
         return True
 
@@ -89,6 +136,58 @@ class MenuItemRepository:
         menu_item.is_available = not menu_item.is_available
         self.db.commit()
         self.db.refresh(menu_item)
+        bump_version(MENU_VERSION)
         logger.info(f"Toggled availability for menu item: {item_id}")
         return menu_item
 
+
+class AsyncMenuItemRepository:
+    """Read-only MenuItem queries for async route handlers"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, item_id: int) -> Optional[MenuItem]:
+        """Get menu item by ID with relationships"""
+        result = await self.db.execute(_MENU_ITEM_BY_ID, {"item_id": item_id})
+        return result.unique().scalars().first()
+
+    async def get_all(self, skip: int = 0, limit: int = 100, available_only: bool = False) -> List[MenuItem]:
+        """Get all menu items with pagination"""
+        stmt = select(MenuItem).where(MenuItem.is_deleted == False)
+        if available_only:
+            stmt = stmt.where(MenuItem.is_available == True)
+        return list((await self.db.scalars(stmt.offset(skip).limit(limit))).all())
+
+    async def get_by_category(self, category: str, skip: int = 0, limit: int = 100) -> List[MenuItem]:
+        """Get menu items by category"""
+        stmt = select(MenuItem).where(
+            and_(
+                MenuItem.category == category,
+                MenuItem.is_available == True,
+                MenuItem.is_deleted == False
+            )
+        ).offset(skip).limit(limit)
+        return list((await self.db.scalars(stmt)).all())
+
+    async def get_available(self, skip: int = 0, limit: int = 100) -> List[MenuItem]:
+        """Get only available menu items"""
+        return await self.get_all(skip=skip, limit=limit, available_only=True)
+
+    async def get_grouped_by_category(self, available_only: bool = True) -> List[Dict[str, Any]]:
+        """Get menu grouped by category in a single GROUP BY / json_agg query
+
+        Results read from the replica may lag the primary and are not cached.
+        """
+        cache_key = (get_version(MENU_VERSION), available_only)
+        cached = _grouped_menu_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = [
+            dict(row)
+            for row in (await self.db.execute(_grouped_menu_statement(available_only))).mappings()
+        ]
+        if not is_replica(self.db):
+            _grouped_menu_cache.set(cache_key, result)
+        return result
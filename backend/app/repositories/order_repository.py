@@ -1,16 +1,55 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_
-from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, bindparam, select, tuple_, text
+from sqlalchemy.dialects.postgresql import distinct_on
+from datetime import date, timedelta
 from decimal import Decimal
 from app.models.order import Order, OrderDetail
+from app.models.order_event import OrderEvent
 from app.models.menu_item import MenuItem
 from app.models.payment import Payment
-from app.schemas.order import OrderCreate, OrderUpdate, OrderDetailCreate
+from app.schemas.order import OrderCreate, OrderUpdate, OrderDetailCreate, OrderDetailResponse, OrderResponse
 from app.repositories.menu_item_ingredient_repository import MenuItemIngredientRepository
 from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.customer_repository import CustomerRepository, earned_loyalty_points
+from app.repositories.customer_stats_repository import CustomerStatsRepository
+from app.repositories.daily_sales_repository import DailySalesRepository
+from app.core import metrics, service_metrics
 from app.core.logging import logger
 
+# Built once: executing a prebuilt statement skips query construction and
+# reuses its memoized cache key, so only the parameters change per call
+_ORDER_BY_ID = select(Order).where(
+    Order.order_id == bindparam("order_id"), Order.is_deleted == False
+).options(
+    joinedload(Order.customer),
+    selectinload(Order.order_details).joinedload(OrderDetail.menu_item),
+    selectinload(Order.payments),
+)
+
+# Columns the list endpoints serialize, straight from the response schemas
+_ORDER_ROW_COLUMNS = [
+    Order.__table__.c[name]
+    for name in OrderResponse.model_fields
+    if name not in ("order_details", "payment_amount")
+]
+_DETAIL_ROW_COLUMNS = [OrderDetail.__table__.c[name] for name in OrderDetailResponse.model_fields]
+
+# Time since the order was created and since it was last started, by the DB clock
+_SERVICE_DURATIONS = text(
+    """
+    SELECT
+        now() - o.created_at AS since_created,
+        now() - (
+            SELECT MAX(e.occurred_at) FROM order_events e
+            WHERE e.order_id = o.order_id AND e.to_status = 'in_progress'
+        ) AS since_started
+    FROM orders o
+    WHERE o.order_id = :order_id
+    """
+)
+
 
 class OrderRepository:
     """Repository for Order operations with transaction handling and query optimization"""
@@ -18,15 +57,46 @@ class OrderRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    def _record_transition(
+        self,
+        order: Order,
+        from_status: Optional[str],
+        to_status: str,
+        employee_id: Optional[int],
+    ) -> Tuple[Optional[timedelta], Optional[timedelta]]:
+        """Append an order_events row (does not commit); returns service durations"""
+        durations = (None, None)
+        if to_status in ("in_progress", "completed"):
+            durations = tuple(
+                self.db.execute(_SERVICE_DURATIONS, {"order_id": order.order_id}).one()
+            )
+        self.db.add(
+            OrderEvent(
+                order_id=order.order_id,
+                from_status=from_status,
+                to_status=to_status,
+                employee_id=employee_id,
+            )
+        )
+        return durations
+
     def get(self, order_id: int) -> Optional[Order]:
         """Get order by ID with relationships"""
-        return self.db.query(Order).filter(
-            and_(Order.order_id == order_id, Order.is_deleted == False)
-        ).options(
-            joinedload(Order.customer),
-            selectinload(Order.order_details).joinedload(OrderDetail.menu_item),
-            selectinload(Order.payments)
+        return self.db.scalars(_ORDER_BY_ID, {"order_id": order_id}).first()
+
+    def _get_locked(
+        self, order_id: int, daily_sales: DailySalesRepository
+    ) -> Tuple[Optional[Order], Any]:
+        """Lock an order for a write and load it; returns it and its rollup contribution
+
+        The order is loaded after the row lock, so the status, customer and
+        total that rollup transitions start from cannot change under them.
+        """
+        before = daily_sales.order_contribution(order_id, lock=True)
+        order = self.db.scalars(
+            _ORDER_BY_ID, {"order_id": order_id}, execution_options={"populate_existing": True}
         ).first()
+        return order, before
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Order]:
         """Get all orders with pagination"""
@@ -49,6 +119,35 @@ class OrderRepository:
             selectinload(Order.payments)
         ).order_by(Order.order_date.desc()).offset(skip).limit(limit).all()
 
+    def get_by_customer_keyset(
+        self,
+        customer_id: int,
+        before: Optional[Tuple[date, int]] = None,
+        limit: int = 20,
+    ) -> Tuple[List[Order], Optional[Tuple[date, int]]]:
+        """Get a page of customer orders (newest first) using keyset pagination
+
+        Walks idx_order_customer_date instead of OFFSET, so deep pages cost the
+        same as the first one. Returns the page and the cursor for the next one.
+        """
+        conditions = [Order.customer_id == customer_id, Order.is_deleted == False]
+        if before is not None:
+            conditions.append(tuple_(Order.order_date, Order.order_id) < tuple_(*before))
+
+        orders = self.db.query(Order).filter(and_(*conditions)).options(
+            selectinload(Order.order_details),
+            selectinload(Order.payments)
+        ).order_by(
+            Order.order_date.desc(), Order.order_id.desc()
+        ).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(orders) > limit:
+            orders = orders[:limit]
+            last = orders[-1]
+            next_cursor = (last.order_date, last.order_id)
+        return orders, next_cursor
+
     def get_by_status(self, status: str, skip: int = 0, limit: int = 100) -> List[Order]:
         """Get orders by status with eager loading to prevent N+1 queries"""
         return self.db.query(Order).filter(
@@ -75,7 +174,7 @@ class OrderRepository:
             selectinload(Order.payments)
         ).order_by(Order.order_date.desc()).offset(skip).limit(limit).all()
 
-    def create(self, order_data: OrderCreate) -> Optional[Order]:
+    def create(self, order_data: OrderCreate, employee_id: Optional[int] = None) -> Optional[Order]:
         """Create a new order with order details and payment in a transaction"""
         try:
             # Calculate total amount from order details
@@ -133,9 +232,29 @@ class OrderRepository:
                 status='pending'
             )
             self.db.add(payment)
+
+            # Redeem loyalty points atomically in the same transaction
+            if order_data.loyalty_points_redeemed > 0:
+                if not order_data.customer_id:
+                    raise ValueError("Loyalty points can only be redeemed for a customer")
+                customer = CustomerRepository(self.db).add_loyalty_points(
+                    order_data.customer_id,
+                    -order_data.loyalty_points_redeemed,
+                    min_balance=Decimal('0'),
+                )
+                if not customer:
+                    raise ValueError("Insufficient loyalty points or customer not found")
+
+            CustomerStatsRepository(self.db).apply_order_transition(
+                order.customer_id, order.order_date, total_amount, None, order.status
+            )
+            daily_sales = DailySalesRepository(self.db)
+            daily_sales.apply_change((None, daily_sales.order_contribution(order.order_id)))
+            self._record_transition(order, None, order.status, employee_id)
             
             # Commit transaction
             self.db.commit()
+            metrics.ORDERS_CREATED.inc()
             self.db.refresh(order)
             
             logger.info(f"Created order: {order.order_id} with total: {total_amount}")
@@ -146,27 +265,50 @@ class OrderRepository:
             logger.error(f"Error creating order: {str(e)}")
             raise
 
-    def update(self, order_id: int, order_data: OrderUpdate) -> Optional[Order]:
-        """Update an existing order"""
-        order = self.get(order_id)
+    def update(
+        self, order_id: int, order_data: OrderUpdate, employee_id: Optional[int] = None
+    ) -> Optional[Order]:
+        """Update an existing order; a status change goes through _change_status"""
+        daily_sales = DailySalesRepository(self.db)
+        order, before = self._get_locked(order_id, daily_sales)
         if not order:
             return None
         
         update_data = order_data.model_dump(exclude_unset=True)
+        status = update_data.pop("status", None) or order.status
+        old_values = (order.customer_id, order.order_date, order.total_amount)
         for field, value in update_data.items():
             setattr(order, field, value)
+
+        new_values = (order.customer_id, order.order_date, order.total_amount)
+        if new_values != old_values:
+            # Move the order's rollup contribution: take out the old one, add the new one
+            stats = CustomerStatsRepository(self.db)
+            stats.apply_order_transition(*old_values, order.status, None)
+            stats.apply_order_transition(*new_values, None, order.status)
+
+        durations = None
+        if status != order.status:
+            durations = self._change_status(order, status, employee_id)
+        daily_sales.apply_change((before, daily_sales.order_contribution(order_id)))
         
         self.db.commit()
+        if durations is not None:
+            metrics.ORDER_TRANSITIONS.inc(order.status)
+            service_metrics.record_transition(order.status, *durations, employee_id)
         self.db.refresh(order)
         logger.info(f"Updated order: {order_id}")
         return order
 
-    def update_status(self, order_id: int, status: str) -> Optional[Order]:
-        """Update order status and deduct stock when completing order"""
-        order = self.get(order_id)
-        if not order:
-            return None
-        
+    def _change_status(
+        self, order: Order, status: str, employee_id: Optional[int]
+    ) -> Tuple[Optional[timedelta], Optional[timedelta]]:
+        """Move an order to a new status (does not commit); returns service durations
+
+        Deducts stock and accrues loyalty points on completion, and updates
+        the customer rollup and the order event log.
+        """
+        order_id = order.order_id
         # If completing order, deduct stock from inventory
         if status == 'completed' and order.status != 'completed':
             try:
@@ -218,6 +360,7 @@ class OrderRepository:
                                 quantity_change=-total_amount_needed,  # Negative to deduct
                                 employee_id=None  # System deduction
                             )
+                            metrics.STOCK_DEDUCTIONS.inc()
                             
                             logger.info(
                                 f"Deducted {total_amount_needed} of ingredient {ingredient_id} "
@@ -232,21 +375,134 @@ class OrderRepository:
                 self.db.rollback()
                 raise ValueError(f"Failed to deduct stock: {str(e)}")
         
-        # Update order status
+        # Accrue loyalty points in the same transaction that completes the order
+        if status == 'completed' and order.status != 'completed' and order.customer_id:
+            points = earned_loyalty_points(order.total_amount)
+            if points > 0:
+                CustomerRepository(self.db).add_loyalty_points(order.customer_id, points)
+                logger.info(f"Accrued {points} loyalty points to customer {order.customer_id} for order {order_id}")
+
+        CustomerStatsRepository(self.db).apply_order_transition(
+            order.customer_id, order.order_date, order.total_amount, order.status, status
+        )
+        durations = self._record_transition(order, order.status, status, employee_id)
         order.status = status
+        return durations
+
+    def update_status(
+        self, order_id: int, status: str, employee_id: Optional[int] = None
+    ) -> Optional[Order]:
+        """Update order status and deduct stock when completing order"""
+        daily_sales = DailySalesRepository(self.db)
+        order, before = self._get_locked(order_id, daily_sales)
+        if not order:
+            return None
+
+        durations = None
+        if status != order.status:
+            durations = self._change_status(order, status, employee_id)
+        daily_sales.apply_change((before, daily_sales.order_contribution(order_id)))
         self.db.commit()
+        if durations is not None:
+            metrics.ORDER_TRANSITIONS.inc(status)
+            service_metrics.record_transition(status, *durations, employee_id)
         self.db.refresh(order)
         logger.info(f"Updated order status: {order_id} to {status}")
         return order
 
     def delete(self, order_id: int) -> bool:
         """Soft delete an order"""
-        order = self.get(order_id)
+        daily_sales = DailySalesRepository(self.db)
+        order, before = self._get_locked(order_id, daily_sales)
         if not order:
             return False
         
         order.is_deleted = True
+        CustomerStatsRepository(self.db).apply_order_transition(
+            order.customer_id, order.order_date, order.total_amount, order.status, None
+        )
+        daily_sales.apply_change((before, None))
         self.db.commit()
         logger.info(f"Deleted order: {order_id}")
         return True
 
+
+class AsyncOrderRepository:
+    """Read-only Order queries for async route handlers
+
+    Single orders are loaded as ORM objects with everything OrderResponse
+    touches (async sessions cannot lazy-load). List methods return plain row
+    mappings shaped like OrderResponse, which the routes serialize without
+    building or validating an object per row.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _all(self, stmt) -> List[Dict[str, Any]]:
+        """Order rows of stmt with their details and payment amount, as dicts"""
+        orders = [dict(row) for row in (await self.db.execute(stmt)).mappings()]
+        if not orders:
+            return []
+        order_ids = [order["order_id"] for order in orders]
+
+        details: Dict[int, List[Dict[str, Any]]] = {order_id: [] for order_id in order_ids}
+        detail_rows = await self.db.execute(
+            select(*_DETAIL_ROW_COLUMNS).where(OrderDetail.order_id.in_(order_ids))
+        )
+        for row in detail_rows.mappings():
+            details[row["order_id"]].append(dict(row))
+
+        # First payment per order, as OrderResponse.payment_amount reads it
+        amounts = dict((await self.db.execute(
+            select(Payment.order_id, Payment.amount)
+            .where(Payment.order_id.in_(order_ids))
+            .ext(distinct_on(Payment.order_id))
+            .order_by(Payment.order_id, Payment.payment_id)
+        )).all())
+
+        for order in orders:
+            order["order_details"] = details[order["order_id"]]
+            order["payment_amount"] = amounts.get(order["order_id"])
+        return orders
+
+    async def get(self, order_id: int) -> Optional[Order]:
+        """Get order by ID with relationships"""
+        return (await self.db.scalars(_ORDER_BY_ID, {"order_id": order_id})).first()
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get all orders with pagination"""
+        return await self._all(
+            select(*_ORDER_ROW_COLUMNS).where(Order.is_deleted == False)
+            .order_by(Order.order_date.desc()).offset(skip).limit(limit)
+        )
+
+    async def get_by_customer(self, customer_id: int, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get orders by customer ID"""
+        return await self._all(
+            select(*_ORDER_ROW_COLUMNS).where(
+                and_(Order.customer_id == customer_id, Order.is_deleted == False)
+            ).order_by(Order.order_date.desc()).offset(skip).limit(limit)
+        )
+
+    async def get_by_status(self, status: str, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get orders by status"""
+        return await self._all(
+            select(*_ORDER_ROW_COLUMNS).where(
+                and_(Order.status == status, Order.is_deleted == False)
+            ).order_by(Order.order_date.desc()).offset(skip).limit(limit)
+        )
+
+    async def get_by_date_range(
+        self, start_date: date, end_date: date, skip: int = 0, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Get orders within date range"""
+        return await self._all(
+            select(*_ORDER_ROW_COLUMNS).where(
+                and_(
+                    Order.order_date >= start_date,
+                    Order.order_date <= end_date,
+                    Order.is_deleted == False
+                )
+            ).order_by(Order.order_date.desc()).offset(skip).limit(limit)
+        )
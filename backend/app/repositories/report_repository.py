@@ -0,0 +1,121 @@
+from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+_dashboard_cache = TTLCache("dashboard", maxsize=8, ttl=settings.DASHBOARD_CACHE_TTL_SECONDS)
+
+# Order figures come from the daily_sales rollup: a handful of rows per day
+# instead of every order and payment
+_ORDER_KPIS = text(
+    """
+    SELECT
+        COALESCE(SUM(order_count) FILTER (WHERE order_date = :today), 0) AS today_orders,
+        COALESCE(SUM(order_count) FILTER (WHERE order_date = :yesterday), 0) AS yesterday_orders,
+        COALESCE(SUM(revenue) FILTER (WHERE order_date = :today), 0) AS today_revenue,
+        COALESCE(SUM(revenue) FILTER (WHERE order_date = :yesterday), 0) AS yesterday_revenue,
+        COALESCE(SUM(order_count) FILTER (WHERE status = 'pending'), 0) AS pending_orders,
+        COALESCE(SUM(order_count) FILTER (WHERE status = 'completed'), 0) AS completed_orders,
+        COALESCE(SUM(order_count) FILTER (WHERE status = 'cancelled'), 0) AS cancelled_orders,
+        COALESCE(SUM(revenue) FILTER (WHERE status = 'completed'), 0) AS completed_revenue
+    FROM daily_sales
+    WHERE order_date <= :today
+    """
+)
+
+_ENTITY_KPIS = text(
+    """
+    SELECT
+        (SELECT COUNT(*) FROM employees WHERE is_deleted = FALSE) AS total_employees,
+        (SELECT COUNT(*) FROM menu_items WHERE is_deleted = FALSE) AS total_menu_items,
+        (SELECT COUNT(*) FROM menu_items WHERE is_deleted = FALSE AND is_available = TRUE) AS available_menu_items,
+        (SELECT COUNT(*) FROM inventory WHERE is_deleted = FALSE AND quantity <= min_threshold) AS low_stock_count,
+        (SELECT COUNT(*) FROM customers WHERE is_deleted = FALSE) AS total_customers,
+        (SELECT COALESCE(SUM(loyalty_points), 0) FROM customers WHERE is_deleted = FALSE) AS total_loyalty_points
+    """
+)
+
+_TOP_CUSTOMERS = text(
+    """
+    SELECT customer_id, name, phone, email, loyalty_points
+    FROM customers
+    WHERE is_deleted = FALSE
+    ORDER BY loyalty_points DESC, customer_id
+    LIMIT 3
+    """
+)
+
+_ITEM_SALES = text(
+    """
+    SELECT s.item_id, m.name, m.category,
+           SUM(s.quantity) AS quantity,
+           SUM(s.revenue) AS revenue,
+           SUM(s.order_count) AS order_count
+    FROM item_sales_daily s
+    JOIN menu_items m ON m.item_id = s.item_id
+    WHERE s.order_date BETWEEN :start_date AND :end_date
+    GROUP BY s.item_id, m.name, m.category
+    """
+)
+
+
+class ReportRepository:
+    """Repository for aggregate reporting queries"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_dashboard(self, as_of: date) -> Dict[str, Any]:
+        """Manager dashboard KPIs in three aggregate queries, cached briefly"""
+        cached = _dashboard_cache.get(as_of)
+        if cached is not None:
+            return cached
+
+        yesterday = as_of - timedelta(days=1)
+        orders = self.db.execute(
+            _ORDER_KPIS, {"today": as_of, "yesterday": yesterday}
+        ).mappings().one()
+        entities = self.db.execute(_ENTITY_KPIS).mappings().one()
+        top_customers = [dict(row) for row in self.db.execute(_TOP_CUSTOMERS).mappings()]
+
+        today_revenue = orders["today_revenue"]
+        yesterday_revenue = orders["yesterday_revenue"]
+        revenue_change = (
+            round(float((today_revenue - yesterday_revenue) / yesterday_revenue * 100), 1)
+            if yesterday_revenue > 0
+            else 0.0
+        )
+        completed = orders["completed_orders"]
+        avg_order_value = (
+            (orders["completed_revenue"] / completed).quantize(Decimal("0.01"))
+            if completed
+            else Decimal("0.00")
+        )
+
+        result = {
+            "as_of": as_of,
+            **orders,
+            **entities,
+            "revenue_change_pct": revenue_change,
+            "avg_order_value": avg_order_value,
+            "top_customers": top_customers,
+        }
+        _dashboard_cache.set(as_of, result)
+        return result
+
+    def get_item_sales(self, start_date: date, end_date: date) -> Dict[int, Dict[str, Any]]:
+        """Quantity, revenue and order count per menu item, read from item_sales_daily"""
+        rows = self.db.execute(
+            _ITEM_SALES, {"start_date": start_date, "end_date": end_date}
+        ).mappings()
+        return {row["item_id"]: dict(row) for row in rows}
+
+    def get_refreshed_at(self, view_name: str) -> Optional[datetime]:
+        """When a materialized report view was last refreshed"""
+        return self.db.execute(
+            text("SELECT refreshed_at FROM report_refreshes WHERE view_name = :name"),
+            {"name": view_name},
+        ).scalar()
@@ -1,5 +1,12 @@
 from app.schemas.employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse
-from app.schemas.customer import CustomerCreate, CustomerUpdate, CustomerResponse
+from app.schemas.customer import (
+    CustomerCreate,
+    CustomerUpdate,
+    CustomerResponse,
+    CustomerStatsResponse,
+    CustomerSegmentResponse,
+    CustomerListResponse,
+)
 from app.schemas.ingredient import IngredientCreate, IngredientUpdate, IngredientResponse
 from app.schemas.menu_item import MenuItemCreate, MenuItemUpdate, MenuItemResponse
 from app.schemas.inventory import InventoryCreate, InventoryUpdate, InventoryResponse
@@ -13,6 +20,9 @@ __all__ = [
     "CustomerCreate",
     "CustomerUpdate",
     "CustomerResponse",
+    "CustomerStatsResponse",
+    "CustomerSegmentResponse",
+    "CustomerListResponse",
     "IngredientCreate",
     "IngredientUpdate",
     "IngredientResponse",
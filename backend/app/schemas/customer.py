@@ -1,6 +1,6 @@
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_serializer
+from pydantic import BaseModel, EmailStr, Field, ConfigDict
 from decimal import Decimal
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 
@@ -30,10 +30,35 @@ class CustomerResponse(CustomerBase):
 
     model_config = ConfigDict(from_attributes=True)
 
-    @field_serializer('created_at', 'updated_at')
-    def serialize_datetime(self, dt: datetime | None, _info) -> str | None:
-        """Serialize datetime to ISO format string"""
-        if dt is None:
-            return None
-        return dt.isoformat()
 
+
+class CustomerStatsResponse(BaseModel):
+    """Lifetime statistics from the customer_stats rollup"""
+    customer_id: int
+    visit_count: int = 0
+    completed_count: int = 0
+    lifetime_spend: Decimal = Decimal("0.00")
+    average_ticket: Decimal = Decimal("0.00")
+    last_visit_date: Optional[date] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CustomerSegmentResponse(BaseModel):
+    """RFM segment computed by the segmentation batch job"""
+    segment: str
+    recency_days: int
+    frequency: int
+    monetary: Decimal
+    r_score: int
+    f_score: int
+    m_score: int
+    computed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CustomerListResponse(CustomerResponse):
+    """Customer row with lifetime statistics and segment for the customer list"""
+    stats: Optional[CustomerStatsResponse] = None
+    segment: Optional[CustomerSegmentResponse] = None
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_serializer
+from pydantic import BaseModel, EmailStr, Field, ConfigDict
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
@@ -34,10 +34,3 @@ class EmployeeResponse(EmployeeBase):
 
     model_config = ConfigDict(from_attributes=True)
 
-    @field_serializer('created_at', 'updated_at')
-    def serialize_datetime(self, dt: datetime | None, _info) -> str | None:
-        """Serialize datetime to ISO format string"""
-        if dt is None:
-            return None
-        return dt.isoformat()
-
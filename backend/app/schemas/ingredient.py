@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict, field_serializer
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 
@@ -25,10 +25,3 @@ class IngredientResponse(IngredientBase):
 
     model_config = ConfigDict(from_attributes=True)
 
-    @field_serializer('created_at', 'updated_at')
-    def serialize_datetime(self, dt: datetime | None, _info) -> str | None:
-        """Serialize datetime to ISO format string"""
-        if dt is None:
-            return None
-        return dt.isoformat()
-
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict, field_serializer
+from pydantic import BaseModel, Field, ConfigDict
 from decimal import Decimal
 from datetime import datetime
 from typing import Optional
@@ -41,10 +41,3 @@ class InventoryResponse(InventoryBase):
 
     model_config = ConfigDict(from_attributes=True)
 
-    @field_serializer('created_at', 'updated_at', 'last_updated')
-    def serialize_datetime(self, dt: datetime | None, _info) -> str | None:
-        """Serialize datetime to ISO format string"""
-        if dt is None:
-            return None
-        return dt.isoformat()
-
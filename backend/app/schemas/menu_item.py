@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field, ConfigDict, field_serializer
+from pydantic import BaseModel, Field, ConfigDict
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 
 
@@ -34,10 +34,10 @@ class MenuItemResponse(MenuItemBase):
 
     model_config = ConfigDict(from_attributes=True)
 
-    @field_serializer('created_at', 'updated_at')
-    def serialize_datetime(self, dt: datetime | None, _info) -> str | None:
-        """Serialize datetime to ISO format string"""
-        if dt is None:
-            return None
-        return dt.isoformat()
 
+
+class MenuCategoryResponse(BaseModel):
+    """Menu items of one category with count"""
+    category: str
+    item_count: int
+    items: List[MenuItemResponse] = []
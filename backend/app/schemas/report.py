@@ -0,0 +1,70 @@
+from pydantic import BaseModel, ConfigDict
+from decimal import Decimal
+from datetime import date, datetime
+from typing import List, Optional
+
+
+class TopCustomer(BaseModel):
+    customer_id: int
+    name: str
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    loyalty_points: Decimal
+
+
+class DashboardResponse(BaseModel):
+    """Manager dashboard KPIs, computed server-side"""
+    as_of: date
+    today_revenue: Decimal
+    yesterday_revenue: Decimal
+    revenue_change_pct: float
+    today_orders: int
+    yesterday_orders: int
+    pending_orders: int
+    completed_orders: int
+    cancelled_orders: int
+    completed_revenue: Decimal
+    avg_order_value: Decimal
+    total_employees: int
+    total_menu_items: int
+    available_menu_items: int
+    low_stock_count: int
+    total_customers: int
+    total_loyalty_points: Decimal
+    top_customers: List[TopCustomer] = []
+
+
+class DailySalesResponse(BaseModel):
+    order_date: date
+    order_count: int
+    completed_count: int
+    cancelled_count: int
+    completed_revenue: Decimal
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class HeatmapResponse(BaseModel):
+    """Orders and revenue by weekday (rows, Monday first) and hour of day (columns)"""
+    start_date: date
+    end_date: date
+    timezone: str
+    orders: List[List[int]]
+    revenue: List[List[Decimal]]
+
+
+class TopItem(BaseModel):
+    item_id: int
+    name: str
+    category: str
+    quantity: int
+    revenue: Decimal
+    order_count: int
+
+
+class TopItemsResponse(BaseModel):
+    start_date: date
+    end_date: date
+    sort_by: str
+    refreshed_at: Optional[datetime] = None  # data is as fresh as this view refresh
+    items: List[TopItem]
@@ -121,3 +121,83 @@ CREATE TABLE IF NOT EXISTS menu_item_ingredients (
     CONSTRAINT fk_menu_item_ingredient_ingredient FOREIGN KEY (ingredient_id) REFERENCES ingredients(ingredient_id) ON DELETE CASCADE
 );
 
+
+-- Create customer_stats rollup table (maintained incrementally by order writes)
+CREATE TABLE IF NOT EXISTS customer_stats (
+    customer_id INTEGER PRIMARY KEY,
+    visit_count INTEGER DEFAULT 0 NOT NULL,
+    completed_count INTEGER DEFAULT 0 NOT NULL,
+    lifetime_spend DECIMAL(12, 2) DEFAULT 0 NOT NULL,
+    last_visit_date DATE,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    CONSTRAINT fk_customer_stats_customer FOREIGN KEY (customer_id) REFERENCES customers(customer_id) ON DELETE CASCADE
+);
+
+-- Create customer_segments table (RFM segments written by the batch job)
+CREATE TABLE IF NOT EXISTS customer_segments (
+    customer_id INTEGER PRIMARY KEY,
+    recency_days INTEGER NOT NULL,
+    frequency INTEGER NOT NULL,
+    monetary DECIMAL(12, 2) NOT NULL,
+    r_score SMALLINT NOT NULL,
+    f_score SMALLINT NOT NULL,
+    m_score SMALLINT NOT NULL,
+    segment VARCHAR(30) NOT NULL,
+    computed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    CONSTRAINT fk_customer_segments_customer FOREIGN KEY (customer_id) REFERENCES customers(customer_id) ON DELETE CASCADE
+);
+
+-- Create daily_sales rollup table (maintained incrementally by order and payment writes)
+CREATE TABLE IF NOT EXISTS daily_sales (
+    order_date DATE NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    payment_method VARCHAR(50) NOT NULL,
+    order_count INTEGER DEFAULT 0 NOT NULL,
+    total_amount DECIMAL(14, 2) DEFAULT 0 NOT NULL,
+    revenue DECIMAL(14, 2) DEFAULT 0 NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    PRIMARY KEY (order_date, status, payment_method)
+);
+
+-- Create hourly_sales rollup table (non-cancelled orders per day and local hour)
+CREATE TABLE IF NOT EXISTS hourly_sales (
+    order_date DATE NOT NULL,
+    hour SMALLINT NOT NULL CHECK (hour BETWEEN 0 AND 23),
+    order_count INTEGER DEFAULT 0 NOT NULL,
+    revenue DECIMAL(14, 2) DEFAULT 0 NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    PRIMARY KEY (order_date, hour)
+);
+
+-- Create item_sales_daily materialized view (refreshed CONCURRENTLY by the report refresher)
+CREATE MATERIALIZED VIEW IF NOT EXISTS item_sales_daily AS
+SELECT
+    o.order_date,
+    od.item_id,
+    COUNT(*) AS order_count,
+    SUM(od.quantity) AS quantity,
+    SUM(od.subtotal) AS revenue
+FROM order_details od
+JOIN orders o ON o.order_id = od.order_id
+WHERE o.is_deleted = FALSE
+  AND od.is_deleted = FALSE
+  AND o.status <> 'cancelled'
+GROUP BY o.order_date, od.item_id;
+
+-- Create report_refreshes table (last refresh time of each materialized view)
+CREATE TABLE IF NOT EXISTS report_refreshes (
+    view_name VARCHAR(63) PRIMARY KEY,
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+-- Create order_events table (append-only log of order status transitions)
+CREATE TABLE IF NOT EXISTS order_events (
+    event_id BIGSERIAL PRIMARY KEY,
+    order_id INTEGER NOT NULL,
+    from_status VARCHAR(20),
+    to_status VARCHAR(20) NOT NULL,
+    employee_id INTEGER,
+    occurred_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    CONSTRAINT fk_order_events_order FOREIGN KEY (order_id) REFERENCES orders(order_id) ON DELETE CASCADE,
+    CONSTRAINT fk_order_events_employee FOREIGN KEY (employee_id) REFERENCES employees(emp_id) ON DELETE SET NULL
+);
@@ -17,7 +17,7 @@ ALTER TABLE inventory
 -- Orders constraints
 ALTER TABLE orders
     ADD CONSTRAINT check_total_amount_non_negative CHECK (total_amount >= 0),
-    ADD CONSTRAINT check_order_status CHECK (status IN ('pending', 'completed', 'cancelled'));
+    ADD CONSTRAINT check_order_status CHECK (status IN ('pending', 'in_progress', 'completed', 'cancelled'));
 
 -- Order details constraints
 ALTER TABLE order_details
@@ -12,6 +12,21 @@ CREATE UNIQUE INDEX IF NOT EXISTS ix_customers_phone ON customers(phone) WHERE p
 CREATE UNIQUE INDEX IF NOT EXISTS ix_customers_email ON customers(email) WHERE email IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_customer_phone_email ON customers(phone, email);
 
+-- Customer search (trigram + normalized prefix lookups)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_customer_name_trgm ON customers USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_customer_email_trgm ON customers USING gin (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_customer_phone_digits ON customers (regexp_replace(phone, '[^0-9]', '', 'g') text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_customer_email_lower ON customers (lower(email));
+
+-- Customer stats indexes (sortable customer list)
+CREATE INDEX IF NOT EXISTS idx_customer_stats_lifetime_spend ON customer_stats(lifetime_spend);
+CREATE INDEX IF NOT EXISTS idx_customer_stats_visit_count ON customer_stats(visit_count);
+CREATE INDEX IF NOT EXISTS idx_customer_stats_last_visit_date ON customer_stats(last_visit_date);
+
+-- Customer segments indexes
+CREATE INDEX IF NOT EXISTS idx_customer_segments_segment ON customer_segments(segment);
+
 -- Ingredients indexes
 CREATE INDEX IF NOT EXISTS ix_ingredients_ingredient_id ON ingredients(ingredient_id);
 CREATE UNIQUE INDEX IF NOT EXISTS ix_ingredients_name ON ingredients(name);
@@ -53,3 +68,10 @@ CREATE INDEX IF NOT EXISTS idx_payment_date_status ON payments(payment_date, sta
 CREATE INDEX IF NOT EXISTS ix_menu_item_ingredients_item_id ON menu_item_ingredients(item_id);
 CREATE INDEX IF NOT EXISTS ix_menu_item_ingredients_ingredient_id ON menu_item_ingredients(ingredient_id);
 
+-- Item sales view index (required for REFRESH MATERIALIZED VIEW CONCURRENTLY)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_item_sales_daily_date_item ON item_sales_daily(order_date, item_id);
+
+-- Order events indexes
+CREATE INDEX IF NOT EXISTS idx_order_events_order ON order_events(order_id, occurred_at);
+CREATE INDEX IF NOT EXISTS idx_order_events_occurred_at ON order_events(occurred_at);
+
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Backfill the daily_sales and hourly_sales rollups from orders and payments
+
+Rebuilds one month per transaction so long ranges do not hold the rollup
+lock for long. Defaults to the whole order history.
+
+Usage:
+    python scripts/backfill_daily_sales.py [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+"""
+
+import argparse
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func
+from app.core.database import SessionLocal
+from app.models.order import Order
+from app.repositories.daily_sales_repository import DailySalesRepository
+
+
+def month_ranges(start: date, end: date):
+    """Yield (first, last) day pairs covering start..end, one per calendar month"""
+    current = start
+    while current <= end:
+        next_month = (current.replace(day=1) + timedelta(days=32)).replace(day=1)
+        yield current, min(next_month - timedelta(days=1), end)
+        current = next_month
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill the daily_sales and hourly_sales rollups")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat, default=None, help="First day (default: earliest order)")
+    parser.add_argument("--to", dest="end", type=date.fromisoformat, default=None, help="Last day (default: latest order)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        first, last = db.query(func.min(Order.order_date), func.max(Order.order_date)).one()
+        start = args.start or first
+        end = args.end or last
+        if start is None or end is None:
+            print("No orders found; nothing to backfill.")
+            return
+
+        repo = DailySalesRepository(db)
+        total = 0
+        for month_start, month_end in month_ranges(start, end):
+            rows = repo.rebuild(month_start, month_end)
+            total += rows
+            print(f"{month_start:%Y-%m}: {rows} rows")
+        print(f"Backfilled daily_sales {start}..{end}: {total} rows")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark sync vs async database access at increasing client concurrency
+
+Models how FastAPI runs each route style: sync handlers go through AnyIO's
+thread pool (THREADPOOL_TOKENS threads) with a Session, async handlers are
+awaited on the event loop with an AsyncSession. Every simulated request
+loads the barista queue (orders by status) like GET /orders/status/pending.
+
+Usage:
+    python scripts/benchmark_async_db.py --clients 50 200 1000 --requests 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from anyio import CapacityLimiter, to_thread
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, SessionLocal, async_engine, engine
+from app.repositories.order_repository import AsyncOrderRepository, OrderRepository
+
+
+def sync_request(status, limit):
+    db = SessionLocal()
+    try:
+        return len(OrderRepository(db).get_by_status(status, limit=limit))
+    finally:
+        db.close()
+
+
+async def async_request(status, limit):
+    async with AsyncSessionLocal() as db:
+        return len(await AsyncOrderRepository(db).get_by_status(status, limit=limit))
+
+
+async def run(label, request, clients, requests_per_client):
+    """Run clients concurrently and print throughput and latency percentiles"""
+    latencies = []
+
+    async def client():
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+    print(
+        f"{clients:>5} clients  {label:<6} {len(latencies) / elapsed:>8.0f} req/s   "
+        f"p50 {p50:8.2f} ms   p95 {p95:8.2f} ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--requests", type=int, default=20, help="Requests per client")
+    parser.add_argument("--status", default="pending")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--threads", type=int, default=settings.THREADPOOL_TOKENS)
+    args = parser.parse_args()
+
+    limiter = CapacityLimiter(args.threads)
+
+    async def sync_path():
+        return await to_thread.run_sync(sync_request, args.status, args.limit, limiter=limiter)
+
+    async def async_path():
+        return await async_request(args.status, args.limit)
+
+    # Open a connection in each pool before timing
+    await sync_path()
+    await async_path()
+
+    print(
+        f"{args.threads} sync threads, pool {engine.pool.size()} + overflow, "
+        f"{args.requests} requests per client\n"
+    )
+    try:
+        for clients in args.clients:
+            await run("sync", sync_path, clients, args.requests)
+            await run("async", async_path, clients, args.requests)
+    finally:
+        await async_engine.dispose()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Measure response compression: bytes on the wire and CPU per response
+
+Offline (default): builds limit=1000 list payloads for customers, orders,
+inventory and ingredients from their response schemas, with varied values,
+and reports the compressed size and the CPU time to compress one response
+at several gzip levels and brotli qualities (brotli only if installed).
+
+Live (--url): fetches real endpoints from a running API once per
+Accept-Encoding and reports the bytes received and the response time.
+
+Usage:
+    python scripts/benchmark_compression.py --rows 1000
+    python scripts/benchmark_compression.py --url http://localhost:8000 --token <jwt>
+"""
+
+import argparse
+import gzip
+import random
+import sys
+import time
+import types
+import typing
+import urllib.request
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, List
+
+from pydantic import BaseModel, TypeAdapter
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import compression
+from app.core.config import settings
+from app.schemas.customer import CustomerListResponse
+from app.schemas.ingredient import IngredientResponse
+from app.schemas.inventory import InventoryResponse
+from app.schemas.order import OrderResponse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PAYLOADS = {
+    "customers": CustomerListResponse,
+    "orders": OrderResponse,
+    "inventory": InventoryResponse,
+    "ingredients": IngredientResponse,
+}
+
+LIVE_PATHS = [
+    "/api/v1/customers?limit=1000",
+    "/api/v1/orders?limit=1000",
+    "/api/v1/inventory?limit=1000",
+    "/api/v1/ingredients?limit=1000",
+]
+
+WORDS = ["latte", "mocha", "oat", "vanilla", "espresso", "cold", "brew", "syrup", "milk", "beans"]
+
+
+def fake_value(annotation, name: str, rng: random.Random) -> Any:
+    """A plausible, varied value for one schema field"""
+    origin = typing.get_origin(annotation)
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    if origin in (typing.Union, types.UnionType):
+        return fake_value(args[0], name, rng)
+    if origin in (list, List):
+        return [fake_value(args[0], name, rng) for _ in range(rng.randint(1, 4))]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return fake_row(annotation, rng)
+    if annotation is bool:
+        return rng.random() < 0.1
+    if annotation is int:
+        return rng.randint(1, 50_000)
+    if annotation is Decimal:
+        return Decimal(rng.randint(0, 50_000)) / 100
+    if annotation is datetime:
+        return datetime.now(timezone.utc) - timedelta(seconds=rng.randint(0, 90 * 86_400))
+    if annotation is date:
+        return date.today() - timedelta(days=rng.randint(0, 90))
+    if name == "email":
+        return f"{rng.choice(WORDS)}.{rng.randint(1, 99_999)}@example.com"
+    if name == "phone":
+        return f"08{rng.randint(10_000_000, 99_999_999)}"
+    if name == "status":
+        return rng.choice(["pending", "in_progress", "completed", "cancelled"])
+    return " ".join(rng.choice(WORDS) for _ in range(2)).title()
+
+
+def fake_row(model, rng: random.Random) -> dict:
+    return {name: fake_value(field.annotation, name, rng) for name, field in model.model_fields.items()}
+
+
+def build_payload(model, rows: int) -> bytes:
+    """JSON body of a list endpoint, as FastAPI would send it"""
+    rng = random.Random(rows)
+    adapter = TypeAdapter(List[model])
+    return adapter.dump_json(adapter.validate_python([fake_row(model, rng) for _ in range(rows)]))
+
+
+def cpu_ms(fn, repeat: int) -> float:
+    """Median CPU milliseconds per call"""
+    samples = []
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        samples.append(time.process_time() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def offline(rows: int, repeat: int):
+    codecs = [
+        (f"gzip-{level}", lambda body, level=level: gzip.compress(body, level, mtime=0))
+        for level in (1, 4, 6, 9)
+    ]
+    if brotli is not None:
+        codecs += [
+            (f"br-{quality}", lambda body, quality=quality: brotli.compress(body, quality=quality))
+            for quality in (1, 4, 11)
+        ]
+    else:
+        print("brotli not installed; gzip only (pip install brotli)\n")
+
+    print(f"{'payload':<12} {'codec':<8} {'bytes':>10} {'ratio':>7} {'CPU ms':>8}")
+    for name, model in PAYLOADS.items():
+        body = build_payload(model, rows)
+        print(f"{name:<12} {'none':<8} {len(body):>10,} {1:>7.1f} {0:>8.2f}")
+        for codec, fn in codecs:
+            size = len(fn(body))
+            print(f"{'':<12} {codec:<8} {size:>10,} {len(body) / size:>7.1f} {cpu_ms(lambda: fn(body), repeat):>8.2f}")
+
+
+def live(base_url: str, token: str):
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    print(f"{'path':<36} {'encoding':<10} {'bytes':>10} {'ms':>8}")
+    for path in LIVE_PATHS:
+        for encoding in encodings:
+            headers = {"Accept-Encoding": encoding}
+            if token:
+                headers["Authorization"] = f"Bearer {token}"
+            request = urllib.request.Request(base_url.rstrip("/") + path, headers=headers)
+            start = time.perf_counter()
+            with urllib.request.urlopen(request) as response:
+                size = len(response.read())  # urllib does not decode, so this is the wire size
+                used = response.headers.get("Content-Encoding", "identity")
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{path:<36} {used:<10} {size:>10,} {elapsed:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--url", help="Base URL of a running API to measure instead")
+    parser.add_argument("--token", default="", help="Bearer token for the live endpoints")
+    args = parser.parse_args()
+
+    if args.url:
+        live(args.url, args.token)
+    else:
+        print(
+            f"Server: {', '.join(compression.available_encodings())}, "
+            f"gzip level {settings.COMPRESSION_GZIP_LEVEL}, brotli quality {settings.COMPRESSION_BROTLI_QUALITY}\n"
+        )
+        offline(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
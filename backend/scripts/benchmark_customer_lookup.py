@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark checkout customer lookups (by phone) under concurrency
+
+Compares the uncached query against CustomerRepository.get_by_phone, which is
+served from the in-process lookup cache after the first hit.
+
+Usage:
+    python scripts/benchmark_customer_lookup.py --workers 32 --lookups 20000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import and_
+from app.core.cache import cache_stats
+from app.core.database import SessionLocal
+from app.models.customer import Customer
+from app.repositories.customer_repository import CustomerRepository
+
+
+def uncached_lookup(phone):
+    db = SessionLocal()
+    try:
+        return (
+            db.query(Customer)
+            .filter(and_(Customer.phone == phone, Customer.is_deleted == False))
+            .first()
+        )
+    finally:
+        db.close()
+
+
+def cached_lookup(phone):
+    db = SessionLocal()
+    try:
+        return CustomerRepository(db).get_by_phone(phone)
+    finally:
+        db.close()
+
+
+def run(label, lookup, phones, workers, lookups):
+    """Run lookups concurrently and print throughput and latency percentiles"""
+
+    def timed(phone):
+        start = time.perf_counter()
+        lookup(phone)
+        return time.perf_counter() - start
+
+    # Regulars dominate checkout traffic: draw phones with a skewed distribution
+    sample = random.choices(phones, weights=[1 / (i + 1) for i in range(len(phones))], k=lookups)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        latencies = sorted(pool.map(timed, sample))
+    elapsed = time.perf_counter() - start
+
+    p50 = statistics.median(latencies) * 1000
+    p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+    print(
+        f"{label:<10} {lookups / elapsed:>10.0f} lookups/s   "
+        f"p50 {p50:6.2f} ms   p95 {p95:6.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--customers", type=int, default=500, help="Distinct phones to draw from")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        phones = [
+            phone
+            for (phone,) in db.query(Customer.phone)
+            .filter(and_(Customer.phone.isnot(None), Customer.is_deleted == False))
+            .limit(args.customers)
+            .all()
+        ]
+    finally:
+        db.close()
+
+    if not phones:
+        print("No customers with phone numbers found; seed the database first.")
+        return
+
+    print(f"{len(phones)} phones, {args.workers} workers, {args.lookups} lookups\n")
+    run("uncached", uncached_lookup, phones, args.workers, args.lookups)
+    run("cached", cached_lookup, phones, args.workers, args.lookups)
+    print(f"\ncache: {cache_stats()['customer_lookup']}")
+
+
+if __name__ == "__main__":
+    main()
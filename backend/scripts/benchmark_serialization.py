@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON serialization of order list responses
+
+Builds N orders (default 1000, three line items and a payment each) as ORM
+objects, the way the list endpoints return them, and times turning them into
+the JSON body FastAPI sends for response_model=List[OrderResponse]:
+
+- hooks:   the previous schemas, with a field_serializer per datetime and a
+           model_validator copying the payment amount onto the ORM object
+- native:  the current schemas, validated from attributes and dumped by
+           pydantic-core with no Python callbacks (FastAPI's default path)
+- rows:    row mappings as AsyncOrderRepository's list methods return them,
+           serialized by pydantic_core.to_json without validation (the
+           order list routes); checked to produce the same bytes as native
+- orjson:  the current schemas dumped to Python objects, then orjson.dumps
+           (what an orjson response class would do), if orjson is installed
+
+Usage:
+    python scripts/benchmark_serialization.py --orders 1000 --repeat 20
+"""
+
+import argparse
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_serializer, model_validator
+from pydantic_core import to_json
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.order import Order, OrderDetail
+from app.models.payment import Payment
+from app.repositories.order_repository import _DETAIL_ROW_COLUMNS, _ORDER_ROW_COLUMNS
+from app.schemas.order import OrderBase, OrderDetailBase, OrderResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Previous response schemas, kept here for comparison
+class HookedOrderDetailResponse(OrderDetailBase):
+    order_id: int
+    created_at: datetime
+    updated_at: datetime
+    is_deleted: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_serializer('created_at', 'updated_at')
+    def serialize_datetime(self, dt: datetime | None, _info) -> str | None:
+        if dt is None:
+            return None
+        return dt.isoformat()
+
+
+class HookedOrderResponse(OrderBase):
+    order_id: int
+    created_at: datetime
+    updated_at: datetime
+    is_deleted: bool
+    order_details: List[HookedOrderDetailResponse] = []
+    payment_amount: Optional[Decimal] = Field(None, ge=0, decimal_places=2)
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @model_validator(mode='before')
+    @classmethod
+    def populate_payment_amount(cls, data):
+        if hasattr(data, 'payments'):
+            payments = data.payments
+            if payments and isinstance(payments, list) and hasattr(payments[0], 'amount'):
+                setattr(data, 'payment_amount', payments[0].amount)
+        return data
+
+    @field_serializer('created_at', 'updated_at')
+    def serialize_datetime(self, dt: datetime | None, _info) -> str | None:
+        if dt is None:
+            return None
+        return dt.isoformat()
+
+
+def build_orders(count: int) -> List[Order]:
+    """Transient ORM orders shaped like the rows the list endpoints load"""
+    now = datetime.now(timezone.utc)
+    orders = []
+    for order_id in range(1, count + 1):
+        created = now - timedelta(minutes=order_id)
+        details = [
+            OrderDetail(
+                order_id=order_id,
+                item_id=item_id,
+                quantity=2,
+                unit_price=Decimal("3.50"),
+                subtotal=Decimal("7.00"),
+                created_at=created,
+                updated_at=created,
+                is_deleted=False,
+            )
+            for item_id in (1, 2, 3)
+        ]
+        orders.append(
+            Order(
+                order_id=order_id,
+                customer_id=order_id % 50 or None,
+                order_date=date.today(),
+                total_amount=Decimal("21.00"),
+                status="pending",
+                created_at=created,
+                updated_at=created,
+                is_deleted=False,
+                order_details=details,
+                payments=[Payment(amount=Decimal("21.00"), payment_method="cash")],
+            )
+        )
+    return orders
+
+
+def as_rows(orders: List[Order]):
+    """The same orders as the row mappings the list queries return"""
+    return [
+        {
+            **{column.name: getattr(order, column.name) for column in _ORDER_ROW_COLUMNS},
+            "order_details": [
+                {column.name: getattr(detail, column.name) for column in _DETAIL_ROW_COLUMNS}
+                for detail in order.order_details
+            ],
+            "payment_amount": order.payments[0].amount if order.payments else None,
+        }
+        for order in orders
+    ]
+
+
+def best_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per mode; the best is reported")
+    args = parser.parse_args()
+
+    orders = build_orders(args.orders)
+    rows = as_rows(orders)
+    hooked = TypeAdapter(List[HookedOrderResponse])
+    native = TypeAdapter(List[OrderResponse])
+
+    modes = [
+        ("hooks", lambda: hooked.dump_json(hooked.validate_python(orders))),
+        ("native", lambda: native.dump_json(native.validate_python(orders))),
+        ("rows", lambda: to_json(rows)),
+    ]
+    if orjson is not None:
+        modes.append((
+            "orjson",
+            lambda: orjson.dumps(native.dump_python(native.validate_python(orders)), default=str),
+        ))
+
+    if to_json(rows) != native.dump_json(native.validate_python(orders)):
+        sys.exit("Row mappings do not serialize to the same JSON as List[OrderResponse]")
+
+    print(f"{args.orders} orders, best of {args.repeat}\n")
+    print(f"{'mode':<8} {'validate':>10} {'serialize':>10} {'total':>10}  (ms)   bytes")
+    for name, run in modes:
+        if name == "rows":
+            total_ms = best_ms(run, args.repeat)
+            print(f"{name:<8} {'-':>10} {total_ms:>10.2f} {total_ms:>10.2f}        {len(run()):,}")
+            continue
+        adapter = hooked if name == "hooks" else native
+        validated = adapter.validate_python(orders)
+        validate_ms = best_ms(lambda: adapter.validate_python(orders), args.repeat)
+        if name == "orjson":
+            serialize_ms = best_ms(lambda: orjson.dumps(adapter.dump_python(validated), default=str), args.repeat)
+        else:
+            serialize_ms = best_ms(lambda: adapter.dump_json(validated), args.repeat)
+        total_ms = best_ms(run, args.repeat)
+        print(f"{name:<8} {validate_ms:>10.2f} {serialize_ms:>10.2f} {total_ms:>10.2f}        {len(run()):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark the hot lookups, before and after prebuilt statements
+
+"Before" rebuilds each lookup the way the repositories used to (db.query(...)
+with filters and loader options on every call); "after" executes the
+module-level statements with bound parameters. Both go through the same
+Session.execute path: cache key, compiled cache lookup, execution and ORM
+result handling. Without --db they run against empty tables in an in-memory
+SQLite database, so nearly all of the time is Python overhead; a cold
+compile (the cost the compiled cache saves) is shown for reference. With
+--db they run against the configured database and include the round trip.
+
+Usage:
+    python scripts/benchmark_statement_cache.py --iterations 20000
+    python scripts/benchmark_statement_cache.py --db --iterations 2000 --order-id 1 --item-id 1 --ingredient-id 1 --emp-id 1
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import and_, create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.api import auth
+from app.models import Base
+from app.models.employee import Employee
+from app.models.inventory import Inventory
+from app.models.junction_tables import MenuItemIngredient
+from app.models.menu_item import MenuItem
+from app.models.order import Order, OrderDetail
+from app.repositories import inventory_repository, menu_item_repository, order_repository
+
+
+# Previous per-call construction, kept here for comparison
+def order_query(db, order_id):
+    return db.query(Order).filter(
+        and_(Order.order_id == order_id, Order.is_deleted == False)
+    ).options(
+        joinedload(Order.customer),
+        selectinload(Order.order_details).joinedload(OrderDetail.menu_item),
+        selectinload(Order.payments)
+    )
+
+
+def inventory_query(db, ingredient_id):
+    return db.query(Inventory).filter(
+        and_(Inventory.ingredient_id == ingredient_id, Inventory.is_deleted == False)
+    ).options(joinedload(Inventory.ingredient))
+
+
+def menu_item_query(db, item_id):
+    return db.query(MenuItem).filter(
+        and_(MenuItem.item_id == item_id, MenuItem.is_deleted == False)
+    ).options(joinedload(MenuItem.ingredients).joinedload(MenuItemIngredient.ingredient))
+
+
+def employee_query(db, emp_id):
+    return db.query(Employee).filter(Employee.emp_id == emp_id)
+
+
+# (name, per-call builder, prebuilt statement, parameter name, CLI option)
+LOOKUPS = [
+    ("OrderRepository.get", order_query, order_repository._ORDER_BY_ID, "order_id", "order_id"),
+    (
+        "InventoryRepository.get_by_ingredient",
+        inventory_query,
+        inventory_repository._INVENTORY_BY_INGREDIENT,
+        "ingredient_id",
+        "ingredient_id",
+    ),
+    ("MenuItemRepository.get", menu_item_query, menu_item_repository._MENU_ITEM_BY_ID, "item_id", "item_id"),
+    ("get_current_user", employee_query, auth._EMPLOYEE_BY_ID, "emp_id", "emp_id"),
+]
+
+
+def per_call_us(fn, iterations):
+    """Microseconds per call of fn, best of three runs"""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for i in range(iterations):
+            fn(i)
+        best = min(best, time.perf_counter() - start)
+    return best / iterations * 1_000_000
+
+
+def time_lookups(db, iterations, ids, cold_compile=False):
+    """Time both variants of every lookup through db.execute"""
+    dialect = postgresql.psycopg.dialect()
+    header = f"{'lookup':<40} {'before':>10} {'after':>10}"
+    print(header + (f" {'cold compile':>14}" if cold_compile else "") + "   (us per call)")
+    for name, build, prebuilt, param, option in LOOKUPS:
+        value = ids[option]
+        unique = prebuilt is menu_item_repository._MENU_ITEM_BY_ID
+
+        def run_after(i):
+            result = db.execute(prebuilt, {param: value})
+            (result.unique() if unique else result).scalars().first()
+            db.expunge_all()
+
+        def run_before(i):
+            build(db, value).first()
+            db.expunge_all()
+
+        before = per_call_us(run_before, iterations)
+        after = per_call_us(run_after, iterations)
+        line = f"{name:<40} {before:>10.1f} {after:>10.1f}"
+        if cold_compile:
+            compile_us = per_call_us(lambda i: prebuilt.compile(dialect=dialect), max(1, iterations // 100))
+            line += f" {compile_us:>14.1f}"
+        print(line)
+
+
+def offline(iterations, ids):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    try:
+        time_lookups(db, iterations, ids, cold_compile=True)
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def against_db(iterations, ids):
+    from app.core.database import SessionLocal, engine
+
+    db = SessionLocal()
+    try:
+        time_lookups(db, iterations, ids)
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--db", action="store_true", help="Execute against the configured database instead of SQLite")
+    parser.add_argument("--order-id", type=int, default=1)
+    parser.add_argument("--ingredient-id", type=int, default=1)
+    parser.add_argument("--item-id", type=int, default=1)
+    parser.add_argument("--emp-id", type=int, default=1)
+    args = parser.parse_args()
+
+    # DEBUG settings echo every statement, which would swamp the timings
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    if args.db:
+        against_db(args.iterations, vars(args))
+    else:
+        offline(args.iterations, vars(args))
+
+
+if __name__ == "__main__":
+    main()
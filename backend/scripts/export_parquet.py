@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Export orders, order_details, payments and inventory to Parquet
+
+Writes month-partitioned files under the output directory. Later runs only
+rewrite the months changed since the previous run, unless --full is given.
+
+Usage:
+    python scripts/export_parquet.py exports/parquet [--full]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal
+from app.jobs.parquet_export import BATCH_SIZE, export_parquet
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export sales data to Parquet")
+    parser.add_argument("out_dir", type=Path, help="Output directory")
+    parser.add_argument("--full", action="store_true", help="Rewrite every month, not only changed ones")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Rows per record batch")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        written = export_parquet(db, args.out_dir, full=args.full, batch_size=args.batch_size)
+    finally:
+        db.close()
+
+    for table, rows in written.items():
+        print(f"{table:<15} {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
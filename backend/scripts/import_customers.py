@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Bulk import customers from a CSV file
+
+The file is streamed in chunks: rows are validated, COPYed into a staging
+table and merged into customers, skipping existing phone numbers/emails.
+Rejected rows are written to the error report.
+
+Usage:
+    python scripts/import_customers.py customers.csv [--report import_errors.csv]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal
+from app.jobs.customer_import import CHUNK_SIZE, import_customers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import customers from CSV")
+    parser.add_argument("csv_file", type=Path, help="CSV with header name,phone,email[,loyalty_points]")
+    parser.add_argument("--report", type=Path, default=Path("import_errors.csv"), help="Error report output")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        with open(args.csv_file, encoding="utf-8-sig", newline="") as source, open(
+            args.report, "w", newline=""
+        ) as report:
+            summary = import_customers(db, source, report, chunk_size=args.chunk_size)
+    finally:
+        db.close()
+
+    print(
+        f"Inserted: {summary['inserted']}, duplicates: {summary['duplicates']}, "
+        f"invalid: {summary['invalid']}, complete: {summary['complete']}"
+    )
+    print(f"Error report: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Rebuild the customer_stats rollup from orders in one set-based pass
+
+Run after applying the migration that creates the table, or whenever the
+rollup needs to be reconciled with the orders table.
+
+Usage:
+    python scripts/rebuild_customer_stats.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal
+from app.repositories.customer_stats_repository import CustomerStatsRepository
+
+
+def main():
+    db = SessionLocal()
+    try:
+        count = CustomerStatsRepository(db).rebuild()
+        print(f"Rebuilt customer_stats for {count} customers")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
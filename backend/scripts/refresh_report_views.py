@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Refresh the materialized report views (item_sales_daily)
+
+The API refreshes them every REPORT_REFRESH_INTERVAL_SECONDS; run this from
+cron instead when that is disabled, or after a bulk load.
+
+Usage:
+    python scripts/refresh_report_views.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal
+from app.jobs.report_refresh import VIEWS, refresh_view
+
+
+def main():
+    db = SessionLocal()
+    try:
+        for view_name in VIEWS:
+            refreshed_at = refresh_view(db, view_name)
+            if refreshed_at is None:
+                print(f"{view_name}: skipped, a refresh is already running")
+            else:
+                print(f"{view_name}: refreshed at {refreshed_at:%Y-%m-%d %H:%M:%S %Z}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
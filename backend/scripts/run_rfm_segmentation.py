@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Recompute RFM (recency / frequency / monetary) customer segments
+
+Streams completed orders with a server-side cursor, scores every customer by
+population quintiles and bulk-upserts customer_segments.
+
+Usage:
+    python scripts/run_rfm_segmentation.py [--as-of YYYY-MM-DD]
+"""
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal
+from app.jobs.rfm_segmentation import run_rfm_segmentation
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute RFM customer segments")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="Reference date (default: today)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        summary = run_rfm_segmentation(db, as_of=args.as_of)
+    finally:
+        db.close()
+
+    for segment, count in sorted(summary.items(), key=lambda item: -item[1]):
+        print(f"{segment:<20} {count}")
+
+
+if __name__ == "__main__":
+    main()
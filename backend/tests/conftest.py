@@ -0,0 +1,39 @@
+"""
+Shared test setup
+
+Settings require database credentials at import time; the engines they
+configure are never connected to by these tests. Repository tests run on an
+in-memory SQLite database instead, so only portable queries are covered here.
+"""
+
+import os
+
+os.environ.setdefault("DB_USER", "test")
+os.environ.setdefault("DB_PASSWORD", "test")
+os.environ.setdefault("DB_NAME", "test")
+os.environ.setdefault("DEBUG", "false")
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.cache import _caches
+from app.models import Base
+
+
+@pytest.fixture
+def db():
+    """Session on a fresh in-memory SQLite database with every table"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+        for cache in _caches.values():
+            cache.clear()
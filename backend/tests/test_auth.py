@@ -0,0 +1,9 @@
+from app.api.auth import get_optional_user
+
+
+def test_optional_user_ignores_an_invalid_token(db):
+    assert get_optional_user(token=None, authorization="Bearer not-a-jwt", db=db) is None
+
+
+def test_optional_user_is_none_without_a_token(db):
+    assert get_optional_user(token=None, authorization=None, db=db) is None
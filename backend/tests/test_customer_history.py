@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from app.api.customers import get_customer, get_customer_orders
+from app.core.query_counter import max_queries
+from app.models.customer import Customer
+from app.models.order import Order
+from app.models.payment import Payment
+
+ORDERS = 250
+
+
+@pytest.fixture
+def regular(db):
+    """A customer with a long order history"""
+    customer = Customer(name="Regular")
+    db.add(customer)
+    db.flush()
+    customer_id = customer.customer_id
+    for n in range(ORDERS):
+        order = Order(
+            customer_id=customer_id,
+            order_date=date(2024, 1, 1) + timedelta(days=n),
+            total_amount=Decimal("10.00"),
+            status="completed",
+        )
+        order.payments.append(Payment(payment_method="cash", amount=Decimal("10.00")))
+        db.add(order)
+    db.commit()
+    db.expunge_all()
+    return customer_id
+
+
+@pytest.fixture
+def loaded_orders():
+    """Number of Order rows materialized while the test runs"""
+    loaded = []
+
+    def count(target, context):
+        loaded.append(target.order_id)
+
+    event.listen(Order, "load", count)
+    yield loaded
+    event.remove(Order, "load", count)
+
+
+def test_customer_lookup_loads_no_order_history(db, regular, loaded_orders):
+    with max_queries(1):
+        customer = get_customer(regular, db=db)
+
+    assert customer.customer_id == regular
+    assert loaded_orders == []
+
+
+def test_history_page_loads_one_page_of_orders(db, regular, loaded_orders):
+    with max_queries(4):  # customer, orders, details, payments
+        page = get_customer_orders(regular, cursor=None, limit=20, db=db)
+
+    assert len(page.items) == 20
+    assert len(loaded_orders) <= 21  # the page plus the look-ahead row
+    assert page.items[0].order_date == date(2024, 1, 1) + timedelta(days=ORDERS - 1)
+
+    db.expunge_all()
+    loaded_orders.clear()
+    with max_queries(3):  # the customer is cached now
+        next_page = get_customer_orders(regular, cursor=page.next_cursor, limit=20, db=db)
+
+    assert len(loaded_orders) <= 21
+    assert next_page.items[0].order_date == page.items[-1].order_date - timedelta(days=1)
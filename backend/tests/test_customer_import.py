@@ -0,0 +1,40 @@
+import codecs
+import csv
+import io
+
+import pytest
+from fastapi import UploadFile
+
+from app.api.customers import import_customers_csv
+from app.jobs.customer_import import import_customers
+
+
+def _decoded(*lines: bytes):
+    return codecs.iterdecode(iter(lines), "utf-8-sig")
+
+
+def test_undecodable_line_stops_the_import_and_is_reported():
+    report = io.StringIO()
+    summary = import_customers(
+        None, _decoded(b"name,phone\n", b",0811111111\n", b"\xff\xfe,0822222222\n", b"Bob,0833333333\n"), report
+    )
+
+    assert summary == {"inserted": 0, "duplicates": 0, "invalid": 2, "complete": False}
+    rows = list(csv.reader(io.StringIO(report.getvalue())))
+    assert [row[0] for row in rows[1:]] == ["2", "3"]
+    assert "import stopped" in rows[2][1]
+
+
+def test_undecodable_header_is_raised():
+    with pytest.raises(UnicodeDecodeError):
+        import_customers(None, _decoded(b"\xffname,phone\n"), io.StringIO())
+
+
+@pytest.mark.parametrize("content", [b"", b"phone,email\n0811111111,a@example.com\n"])
+def test_upload_without_name_header_returns_the_report(content):
+    response = import_customers_csv(file=UploadFile(io.BytesIO(content), filename="customers.csv"), db=None)
+
+    assert response.status_code == 200
+    assert response.headers["x-import-inserted"] == "0"
+    assert response.headers["x-import-invalid"] == "1"
+    assert response.headers["x-import-complete"] == "true"
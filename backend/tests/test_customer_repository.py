@@ -0,0 +1,56 @@
+from app.core.cache import TTLCache
+from app.models.customer import Customer
+from app.repositories.customer_repository import CustomerRepository, _lookup_cache
+from app.schemas.customer import CustomerResponse
+
+
+def test_set_drops_value_computed_before_an_eviction():
+    cache = TTLCache("test_generation", maxsize=8)
+    generation = cache.generation
+    cache.evict(["id:1"])  # invalidation lands while the value is computed
+
+    assert cache.set("id:1", "stale", generation=generation) is False
+    assert cache.get("id:1") is None
+    assert cache.set("id:1", "fresh", generation=cache.generation) is True
+    assert cache.get("id:1") == "fresh"
+
+
+def test_lookup_returns_response_and_caches_it(db):
+    db.add(Customer(name="Ann", phone="0812345678", email="ann@example.com"))
+    db.commit()
+    repo = CustomerRepository(db)
+
+    customer = repo.get(1)
+    assert isinstance(customer, CustomerResponse)
+    assert customer.name == "Ann"
+    assert repo.get_by_phone("0812345678") is customer
+    assert repo.get_by_email("ANN@example.com") is customer
+
+
+def test_lookup_is_not_cached_across_a_concurrent_invalidation(db):
+    db.add(Customer(name="Ann"))
+    db.commit()
+    repo = CustomerRepository(db)
+
+    class EvictingQuery:
+        """Query whose read races with an invalidation of the same row"""
+
+        def __init__(self, query):
+            self.query = query
+
+        def first(self):
+            row = self.query.first()
+            _lookup_cache.evict(["id:1"])
+            return row
+
+    repo._cached_lookup("id:1", EvictingQuery(db.query(Customer)))
+    assert _lookup_cache.get("id:1") is None
+
+
+def test_replica_reads_are_not_cached(db):
+    db.add(Customer(name="Ann"))
+    db.commit()
+    db.info["replica"] = True
+
+    assert CustomerRepository(db).get(1).name == "Ann"
+    assert _lookup_cache.get("id:1") is None
@@ -0,0 +1,29 @@
+import asyncio
+
+from app.repositories.menu_item_repository import AsyncMenuItemRepository, _grouped_menu_cache
+
+
+class FakeAsyncSession:
+    """Returns one category row for any statement"""
+
+    def __init__(self, replica: bool):
+        self.info = {"replica": replica}
+
+    async def execute(self, statement):
+        return FakeResult()
+
+
+class FakeResult:
+    def mappings(self):
+        return [{"category": "Coffee", "item_count": 1, "items": []}]
+
+
+def test_grouped_menu_from_replica_is_not_cached():
+    _grouped_menu_cache.clear()
+    repo = AsyncMenuItemRepository(FakeAsyncSession(replica=True))
+    assert asyncio.run(repo.get_grouped_by_category())[0]["category"] == "Coffee"
+    assert _grouped_menu_cache.keys() == []
+
+    asyncio.run(AsyncMenuItemRepository(FakeAsyncSession(replica=False)).get_grouped_by_category())
+    assert len(_grouped_menu_cache.keys()) == 1
+    _grouped_menu_cache.clear()
@@ -0,0 +1,34 @@
+import csv
+import io
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from app.jobs.order_export import encode
+
+ORDER = {
+    "order_id": 1,
+    "order_date": date(2026, 1, 2),
+    "status": "completed",
+    "customer_id": None,
+    "total_amount": Decimal("7.50"),
+    "created_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "items": [{"item_id": 3, "name": "Latte", "quantity": 1, "unit_price": "7.50", "subtotal": "7.50"}],
+    "payments": [{"payment_id": 1, "payment_method": "cash", "amount": "7.50", "status": "completed"}],
+}
+
+
+def test_ndjson_writes_iso_dates_and_exact_amounts():
+    line = json.loads(b"".join(encode([ORDER], "ndjson")))
+
+    assert line["order_date"] == "2026-01-02"
+    assert line["created_at"] == "2026-01-02T03:04:05+00:00"
+    assert line["total_amount"] == "7.50"
+
+
+def test_csv_and_ndjson_agree_on_dates_and_amounts():
+    row = list(csv.DictReader(io.StringIO(b"".join(encode([ORDER], "csv")).decode())))[0]
+    line = json.loads(b"".join(encode([ORDER], "ndjson")))
+
+    assert row["order_date"] == line["order_date"]
+    assert row["total_amount"] == line["total_amount"]
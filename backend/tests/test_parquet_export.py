@@ -0,0 +1,98 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pyarrow.parquet as pq
+
+from app.jobs import parquet_export
+
+
+class FakeExportDB:
+    """Answers the export's queries from an in-memory list of orders"""
+
+    def __init__(self):
+        self.orders = {}  # order_id -> order_date
+        self.changed = set()
+
+    def move(self, order_id, order_date):
+        self.orders[order_id] = order_date
+        self.changed.add(order_id)
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        if statement is parquet_export._WATERMARK:
+            return _Result([(datetime.now(timezone.utc),)])
+        if statement is parquet_export._ALL_MONTHS:
+            return _Result(sorted({(d.replace(day=1),) for d in self.orders.values()}))
+        if statement is parquet_export._CHANGED_ORDERS:
+            rows = [(i, self.orders[i].replace(day=1)) for i in sorted(self.changed)]
+            self.changed = set()
+            return _Result(rows)
+        tables = {str(sql): name for name, (sql, _) in parquet_export.PARTITIONED_TABLES.items()}
+        table = tables.get(sql)
+        if table is None:
+            return _Result([])  # inventory
+        in_month = sorted(
+            (i, d) for i, d in self.orders.items() if params["start_date"] <= d < params["end_date"]
+        )
+        if table == "orders":
+            now = datetime.now(timezone.utc)
+            return _Result([(i, None, d, Decimal("5.00"), "completed", now, now) for i, d in in_month])
+        if table == "order_details":
+            return _Result([(i, 1, 1, Decimal("5.00"), Decimal("5.00")) for i, _ in in_month])
+        return _Result([(i, i, "cash", Decimal("5.00"), "completed", None) for i, _ in in_month])
+
+    def rollback(self):
+        pass
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalar(self):
+        return self.rows[0][0]
+
+    def scalars(self):
+        return [row[0] for row in self.rows]
+
+    def all(self):
+        return self.rows
+
+    def partitions(self):
+        if self.rows:
+            yield self.rows
+
+
+def _exported_ids(out_dir, table):
+    return {
+        path.parent.name: sorted(pq.read_table(path, columns=["order_id"]).column("order_id").to_pylist())
+        for path in sorted((out_dir / table).glob("month=*/part.parquet"))
+    }
+
+
+def test_order_moved_across_months_leaves_no_stale_rows(tmp_path):
+    db = FakeExportDB()
+    db.orders = {1: date(2024, 1, 15), 2: date(2024, 1, 20), 3: date(2024, 2, 3)}
+    parquet_export.export_parquet(db, tmp_path, full=True)
+
+    db.move(1, date(2024, 2, 10))
+    parquet_export.export_parquet(db, tmp_path)
+    for table in parquet_export.PARTITIONED_TABLES:
+        assert _exported_ids(tmp_path, table) == {"month=2024-01": [2], "month=2024-02": [1, 3]}
+
+    db.move(2, date(2024, 3, 1))  # January is left empty
+    parquet_export.export_parquet(db, tmp_path)
+    for table in parquet_export.PARTITIONED_TABLES:
+        assert _exported_ids(tmp_path, table) == {"month=2024-02": [1, 3], "month=2024-03": [2]}
+
+
+def test_full_export_removes_months_without_orders(tmp_path):
+    stale = tmp_path / "orders" / "month=2023-12"
+    stale.mkdir(parents=True)
+    (stale / "part.parquet").write_bytes(b"")
+
+    db = FakeExportDB()
+    db.orders = {1: date(2024, 1, 15)}
+    parquet_export.export_parquet(db, tmp_path, full=True)
+
+    assert not stale.exists()
@@ -0,0 +1,47 @@
+from datetime import date
+from decimal import Decimal
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.api.customers import get_customers
+from app.core.query_counter import max_queries
+from app.models.customer import Customer
+from app.models.customer_segment import CustomerSegment
+from app.models.customer_stats import CustomerStats
+from app.schemas.customer import CustomerListResponse
+
+CUSTOMERS = 30
+
+
+@pytest.fixture
+def customers(db):
+    for n in range(1, CUSTOMERS + 1):
+        db.add(Customer(customer_id=n, name=f"Customer {n}"))
+        db.add(CustomerStats(customer_id=n, visit_count=n, lifetime_spend=Decimal(n)))
+        if n % 2:
+            db.add(CustomerSegment(
+                customer_id=n, recency_days=n, frequency=n, monetary=Decimal(n),
+                r_score=3, f_score=3, m_score=3, segment="Loyal",
+            ))
+    db.commit()
+    db.expunge_all()
+
+
+def test_customer_list_is_one_query_however_many_rows(db, customers):
+    adapter = TypeAdapter(List[CustomerListResponse])
+    with max_queries(1):
+        rows = get_customers(skip=0, limit=100, sort_by=None, order="desc", segment=None, db=db)
+        # Serializing inside the block catches lazy loads of stats or segment
+        body = adapter.dump_python(adapter.validate_python(rows))
+
+    assert len(body) == CUSTOMERS
+    assert sum(1 for row in body if row["segment"]) == CUSTOMERS // 2
+
+
+def test_max_queries_reports_repeated_statements(db, customers):
+    with pytest.raises(AssertionError, match="repeated"):
+        with max_queries(2):
+            for n in range(1, 6):
+                db.get(Customer, n)
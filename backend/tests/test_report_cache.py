@@ -0,0 +1,21 @@
+from datetime import date
+
+from app.core import report_cache
+
+
+def test_history_result_computed_across_an_invalidation_is_not_cached():
+    calls = []
+
+    def compute(start, end):
+        calls.append((start, end))
+        if len(calls) == 1:
+            report_cache._evict(["sales"])  # a back-dated write commits mid-query
+        return len(calls)
+
+    args = ("sales", date(2024, 1, 1), date(2024, 1, 31), compute, None)
+    today = date(2024, 6, 1)
+
+    assert report_cache.cached_range(*args, today=today) == 1
+    assert report_cache.cached_range(*args, today=today) == 2
+    assert report_cache.cached_range(*args, today=today) == 2
+    report_cache._history.clear()
@@ -0,0 +1,33 @@
+import numpy as np
+
+from app.jobs.rfm_segmentation import assign_segments, quintile_scores
+
+
+def test_quintile_scores_spread_distinct_values():
+    scores = quintile_scores(np.arange(1, 101))
+    assert np.bincount(scores, minlength=6)[1:].tolist() == [20, 20, 20, 20, 20]
+    assert scores[0] == 1 and scores[-1] == 5
+
+
+def test_quintile_scores_keep_ties_together_in_their_middle_quintile():
+    frequency = np.array([1] * 85 + [2] * 10 + [5] * 5)
+    scores = quintile_scores(frequency)
+
+    assert set(scores[:85]) == {3}
+    assert set(scores[85:]) == {5}
+    # Higher values never score lower
+    assert all(np.diff(scores[np.argsort(frequency, kind="stable")]) >= 0)
+
+
+def test_quintile_scores_single_value():
+    assert quintile_scores(np.array([7, 7, 7])).tolist() == [3, 3, 3]
+
+
+def test_segments_with_two_recency_groups_are_not_all_at_risk_or_loyal():
+    recency = np.array([3] * 60 + [40] * 40)
+    frequency = np.array([1] * 85 + [2] * 10 + [5] * 5)
+    r_scores = 6 - quintile_scores(recency)
+    f_scores = quintile_scores(frequency)
+
+    segments = set(assign_segments(r_scores, f_scores).tolist())
+    assert not segments <= {"At Risk", "Loyal"}
@@ -11,6 +11,7 @@ import {
 } from "lucide-react";
 import OrderCard from "@/components/orders/OrderCard";
 import { useOrdersByStatus, useUpdateOrderStatus } from "@/lib/hooks/useOrders";
+import { OrderStatus } from "@/types";
 import { ProtectedRoute } from "@/components/auth/ProtectedRoute";
 import { useMenuItems } from "@/lib/hooks/useMenuItems";
 import { useLowStockInventory } from "@/lib/hooks/useInventory";
@@ -22,8 +23,11 @@ import Pagination from "@/components/common/Pagination";
 const ITEMS_PER_PAGE = 12;
 
 function BaristaPageContent() {
-  const { orders: pendingOrders, isLoading: isLoadingPending } =
+  const { orders: queuedOrders, isLoading: isLoadingQueued } =
     useOrdersByStatus("pending");
+  const { orders: inProgressOrders, isLoading: isLoadingInProgress } =
+    useOrdersByStatus("in_progress");
+  const isLoadingPending = isLoadingQueued || isLoadingInProgress;
   const { orders: completedOrders, isLoading: isLoadingCompleted } =
     useOrdersByStatus("completed");
   const { updateStatus } = useUpdateOrderStatus();
@@ -50,7 +54,7 @@ function BaristaPageContent() {
 
   // Sort orders by creation time (oldest first) and calculate wait time
   const sortedPendingOrders = useMemo(() => {
-    return [...pendingOrders]
+    return [...inProgressOrders, ...queuedOrders]
       .map((order) => {
         const createdTime = new Date(order.created_at).getTime();
         const waitTime = Math.floor((currentTime.getTime() - createdTime) / 1000);
@@ -61,7 +65,7 @@ function BaristaPageContent() {
         if (a.waitTime <= 300 && b.waitTime > 300) return 1;
         return a.waitTime - b.waitTime;
       });
-  }, [pendingOrders, currentTime]);
+  }, [inProgressOrders, queuedOrders, currentTime]);
 
   // Sort completed orders (newest first)
   const sortedCompletedOrders = useMemo(() => {
@@ -93,7 +97,7 @@ function BaristaPageContent() {
   const handleUpdateStatus = useCallback(
     async (
       orderId: number,
-      newStatus: "pending" | "completed" | "cancelled"
+      newStatus: OrderStatus
     ): Promise<void> => {
       try {
         await updateStatus(orderId, newStatus);
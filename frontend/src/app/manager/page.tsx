@@ -11,17 +11,13 @@ import {
 } from "lucide-react";
 import { useOrders } from "@/lib/hooks/useOrders";
 import { useLowStockInventory } from "@/lib/hooks/useInventory";
-import { useEmployees } from "@/lib/hooks/useEmployees";
-import { useMenuItems } from "@/lib/hooks/useMenuItems";
-import { useAllCustomers } from "@/lib/hooks/useCustomers";
+import { useDashboardStats } from "@/lib/hooks/useReports";
 import { ProtectedRoute } from "@/components/auth/ProtectedRoute";
 
 function ManagerPageContent() {
   const { orders } = useOrders();
   const { lowStockItems } = useLowStockInventory();
-  const { employees } = useEmployees();
-  const { menuItems } = useMenuItems();
-  const { customers } = useAllCustomers(); // Get all customers for stats
+  const { dashboard } = useDashboardStats(); // KPIs aggregated server-side
 
   // Format date and time
   const formatDateTime = (dateString: string): { date: string; time: string } => {
@@ -38,80 +34,21 @@ function ManagerPageContent() {
     return { date: dateStr, time: timeStr };
   };
 
-  const stats = useMemo(() => {
-    const today = new Date().toISOString().split("T")[0];
-    const yesterday = new Date(Date.now() - 86400000)
-      .toISOString()
-      .split("T")[0];
-
-    const todayOrders = orders.filter((o) => o.order_date === today);
-    const yesterdayOrders = orders.filter((o) => o.order_date === yesterday);
-
-    const todayRevenue = todayOrders.reduce(
-      (sum, o) => sum + Number(o.payment_amount || o.total_amount),
-      0
-    );
-    const yesterdayRevenue = yesterdayOrders.reduce(
-      (sum, o) => sum + Number(o.payment_amount || o.total_amount),
-      0
-    );
-
-    const revenueChange =
-      yesterdayRevenue > 0
-        ? (
-            ((todayRevenue - yesterdayRevenue) / yesterdayRevenue) *
-            100
-          ).toFixed(1)
-        : "0";
-
-    const pendingOrders = orders.filter((o) => o.status === "pending").length;
-    const completedOrders = orders.filter(
-      (o) => o.status === "completed"
-    ).length;
-    const cancelledOrders = orders.filter(
-      (o) => o.status === "cancelled"
-    ).length;
-
-    const totalRevenue = orders
-      .filter((o) => o.status === "completed")
-      .reduce((sum, o) => sum + Number(o.payment_amount || o.total_amount), 0);
-
-    const avgOrderValue =
-      completedOrders > 0 ? totalRevenue / completedOrders : 0;
-
-    const availableMenuItems = menuItems.filter((m) => m.is_available).length;
-    const unavailableMenuItems = menuItems.length - availableMenuItems;
-
-    const totalLoyaltyPoints = customers.reduce(
-      (sum, c) => sum + (c.loyalty_points || 0),
-      0
-    );
-
-    const topCustomers = [...customers]
-      .sort((a, b) => (b.loyalty_points || 0) - (a.loyalty_points || 0))
-      .slice(0, 3);
-
-    return {
-      todayRevenue,
-      yesterdayRevenue,
-      revenueChange: parseFloat(revenueChange),
-      todayOrders: todayOrders.length,
-      yesterdayOrders: yesterdayOrders.length,
-      pendingOrders,
-      completedOrders,
-      cancelledOrders,
-      totalRevenue,
-      avgOrderValue,
-      totalEmployees: employees.length,
-      totalMenuItems: menuItems.length,
-      availableMenuItems,
-      unavailableMenuItems,
-      lowStockCount: lowStockItems.length,
-      totalCustomers: customers.length,
-      totalLoyaltyPoints,
-      topCustomers,
-    };
-  }, [orders, employees, menuItems, lowStockItems, customers]);
+  const stats = useMemo(
+    () => ({
+      todayRevenue: Number(dashboard?.today_revenue ?? 0),
+      revenueChange: dashboard?.revenue_change_pct ?? 0,
+      todayOrders: dashboard?.today_orders ?? 0,
+      pendingOrders: dashboard?.pending_orders ?? 0,
+      completedOrders: dashboard?.completed_orders ?? 0,
+      totalEmployees: dashboard?.total_employees ?? 0,
+      totalMenuItems: dashboard?.total_menu_items ?? 0,
+      availableMenuItems: dashboard?.available_menu_items ?? 0,
+      lowStockCount: dashboard?.low_stock_count ?? 0,
+      topCustomers: dashboard?.top_customers ?? [],
+    }),
+    [dashboard]
+  );
 
   return (
     <div className="flex h-screen bg-stone-50 lg:pl-0 overflow-hidden">
@@ -300,7 +237,7 @@ function ManagerPageContent() {
                         </div>
                       </div>
                       <p className="font-semibold text-stone-700">
-                        {customer.loyalty_points || 0} pts
+                        {Number(customer.loyalty_points || 0)} pts
                       </p>
                     </div>
                   ))
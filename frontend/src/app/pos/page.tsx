@@ -222,9 +222,6 @@ function POSPageContent() {
         throw new Error("Failed to get current date");
       }
 
-      // Calculate net loyalty points (points to add - points redeemed)
-      const netPointsToAdd = loyaltyPointsToAdd - pointsToRedeem;
-
       const orderData: OrderCreate = {
         customer_id:
           isMember && selectedCustomer
@@ -239,38 +236,24 @@ function POSPageContent() {
         })),
         payment_method: "cash",
         payment_amount: finalTotal, // Use final total after discount
+        // Redeemed atomically with the order; earned points accrue on completion
+        loyalty_points_redeemed:
+          isMember && selectedCustomer && pointsToRedeem > 0
+            ? pointsToRedeem
+            : undefined,
       };
 
       await createOrder(orderData);
 
-      // Update loyalty points: deduct redeemed points and add new points
       if (isMember && selectedCustomer) {
-        try {
-          // Net points change (can be positive or negative)
-          await customersApi.updateLoyaltyPoints(
-            selectedCustomer.customer_id,
-            netPointsToAdd
+        if (pointsToRedeem > 0) {
+          showToast.success(
+            `Redeemed ${pointsToRedeem} points (฿${discountAmount.toFixed(2)} discount).`
+          );
+        } else if (loyaltyPointsToAdd > 0) {
+          showToast.success(
+            `${selectedCustomer.name} will earn ${loyaltyPointsToAdd} loyalty points when the order is completed`
           );
-
-          if (pointsToRedeem > 0) {
-            showToast.success(
-              `Redeemed ${pointsToRedeem} points (฿${discountAmount.toFixed(
-                2
-              )} discount). ` +
-                (netPointsToAdd > 0
-                  ? `Added ${netPointsToAdd} new points.`
-                  : netPointsToAdd < 0
-                  ? `Net: ${netPointsToAdd} points.`
-                  : "")
-            );
-          } else if (loyaltyPointsToAdd > 0) {
-            showToast.success(
-              `Added ${loyaltyPointsToAdd} loyalty points to ${selectedCustomer.name}`
-            );
-          }
-        } catch (pointsError) {
-          console.error("Failed to update loyalty points:", pointsError);
-          // Don't fail the order if points update fails
         }
       }
 
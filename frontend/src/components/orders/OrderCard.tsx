@@ -2,7 +2,7 @@
 
 import React, { memo, useCallback, useMemo, useState, useEffect } from "react";
 import { Clock, CheckCircle2, ChefHat, AlertTriangle, Zap } from "lucide-react";
-import { Order, MenuItem } from "@/types";
+import { Order, OrderStatus, MenuItem } from "@/types";
 import RecipeView from "./RecipeView";
 import { useOrderAvailability } from "@/lib/hooks/useStock";
 
@@ -10,7 +10,7 @@ interface OrderCardProps {
   order: Order & { waitTime?: number };
   updateStatus: (
     orderId: number,
-    status: "pending" | "completed" | "cancelled"
+    status: OrderStatus
   ) => Promise<void>;
   menuItems?: MenuItem[]; // Optional menu items for displaying names
 }
@@ -33,9 +33,9 @@ const OrderCard: React.FC<OrderCardProps> = memo(
       order.status === 'pending' ? order.order_id : null
     );
 
-    // Calculate wait time (only for pending orders)
+    // Calculate wait time (only for orders still in the queue)
     const waitTime = useMemo(() => {
-      if (order.status !== 'pending') return undefined;
+      if (order.status !== 'pending' && order.status !== 'in_progress') return undefined;
       if (order.waitTime !== undefined) return order.waitTime;
       const createdTime = new Date(order.created_at).getTime();
       return Math.floor((currentTime.getTime() - createdTime) / 1000);
@@ -75,6 +75,8 @@ const OrderCard: React.FC<OrderCardProps> = memo(
       switch (status) {
         case "pending":
           return "bg-amber-100 text-amber-800 border-amber-200";
+        case "in_progress":
+          return "bg-blue-100 text-blue-800 border-blue-200";
         case "completed":
           return "bg-green-100 text-green-800 border-green-200";
         case "cancelled":
@@ -87,6 +89,12 @@ const OrderCard: React.FC<OrderCardProps> = memo(
     const getNextAction = useCallback((status: string) => {
       switch (status) {
         case "pending":
+          return {
+            label: "Start Making",
+            next: "in_progress" as const,
+            color: "bg-blue-600 hover:bg-blue-700",
+          };
+        case "in_progress":
           return {
             label: "Mark as Completed",
             next: "completed" as const,
@@ -145,8 +153,8 @@ const OrderCard: React.FC<OrderCardProps> = memo(
             )}
           </div>
           
-          {/* Wait Time Timer - Only for pending orders */}
-          {order.status === 'pending' && waitTime !== undefined && (
+          {/* Wait Time Timer - Only for queued orders */}
+          {waitTime !== undefined && (
             <div className={`flex items-center gap-1.5 mt-2 ${
               isUrgent ? 'text-red-700' : 'text-stone-600'
             }`}>
@@ -266,9 +274,9 @@ const OrderCard: React.FC<OrderCardProps> = memo(
               >
                 {orderAvailability && !orderAvailability.can_fulfill
                   ? "Stock Insufficient"
-                  : isUrgent
+                  : isUrgent && action.next === "completed"
                   ? "Complete Urgent"
-                  : "Mark as Completed"}
+                  : action.label}
               </button>
             )}
           </div>
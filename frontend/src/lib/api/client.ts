@@ -54,6 +54,26 @@ apiClient.interceptors.request.use(
   }
 );
 
+// Read-your-writes: after a write the API returns X-DB-Primary-Until; echo it
+// until it passes so our reads are not served by a lagging read replica
+const PRIMARY_UNTIL_HEADER = 'x-db-primary-until';
+let primaryUntil = 0;
+
+apiClient.interceptors.request.use((config) => {
+  if (primaryUntil > Date.now() / 1000) {
+    config.headers[PRIMARY_UNTIL_HEADER] = String(primaryUntil);
+  }
+  return config;
+});
+
+apiClient.interceptors.response.use((response) => {
+  const value = Number(response.headers[PRIMARY_UNTIL_HEADER]);
+  if (value > primaryUntil) {
+    primaryUntil = value;
+  }
+  return response;
+});
+
 // Response interceptor for error handling
 apiClient.interceptors.response.use(
   (response) => response,
@@ -1,5 +1,14 @@
 import apiClient from './client';
 
+export interface CustomerStats {
+  customer_id: number;
+  visit_count: number;
+  completed_count: number;
+  lifetime_spend: number;
+  average_ticket: number;
+  last_visit_date?: string;
+}
+
 export interface Customer {
   customer_id: number;
   name: string;
@@ -9,6 +18,7 @@ export interface Customer {
   created_at: string;
   updated_at: string;
   is_deleted: boolean;
+  stats?: CustomerStats | null;
 }
 
 export interface CustomerCreate {
@@ -38,9 +48,14 @@ const customersApi = {
     return data;
   },
 
+  getStats: async (id: number): Promise<CustomerStats> => {
+    const { data } = await apiClient.get<CustomerStats>(`/customers/${id}/stats`);
+    return data;
+  },
+
   search: async (query: string): Promise<Customer[]> => {
     const { data } = await apiClient.get<Customer[]>('/customers/search/query', {
-      params: { q: query, limit: 1000 },
+      params: { q: query, limit: 50 },
     });
     return data;
   },
@@ -1,5 +1,5 @@
 import apiClient from './client';
-import { MenuItem } from '@/types';
+import { MenuItem, MenuCategory } from '@/types';
 
 export interface MenuItemCreate {
   name: string;
@@ -39,6 +39,13 @@ const menuItemsApi = {
     return data;
   },
 
+  getGroupedByCategory: async (availableOnly: boolean = true): Promise<MenuCategory[]> => {
+    const { data } = await apiClient.get<MenuCategory[]>('/menu-items/by-category', {
+      params: { available_only: availableOnly },
+    });
+    return data;
+  },
+
   create: async (menuItem: MenuItemCreate): Promise<MenuItem> => {
     const { data } = await apiClient.post<MenuItem>('/menu-items', menuItem);
     return data;
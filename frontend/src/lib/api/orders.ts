@@ -1,5 +1,5 @@
 import apiClient from './client';
-import { Order, OrderCreate } from '@/types';
+import { Order, OrderCreate, OrderStatus } from '@/types';
 
 const ordersApi = {
   create: async (order: OrderCreate): Promise<Order> => {
@@ -19,14 +19,14 @@ const ordersApi = {
     return data;
   },
 
-  getByStatus: async (status: 'pending' | 'completed' | 'cancelled'): Promise<Order[]> => {
+  getByStatus: async (status: OrderStatus): Promise<Order[]> => {
     const { data } = await apiClient.get<Order[]>(`/orders/status/${status}`, {
       params: { limit: 1000 },
     });
     return data;
   },
 
-  updateStatus: async (id: number, status: 'pending' | 'completed' | 'cancelled'): Promise<Order> => {
+  updateStatus: async (id: number, status: OrderStatus): Promise<Order> => {
     const { data } = await apiClient.patch<Order>(`/orders/${id}/status`, null, {
       params: { status },
     });
@@ -0,0 +1,41 @@
+import apiClient from './client';
+
+export interface TopCustomer {
+  customer_id: number;
+  name: string;
+  phone?: string;
+  email?: string;
+  loyalty_points: number;
+}
+
+export interface DashboardStats {
+  as_of: string;
+  today_revenue: number;
+  yesterday_revenue: number;
+  revenue_change_pct: number;
+  today_orders: number;
+  yesterday_orders: number;
+  pending_orders: number;
+  completed_orders: number;
+  cancelled_orders: number;
+  completed_revenue: number;
+  avg_order_value: number;
+  total_employees: number;
+  total_menu_items: number;
+  available_menu_items: number;
+  low_stock_count: number;
+  total_customers: number;
+  total_loyalty_points: number;
+  top_customers: TopCustomer[];
+}
+
+const reportsApi = {
+  getDashboard: async (asOf?: string): Promise<DashboardStats> => {
+    const { data } = await apiClient.get<DashboardStats>('/reports/dashboard', {
+      params: asOf ? { as_of: asOf } : undefined,
+    });
+    return data;
+  },
+};
+
+export { reportsApi };
@@ -1,7 +1,7 @@
 import useSWR from 'swr';
 import { useCallback } from 'react';
 import { ordersApi } from '@/lib/api/orders';
-import { Order } from '@/types';
+import { Order, OrderStatus } from '@/types';
 import { mutate } from 'swr';
 import { showToast } from '@/utils/toast';
 
@@ -24,7 +24,7 @@ export const useOrders = () => {
   };
 };
 
-export const useOrdersByStatus = (status: 'pending' | 'completed' | 'cancelled') => {
+export const useOrdersByStatus = (status: OrderStatus) => {
   const { data, error, isLoading } = useSWR<Order[]>(
     status ? ['orders', 'status', status] : null,
     () => ordersApi.getByStatus(status),
@@ -69,7 +69,7 @@ export const useCreateOrder = () => {
 export const useUpdateOrderStatus = () => {
   const updateStatus = useCallback(async (
     orderId: number,
-    status: 'pending' | 'completed' | 'cancelled'
+    status: OrderStatus
   ): Promise<Order> => {
     try {
       const updatedOrder = await showToast.promise(
@@ -87,9 +87,8 @@ export const useUpdateOrderStatus = () => {
           order.order_id === orderId ? updatedOrder : order
         );
       }, false);
-      // Also update status-specific cache
-      mutate(['orders', 'status', status]);
-      mutate(['orders', 'status', updatedOrder.status]);
+      // Also update status-specific caches (the order leaves its previous list)
+      mutate((key) => Array.isArray(key) && key[0] === 'orders' && key[1] === 'status');
       // Revalidate
       mutate('orders');
       return updatedOrder;
@@ -0,0 +1,20 @@
+import useSWR from 'swr';
+import { reportsApi, DashboardStats } from '@/lib/api/reports';
+
+export const useDashboardStats = () => {
+  const { data, error, isLoading, mutate } = useSWR<DashboardStats>(
+    'reports-dashboard',
+    () => reportsApi.getDashboard(),
+    {
+      revalidateOnFocus: true,
+      refreshInterval: 15000, // Matches the server-side cache TTL
+    }
+  );
+
+  return {
+    dashboard: data,
+    isLoading,
+    isError: error,
+    mutate,
+  };
+};
@@ -13,6 +13,12 @@ export interface MenuItem {
   is_deleted: boolean;
 }
 
+export interface MenuCategory {
+  category: string;
+  item_count: number;
+  items: MenuItem[];
+}
+
 export interface OrderDetail {
   order_id: number;
   item_id: number;
@@ -24,13 +30,15 @@ export interface OrderDetail {
   is_deleted: boolean;
 }
 
+export type OrderStatus = 'pending' | 'in_progress' | 'completed' | 'cancelled';
+
 export interface Order {
   order_id: number;
   customer_id?: number;
   order_date: string;
   total_amount: number;
   payment_amount?: number; // Actual amount paid after discount
-  status: 'pending' | 'completed' | 'cancelled';
+  status: OrderStatus;
   created_at: string;
   updated_at: string;
   is_deleted: boolean;
@@ -48,6 +56,7 @@ export interface OrderCreate {
   }[];
   payment_method: string;
   payment_amount: number;
+  loyalty_points_redeemed?: number;
 }
 
 export interface CartItem {